@@ -1,10 +1,17 @@
 """Pydantic models for API request/response validation."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
+# Validated configs are treated as immutable values; unknown keys from the
+# client are dropped rather than rejected.
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class EngineGeometryParams(BaseModel):
+    model_config = _MODEL_CONFIG
+
     chamber_diameter: float = Field(0.08, ge=0.02, le=0.30)
     chamber_length: float = Field(0.12, ge=0.03, le=0.50)
     throat_diameter: float = Field(0.03, ge=0.008, le=0.15)
@@ -25,6 +32,8 @@ class EngineGeometryParams(BaseModel):
 
 
 class CoolingConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     enabled: bool = True
     coolant_type: str = "rp1"
     n_channels: int = Field(60, ge=10, le=200)
@@ -42,6 +51,8 @@ class CoolingConfig(BaseModel):
 
 
 class InjectorConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     enabled: bool = False
     n_rings: int = Field(3, ge=1, le=10)
     elements_per_ring_base: int = Field(6, ge=3, le=24)
@@ -55,6 +66,8 @@ class InjectorConfig(BaseModel):
 
 
 class PropellantConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     gamma: float = Field(1.25, ge=1.1, le=1.7)
     molecular_weight: float = Field(0.022, ge=0.002, le=0.044)
     chamber_temperature_K: float = Field(3400.0, ge=500.0, le=5000.0)
@@ -62,6 +75,8 @@ class PropellantConfig(BaseModel):
 
 
 class SimulationConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     geometry: EngineGeometryParams = Field(default_factory=EngineGeometryParams)
     propellant: PropellantConfig = Field(default_factory=PropellantConfig)
     cooling: CoolingConfig = Field(default_factory=CoolingConfig)
@@ -71,6 +86,8 @@ class SimulationConfig(BaseModel):
 
 
 class GAConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     population_size: int = Field(50, ge=10, le=500)
     num_generations: int = Field(100, ge=5, le=1000)
     crossover_prob: float = Field(0.7, ge=0.0, le=1.0)
@@ -93,6 +110,8 @@ class GAConfig(BaseModel):
 
 
 class UpdateParams(BaseModel):
+    model_config = _MODEL_CONFIG
+
     geometry: Optional[EngineGeometryParams] = None
     propellant: Optional[PropellantConfig] = None
     cooling: Optional[CoolingConfig] = None
@@ -102,6 +121,8 @@ class UpdateParams(BaseModel):
 
 
 class STLExportRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     geometry: EngineGeometryParams = Field(default_factory=EngineGeometryParams)
     cooling: Optional[CoolingConfig] = None
     injector: Optional[InjectorConfig] = None
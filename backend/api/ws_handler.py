@@ -1,30 +1,28 @@
 """WebSocket connection handler and message router."""
 
-import json
 import asyncio
+import hashlib
+import logging
+import os
 import traceback
+from typing import TYPE_CHECKING
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from backend.config import SIM_TICK_INTERVAL, SIM_TICK_BATCH_MAX
 from backend.api.schemas import SimulationConfig, GAConfig, UpdateParams, CoolingConfig, InjectorConfig
-from backend.geometry.parametric_engine import ParametricEngine
-from backend.geometry.mesh_export import export_for_frontend
-from backend.physics.simulation_engine import SimulationEngine
-from backend.physics.regen_cooling import CoolingChannelGeometry
-from backend.materials.database import MaterialDatabase
-
-material_db = MaterialDatabase()
-
-
-def cooling_config_to_geom(cfg: CoolingConfig) -> CoolingChannelGeometry:
-    """Convert CoolingConfig pydantic model to CoolingChannelGeometry dataclass."""
-    return CoolingChannelGeometry(
-        n_channels=cfg.n_channels,
-        channel_width=cfg.channel_width,
-        channel_height=cfg.channel_height,
-        rib_width=cfg.rib_width,
-        ch_height_cp0=cfg.ch_height_cp0,
-        ch_height_cp1=cfg.ch_height_cp1,
-        ch_height_cp2=cfg.ch_height_cp2,
-    )
+from backend.materials.database import get_material
+
+if TYPE_CHECKING:
+    from backend.physics.simulation_engine import SimulationEngine
+
+log = logging.getLogger(__name__)
+
+# Validators built once and reused for every incoming message
+_SIM_ADAPTER = TypeAdapter(SimulationConfig)
+_UPDATE_ADAPTER = TypeAdapter(UpdateParams)
+_GA_ADAPTER = TypeAdapter(GAConfig)
 
 
 class ConnectionManager:
@@ -42,26 +40,43 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
 
     async def send_json(self, websocket: WebSocket, data: dict):
-        await websocket.send_json(data)
+        # orjson encodes numpy arrays/scalars natively; frames go out as binary
+        await websocket.send_bytes(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
 
 
 manager = ConnectionManager()
 
 
+def mesh_digest(mesh_data: dict) -> bytes:
+    """Short fingerprint of a mesh_update payload (wall vertices + injector layout)."""
+    h = hashlib.blake2b(digest_size=8)
+    for wall in ("inner_wall", "outer_wall"):
+        h.update(mesh_data[wall]["positions"].tobytes())
+        h.update(mesh_data[wall]["indices"].tobytes())
+    h.update(orjson.dumps(mesh_data.get("injector_orifices")))
+    return h.digest()
+
+
 class SimulationSession:
     """Tracks state for a single client's simulation session."""
 
     def __init__(self):
-        self.sim_engine: SimulationEngine | None = None
+        self.sim_engine: "SimulationEngine | None" = None
         self.sim_running = False
         self.evolution_running = False
         self._sim_task: asyncio.Task | None = None
+        self._tick_writer_task: asyncio.Task | None = None
         self._evo_task: asyncio.Task | None = None
+        self.last_mesh_digest: bytes | None = None
+        # Held while a tick runs or the engine is reconfigured: ticks run in a
+        # worker thread, updates on the event loop, and both touch sim_engine
+        self.engine_lock = asyncio.Lock()
 
     def stop_simulation(self):
         self.sim_running = False
-        if self._sim_task and not self._sim_task.done():
-            self._sim_task.cancel()
+        for task in (self._sim_task, self._tick_writer_task):
+            if task and not task.done():
+                task.cancel()
 
     def stop_evolution(self):
         self.evolution_running = False
@@ -76,23 +91,19 @@ async def handle_websocket(websocket: WebSocket):
 
     try:
         while True:
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            raw = message.get("bytes")
+            if raw is None:
+                raw = message["text"]
+            data = orjson.loads(raw)
             msg_type = data.get("type", "")
-            payload = data.get("payload", {})
+            handler = _HANDLERS.get(msg_type)
 
             try:
-                if msg_type == "start_simulation":
-                    await handle_start_simulation(websocket, session, payload)
-                elif msg_type == "stop_simulation":
-                    session.stop_simulation()
-                elif msg_type == "update_params":
-                    await handle_update_params(websocket, session, payload)
-                elif msg_type == "request_mesh":
-                    await handle_request_mesh(websocket, session)
-                elif msg_type == "start_evolution":
-                    await handle_start_evolution(websocket, session, payload)
-                elif msg_type == "stop_evolution":
-                    session.stop_evolution()
+                if handler is not None:
+                    await handler(websocket, session, data.get("payload", {}))
                 else:
                     await manager.send_json(websocket, {
                         "type": "error",
@@ -112,20 +123,25 @@ async def handle_websocket(websocket: WebSocket):
 
 async def handle_start_simulation(websocket: WebSocket, session: SimulationSession, payload: dict):
     """Start or restart the physics simulation loop."""
+    # Geometry/physics stack (numpy, scipy) loads on first use, not at server boot
+    from backend.geometry.parametric_engine import ParametricEngine
+    from backend.geometry.mesh_export import export_for_frontend
+    from backend.physics.regen_cooling import CoolingChannelGeometry
+    from backend.physics.simulation_engine import SimulationEngine
+
     session.stop_simulation()
 
-    # Debug: log injector config received
-    inj_payload = payload.get("injector", {})
-    print(f"[WS] start_simulation injector payload: {inj_payload}")
+    log.debug("start_simulation injector payload: %s", payload.get("injector", {}))
 
-    config = SimulationConfig(**payload)
-    print(f"[WS] parsed injector config: enabled={config.injector.enabled}, n_rings={config.injector.n_rings}")
+    config = _SIM_ADAPTER.validate_python(payload)
+    log.debug("parsed injector config: enabled=%s, n_rings=%s",
+              config.injector.enabled, config.injector.n_rings)
 
-    engine = ParametricEngine.from_dict(config.geometry.model_dump())
-    material = material_db.get(config.material_id)
+    engine = ParametricEngine.from_pydantic(config.geometry)
+    material = get_material(config.material_id)
 
     # Build cooling config
-    cooling_geom = cooling_config_to_geom(config.cooling)
+    cooling_geom = CoolingChannelGeometry.from_pydantic(config.cooling)
 
     session.sim_engine = SimulationEngine(
         engine=engine, material=material,
@@ -146,20 +162,49 @@ async def handle_start_simulation(websocket: WebSocket, session: SimulationSessi
     session.injector_config = config.injector
 
     # Send initial mesh
-    mesh_data = export_for_frontend(engine, injector_config=config.injector)
-    n_orif = len(mesh_data.get("injector_orifices", []))
-    print(f"[WS] mesh_update sent: has injector_orifices={n_orif}")
+    mesh_data = await run_in_threadpool(export_for_frontend, engine, injector_config=config.injector)
+    session.last_mesh_digest = mesh_digest(mesh_data)
     await manager.send_json(websocket, {"type": "mesh_update", "payload": mesh_data})
+    log.debug("mesh_update sent: injector_orifices=%d", len(mesh_data.get("injector_orifices", [])))
 
     # Start simulation loop
     session.sim_running = True
 
+    # Ticks go through an outbox so a slow socket never stalls the physics loop;
+    # whatever piles up while a send is in flight goes out as one batch frame.
+    # The outbox holds at most one batch: for a client that cannot keep up,
+    # the oldest ticks are dropped instead of memory and latency growing
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=SIM_TICK_BATCH_MAX)
+
+    async def tick_writer():
+        try:
+            while True:
+                batch = [await outbox.get()]
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                if len(batch) == 1:
+                    await manager.send_json(websocket, {"type": "sim_tick", "payload": batch[0]})
+                else:
+                    await manager.send_json(websocket, {"type": "sim_tick_batch", "payload": batch})
+        except WebSocketDisconnect:
+            session.stop_simulation()
+        except Exception:
+            log.exception("sim tick send failed; stopping simulation")
+            session.stop_simulation()
+
     async def sim_loop():
+        loop = asyncio.get_running_loop()
         while session.sim_running:
             try:
-                tick_data = session.sim_engine.run_tick()
-                await manager.send_json(websocket, {"type": "sim_tick", "payload": tick_data})
-                await asyncio.sleep(0.1)  # ~10 Hz
+                t0 = loop.time()
+                # Physics runs in a worker thread so other clients' sockets stay responsive
+                async with session.engine_lock:
+                    tick_data = await run_in_threadpool(session.sim_engine.run_tick)
+                if outbox.full():
+                    outbox.get_nowait()  # drop the oldest; the client wants the latest state
+                outbox.put_nowait(tick_data)
+                # Sleep only for what is left of the tick period; slow ticks go straight on
+                await asyncio.sleep(max(0.0, SIM_TICK_INTERVAL - (loop.time() - t0)))
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -169,11 +214,14 @@ async def handle_start_simulation(websocket: WebSocket, session: SimulationSessi
                 })
                 break
 
+    session._tick_writer_task = asyncio.create_task(tick_writer())
     session._sim_task = asyncio.create_task(sim_loop())
 
 
 async def handle_update_params(websocket: WebSocket, session: SimulationSession, payload: dict):
     """Hot-update simulation parameters."""
+    from backend.geometry.mesh_export import export_for_frontend
+
     if session.sim_engine is None:
         await manager.send_json(websocket, {
             "type": "error",
@@ -181,19 +229,50 @@ async def handle_update_params(websocket: WebSocket, session: SimulationSession,
         })
         return
 
-    update = UpdateParams(**payload)
+    update = _UPDATE_ADAPTER.validate_python(payload)
+
+    async with session.engine_lock:
+        new_engine = _apply_update(session, update)
+
+    # If geometry or injector changed, send new mesh -- unless it came out
+    # identical to the one the client already has
+    inj_cfg = getattr(session, 'injector_config', None)
+    if new_engine is not None or update.injector is not None:
+        engine_to_use = new_engine or session.sim_engine.engine
+        mesh_data = await run_in_threadpool(export_for_frontend, engine_to_use, injector_config=inj_cfg)
+        digest = mesh_digest(mesh_data)
+        if digest != session.last_mesh_digest:
+            session.last_mesh_digest = digest
+            await manager.send_json(websocket, {"type": "mesh_update", "payload": mesh_data})
+
+
+def _apply_update(session: SimulationSession, update) -> "ParametricEngine | None":
+    """Apply an UpdateParams to the session's engine; returns the engine if its geometry changed.
+
+    Callers hold session.engine_lock, so no tick sees a half-applied update.
+    """
+    from backend.geometry.parametric_engine import ParametricEngine
+    from backend.physics.regen_cooling import CoolingChannelGeometry
 
     new_engine = None
     new_material = None
 
     if update.geometry is not None:
-        new_engine = ParametricEngine.from_dict(update.geometry.model_dump())
+        # Swap in an edited copy rather than touching the live engine, which a
+        # mesh export may be reading; unchanged sliders cost nothing and
+        # wall-thickness-only edits reuse the cached contour
+        engine = session.sim_engine.engine
+        edited = engine.with_params(**{
+            name: getattr(update.geometry, name) for name in ParametricEngine.SHAPE_PARAMS
+        })
+        if edited is not engine:
+            new_engine = edited
     if update.material_id is not None:
-        new_material = material_db.get(update.material_id)
+        new_material = get_material(update.material_id)
 
     cooling_geom = None
     if update.cooling is not None:
-        cooling_geom = cooling_config_to_geom(update.cooling)
+        cooling_geom = CoolingChannelGeometry.from_pydantic(update.cooling)
 
     injector_cfg = update.injector if update.injector is not None else None
     if injector_cfg is not None:
@@ -214,17 +293,13 @@ async def handle_update_params(websocket: WebSocket, session: SimulationSession,
         rib_thickness_factor=update.cooling.rib_thickness_factor if update.cooling else None,
         injector_config=injector_cfg,
     )
+    return new_engine
 
-    # If geometry or injector changed, send new mesh
-    inj_cfg = getattr(session, 'injector_config', None)
-    if new_engine is not None or injector_cfg is not None:
-        engine_to_use = new_engine or session.sim_engine.engine
-        mesh_data = export_for_frontend(engine_to_use, injector_config=inj_cfg)
-        await manager.send_json(websocket, {"type": "mesh_update", "payload": mesh_data})
 
-
-async def handle_request_mesh(websocket: WebSocket, session: SimulationSession):
+async def handle_request_mesh(websocket: WebSocket, session: SimulationSession, payload: dict):
     """Send current mesh data."""
+    from backend.geometry.mesh_export import export_for_frontend
+
     if session.sim_engine is None:
         await manager.send_json(websocket, {
             "type": "error",
@@ -233,7 +308,9 @@ async def handle_request_mesh(websocket: WebSocket, session: SimulationSession):
         return
 
     inj_cfg = getattr(session, 'injector_config', None)
-    mesh_data = export_for_frontend(session.sim_engine.engine, injector_config=inj_cfg)
+    mesh_data = await run_in_threadpool(export_for_frontend, session.sim_engine.engine, injector_config=inj_cfg)
+    # Explicit requests always get a reply; just keep the digest current
+    session.last_mesh_digest = mesh_digest(mesh_data)
     await manager.send_json(websocket, {"type": "mesh_update", "payload": mesh_data})
 
 
@@ -241,14 +318,17 @@ async def handle_start_evolution(websocket: WebSocket, session: SimulationSessio
     """Launch the evolutionary algorithm."""
     session.stop_evolution()
 
-    ga_config = GAConfig(**payload)
-    material = material_db.get(ga_config.material_id)
+    ga_config = _GA_ADAPTER.validate_python(payload)
+    material = get_material(ga_config.material_id)
 
     session.evolution_running = True
 
     async def evo_loop():
+        # Fitness evaluation is CPU-bound; spread it over worker processes so
+        # the event loop (and every other client's sim ticks) stays responsive
+        pool = None
         try:
-            from backend.evolution.ga_engine import EvolutionRunner
+            from backend.evolution.ga_engine import EvolutionRunner, create_worker_pool
             from backend.evolution.fitness import FitnessEvaluator
 
             cooling_cfg = ga_config.cooling if hasattr(ga_config, 'cooling') else CoolingConfig()
@@ -266,6 +346,8 @@ async def handle_start_evolution(websocket: WebSocket, session: SimulationSessio
                 coolant_type=cooling_cfg.coolant_type,
                 injector_config=injector_cfg,
             )
+            # Workers receive the evaluator once at startup and stay up for the whole run
+            pool = create_worker_pool(evaluator, max_workers=os.cpu_count())
 
             async def on_generation(snapshot):
                 if session.evolution_running:
@@ -280,6 +362,7 @@ async def handle_start_evolution(websocket: WebSocket, session: SimulationSessio
                 mutation_prob=ga_config.mutation_prob,
                 evaluator=evaluator,
                 on_generation=on_generation,
+                executor=pool,
             )
 
             best = await runner.run_async(lambda: session.evolution_running)
@@ -298,5 +381,26 @@ async def handle_start_evolution(websocket: WebSocket, session: SimulationSessio
             })
         finally:
             session.evolution_running = False
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
 
     session._evo_task = asyncio.create_task(evo_loop())
+
+
+async def handle_stop_simulation(websocket: WebSocket, session: SimulationSession, payload: dict):
+    session.stop_simulation()
+
+
+async def handle_stop_evolution(websocket: WebSocket, session: SimulationSession, payload: dict):
+    session.stop_evolution()
+
+
+# Message type -> handler; every handler takes (websocket, session, payload)
+_HANDLERS = {
+    "start_simulation": handle_start_simulation,
+    "stop_simulation": handle_stop_simulation,
+    "update_params": handle_update_params,
+    "request_mesh": handle_request_mesh,
+    "start_evolution": handle_start_evolution,
+    "stop_evolution": handle_stop_evolution,
+}
@@ -3,6 +3,8 @@
 import math
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 # Physical constants
 G0 = 9.80665  # m/s^2, standard gravity
@@ -98,6 +100,21 @@ GENOME_BOUNDS = [
     (0.0005, 0.006), # [28] inj_ox_diameter — oxidizer orifice diameter (m)
 ]
 
+# Storage precision of GA genomes. Kept at float64: repair leaves many genes
+# exactly on a bound, and float32 rounding can put them just outside it
+GENOME_DTYPE = np.float64
+
+# Bounds as arrays, for clipping whole genomes / populations in one call
+GENOME_LO = np.array([b[0] for b in GENOME_BOUNDS], dtype=GENOME_DTYPE)
+GENOME_HI = np.array([b[1] for b in GENOME_BOUNDS], dtype=GENOME_DTYPE)
+GENOME_RANGE = GENOME_HI - GENOME_LO
+
+
+def clip_genome(pop, out=None):
+    """Clamp a genome (n_genes,) or population (n, n_genes) to GENOME_BOUNDS."""
+    return np.clip(pop, GENOME_LO, GENOME_HI, out=out)
+
+
 GENE_NAMES = [
     "chamber_diameter", "chamber_length", "throat_diameter", "expansion_ratio",
     "wt_cp0", "wt_cp1", "wt_cp2", "wt_cp3", "wt_cp4", "wt_cp5",
@@ -118,5 +135,8 @@ INJECTOR_GENE_INDICES = list(range(25, 29))    # injector orifice params
 
 NUM_PROFILE_STATIONS = 200
 
+SIM_TICK_INTERVAL = 0.1  # s, target period of the live simulation loop (~10 Hz)
+SIM_TICK_BATCH_MAX = 16  # max queued ticks coalesced into one sim_tick_batch frame
+
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 8000
@@ -1,11 +1,14 @@
 """Multi-objective fitness evaluation for evolved engine designs."""
 
 import math
+import numpy as np
 from backend.geometry.parametric_engine import ParametricEngine
-from backend.physics.simulation_engine import SimulationEngine
+from backend.physics.simulation_engine import SimulationEngine, SUMMARY_FIELDS
 from backend.physics.regen_cooling import CoolingChannelGeometry
 from backend.materials.database import MaterialProperties
+from backend.physics.combustion import specific_gas_constant, characteristic_velocity
 from backend.config import G0, GENE_NAMES
+from backend.api.schemas import InjectorConfig
 
 
 class FitnessEvaluator:
@@ -29,157 +32,211 @@ class FitnessEvaluator:
         self.coolant_type = coolant_type
         self.injector_config = injector_config
 
+        # Theoretical Isp ceiling used by the efficiency score
+        R_spec = specific_gas_constant(molecular_weight)
+        c_star = characteristic_velocity(gamma, R_spec, chamber_temperature_K)
+        self._isp_max = c_star / G0 * 1.8
+
     def evaluate(self, genome: list) -> dict:
         """Evaluate a genome and return fitness scores.
 
         The genome contains 22 genes: 16 shape/thickness + 6 cooling.
         Returns dict with individual scores and weighted total.
         """
-        try:
-            # Extract engine shape from first 16 genes
-            engine = ParametricEngine.from_genome(genome)
-
-            # Extract cooling channel params from genes 16-21 (+22-24 for height CPs)
-            cooling_geom = None
-            coolant_mdot = 1.0
-            rib_thickness_factor = 0.5
-            if len(genome) >= 22:
-                cooling_kwargs = dict(
-                    n_channels=max(10, int(round(genome[16]))),
-                    channel_width=genome[17],
-                    channel_height=genome[18],
-                    rib_width=genome[19],
-                )
-                # Channel height control points (genes 22-24)
-                if len(genome) >= 25:
-                    cooling_kwargs["ch_height_cp0"] = genome[22]
-                    cooling_kwargs["ch_height_cp1"] = genome[23]
-                    cooling_kwargs["ch_height_cp2"] = genome[24]
-                cooling_geom = CoolingChannelGeometry(**cooling_kwargs)
-                coolant_mdot = genome[20]
-                rib_thickness_factor = genome[21]
-
-            # Extract injector params from genes 25-28 (if present)
-            injector_cfg = self.injector_config
-            if len(genome) >= 29 and injector_cfg and getattr(injector_cfg, 'enabled', False):
-                from backend.api.schemas import InjectorConfig
-                injector_cfg = InjectorConfig(
-                    enabled=True,
-                    n_rings=max(1, int(round(genome[25]))),
-                    elements_per_ring_base=max(3, int(round(genome[26]))),
-                    fuel_orifice_diameter=genome[27],
-                    ox_orifice_diameter=genome[28],
-                    mixture_ratio=injector_cfg.mixture_ratio,
-                    discharge_coefficient=injector_cfg.discharge_coefficient,
-                    first_ring_fraction=injector_cfg.first_ring_fraction,
-                    ring_spacing_fraction=injector_cfg.ring_spacing_fraction,
-                )
-
-            sim = SimulationEngine(
-                engine=engine, material=self.material,
-                gamma=self.gamma, molecular_weight=self.molecular_weight,
-                chamber_temperature_K=self.T_chamber,
-                chamber_pressure_Pa=self.P_chamber,
-                ambient_pressure_Pa=self.P_ambient,
-                cooling_enabled=self.cooling_enabled,
-                cooling_channel_geom=cooling_geom,
-                coolant_mdot=coolant_mdot,
-                coolant_type=self.coolant_type,
-                rib_thickness_factor=rib_thickness_factor,
-                injector_config=injector_cfg,
-            )
+        return self.evaluate_batch([genome])[0]
+
+    def evaluate_batch(self, genomes) -> list[dict]:
+        """Evaluate several genomes; scoring runs as array ops over the batch.
 
-            result = sim.run_tick()
-            perf = result["performance"]
-            struct = result["structural_summary"]
-            cooling = result.get("cooling", {})
-
-            # Sub-scores (all in [0, 1] range, higher = better)
-
-            # 1. Thrust-to-weight ratio (normalize: 100 is excellent)
-            tw = perf.get("thrust_to_weight", 0)
-            score_tw = min(tw / 100.0, 1.0)
-
-            # 2. Thermal survival (1 = well below melting, 0 = at/above melting)
-            thermal_margin = struct.get("thermal_margin", 1.0)
-            score_thermal = max(0.0, 1.0 - thermal_margin)
-
-            # 3. Efficiency (Isp ratio vs theoretical max)
-            from backend.physics.combustion import specific_gas_constant, characteristic_velocity
-            R_spec = specific_gas_constant(self.molecular_weight)
-            c_star = characteristic_velocity(self.gamma, R_spec, self.T_chamber)
-            Isp_actual = perf.get("specific_impulse_s", 0)
-            Isp_max = c_star / G0 * 1.8
-            score_efficiency = min(Isp_actual / max(Isp_max, 1), 1.0)
-
-            # 4. Structural integrity (min safety factor / target)
-            sf = struct.get("min_safety_factor", 0)
-            target_sf = 2.0
-            score_structural = min(sf / target_sf, 1.0)
-
-            # 5. Cost efficiency (lighter and cheaper = better)
-            mass = perf.get("total_mass_kg", 1)
-            cost = self.material.cost_per_kg_usd * mass
-            score_cost = max(0, 1.0 - cost / 500.0)
-
-            # 6. Cooling effectiveness (how much max wall temp was reduced)
-            score_cooling = 0.5  # default if cooling disabled
-            if cooling:
-                max_wall_T = cooling.get("max_wall_temp_K", self.T_chamber)
-                # Best: wall temp far below melting; worst: at melting
-                cooling_ratio = max_wall_T / self.material.melting_point_K
-                score_cooling = max(0.0, 1.0 - cooling_ratio)
-
-            # 7. Coolant pressure drop (lower is better)
-            score_pressure_drop = 0.5  # default if cooling disabled
-            if cooling:
-                dp = cooling.get("coolant_pressure_drop_Pa", 0)
-                # Normalize: 0 Pa = perfect (1.0), 3 MPa = bad (0.0)
-                score_pressure_drop = max(0.0, 1.0 - dp / 3_000_000.0)
-
-            # 8. Injection quality (atomization + stability + momentum)
-            score_injection = 0.5  # default if injector disabled
-            injector_data = result.get("injector", {})
-            if injector_data:
-                atom = injector_data.get("atomization_quality", 0.5)
-                stab = injector_data.get("stability_margin", 0.5)
-                mom = injector_data.get("momentum_ratio", 1.0)
-                # Momentum ratio score: ideal = 1.0, penalize deviation
-                mom_score = max(0.0, 1.0 - abs(mom - 1.0))
-                score_injection = 0.4 * atom + 0.4 * stab + 0.2 * mom_score
-
-            scores = {
-                "thrust_to_weight": score_tw,
-                "thermal_survival": score_thermal,
-                "efficiency": score_efficiency,
-                "structural_integrity": score_structural,
-                "cost_efficiency": score_cost,
-                "cooling_effectiveness": score_cooling,
-                "coolant_pressure_drop": score_pressure_drop,
-                "injection_quality": score_injection,
+        Returns one dict per genome, as evaluate() does.
+        """
+        n = len(genomes)
+        metrics = np.zeros((len(_METRICS), n))
+        ok = np.zeros(n, dtype=bool)
+        performances = []
+        for i, genome in enumerate(genomes):
+            if self._quick_reject(genome):
+                performances.append({})
+                continue
+            try:
+                result = self._simulate(genome)
+                metrics[:, i] = _extract_metrics(result, self.T_chamber)
+            except Exception:
+                # Invalid genome - scored as worst fitness below
+                performances.append({})
+                continue
+            ok[i] = True
+            performances.append(result["performance"])
+
+        scores = self._score(*metrics)
+        for v in scores.values():
+            v[~ok] = 0.0
+
+        # Weighted total
+        total = np.zeros(n)
+        for k, v in scores.items():
+            total = total + self.weights.get(k, 0) * v
+        weight_sum = sum(self.weights.values())
+        if weight_sum > 0:
+            total /= weight_sum
+        total[~ok] = 0.0
+
+        return [
+            {
+                "total": float(total[i]),
+                "scores": {k: float(v[i]) for k, v in scores.items()},
+                "performance": performances[i],
             }
+            for i in range(n)
+        ]
 
-            # Weighted total
-            total = sum(self.weights.get(k, 0) * v for k, v in scores.items())
-            weight_sum = sum(self.weights.values())
-            if weight_sum > 0:
-                total /= weight_sum
+    @staticmethod
+    def _quick_reject(genome) -> bool:
+        """True for genomes with non-finite genes, which no sim can score.
 
-            return {
-                "total": total,
-                "scores": scores,
-                "performance": perf,
-            }
+        Only that is rejected up front: generation 0 is evaluated unrepaired,
+        and geometrically odd genomes still get real (often nonzero) scores.
+        """
+        return not all(map(math.isfinite, genome))
+
+    def _simulate(self, genome) -> dict:
+        """Build the engine/cooling/injector described by a genome and run one tick."""
+        # Extract engine shape from first 16 genes
+        engine = ParametricEngine.from_genome(genome)
+
+        # Extract cooling channel params from genes 16-21 (+22-24 for height CPs)
+        cooling_geom = None
+        coolant_mdot = 1.0
+        rib_thickness_factor = 0.5
+        if len(genome) >= 22:
+            cooling_kwargs = dict(
+                n_channels=max(10, int(round(genome[16]))),
+                channel_width=genome[17],
+                channel_height=genome[18],
+                rib_width=genome[19],
+            )
+            # Channel height control points (genes 22-24)
+            if len(genome) >= 25:
+                cooling_kwargs["ch_height_cp0"] = genome[22]
+                cooling_kwargs["ch_height_cp1"] = genome[23]
+                cooling_kwargs["ch_height_cp2"] = genome[24]
+            cooling_geom = CoolingChannelGeometry(**cooling_kwargs)
+            coolant_mdot = genome[20]
+            rib_thickness_factor = genome[21]
+
+        # Extract injector params from genes 25-28 (if present)
+        injector_cfg = self.injector_config
+        if len(genome) >= 29 and injector_cfg and getattr(injector_cfg, 'enabled', False):
+            # Genes are already repaired into range by feasibility_repair,
+            # so skip pydantic validation in this per-genome hot path
+            injector_cfg = InjectorConfig.model_construct(
+                enabled=True,
+                n_rings=max(1, int(round(genome[25]))),
+                elements_per_ring_base=max(3, int(round(genome[26]))),
+                fuel_orifice_diameter=genome[27],
+                ox_orifice_diameter=genome[28],
+                mixture_ratio=injector_cfg.mixture_ratio,
+                discharge_coefficient=injector_cfg.discharge_coefficient,
+                first_ring_fraction=injector_cfg.first_ring_fraction,
+                ring_spacing_fraction=injector_cfg.ring_spacing_fraction,
+            )
 
-        except Exception:
-            # Invalid genome - return worst fitness
-            return {
-                "total": 0.0,
-                "scores": {k: 0.0 for k in [
-                    "thrust_to_weight", "thermal_survival", "efficiency",
-                    "structural_integrity", "cost_efficiency",
-                    "cooling_effectiveness", "coolant_pressure_drop",
-                    "injection_quality",
-                ]},
-                "performance": {},
-            }
+        sim = SimulationEngine(
+            engine=engine, material=self.material,
+            gamma=self.gamma, molecular_weight=self.molecular_weight,
+            chamber_temperature_K=self.T_chamber,
+            chamber_pressure_Pa=self.P_chamber,
+            ambient_pressure_Pa=self.P_ambient,
+            cooling_enabled=self.cooling_enabled,
+            cooling_channel_geom=cooling_geom,
+            coolant_mdot=coolant_mdot,
+            coolant_type=self.coolant_type,
+            rib_thickness_factor=rib_thickness_factor,
+            injector_config=injector_cfg,
+        )
+
+        result = sim.run_tick(fields=_RESULT_FIELDS)
+        return result
+
+    def _score(self, tw, thermal_margin, isp, sf, mass,
+               has_cooling, max_wall_T, dp,
+               has_injector, atom, stab, mom) -> dict:
+        """Sub-scores (all in [0, 1] range, higher = better) for arrays of raw metrics.
+
+        NaN handling matches the scalar builtins this replaced: max(0.0, nan)
+        is 0.0 (np.fmax), while min(nan, 1.0) stays nan (np.minimum).
+        """
+        # 1. Thrust-to-weight ratio (normalize: 100 is excellent)
+        score_tw = np.minimum(tw / 100.0, 1.0)
+
+        # 2. Thermal survival (1 = well below melting, 0 = at/above melting)
+        score_thermal = np.fmax(0.0, 1.0 - thermal_margin)
+
+        # 3. Efficiency (Isp ratio vs theoretical max)
+        score_efficiency = np.minimum(isp / max(self._isp_max, 1), 1.0)
+
+        # 4. Structural integrity (min safety factor / target)
+        target_sf = 2.0
+        score_structural = np.minimum(sf / target_sf, 1.0)
+
+        # 5. Cost efficiency (lighter and cheaper = better)
+        cost = self.material.cost_per_kg_usd * mass
+        score_cost = np.fmax(0.0, 1.0 - cost / 500.0)
+
+        # 6. Cooling effectiveness: best when wall temp is far below melting
+        #    (0.5 if cooling disabled)
+        cooling_ratio = max_wall_T / self.material.melting_point_K
+        score_cooling = np.where(has_cooling, np.fmax(0.0, 1.0 - cooling_ratio), 0.5)
+
+        # 7. Coolant pressure drop: 0 Pa = perfect (1.0), 3 MPa = bad (0.0)
+        score_pressure_drop = np.where(has_cooling, np.fmax(0.0, 1.0 - dp / 3_000_000.0), 0.5)
+
+        # 8. Injection quality (atomization + stability + momentum); momentum
+        #    ratio ideal = 1.0, penalize deviation (0.5 if injector disabled)
+        mom_score = np.fmax(0.0, 1.0 - np.abs(mom - 1.0))
+        score_injection = np.where(has_injector, 0.4 * atom + 0.4 * stab + 0.2 * mom_score, 0.5)
+
+        return {
+            "thrust_to_weight": score_tw,
+            "thermal_survival": score_thermal,
+            "efficiency": score_efficiency,
+            "structural_integrity": score_structural,
+            "cost_efficiency": score_cost,
+            "cooling_effectiveness": score_cooling,
+            "coolant_pressure_drop": score_pressure_drop,
+            "injection_quality": score_injection,
+        }
+
+
+# Raw per-genome metrics pulled from a sim tick, in FitnessEvaluator._score() argument order
+_METRICS = (
+    "tw", "thermal_margin", "isp", "sf", "mass",
+    "has_cooling", "max_wall_T", "dp",
+    "has_injector", "atom", "stab", "mom",
+)
+
+
+# run_tick() fields _extract_metrics() reads; the per-station arrays are not needed
+_RESULT_FIELDS = SUMMARY_FIELDS | {"cooling", "injector"}
+
+
+def _extract_metrics(result: dict, T_chamber: float) -> tuple:
+    """Pull the raw numbers the fitness scores depend on out of a run_tick() result."""
+    perf = result["performance"]
+    struct = result["structural_summary"]
+    cooling = result.get("cooling", {})
+    injector_data = result.get("injector", {})
+    return (
+        perf.get("thrust_to_weight", 0),
+        struct.get("thermal_margin", 1.0),
+        perf.get("specific_impulse_s", 0),
+        struct.get("min_safety_factor", 0),
+        perf.get("total_mass_kg", 1),
+        bool(cooling),
+        cooling.get("max_wall_temp_K", T_chamber) if cooling else 0.0,
+        cooling.get("coolant_pressure_drop_Pa", 0) if cooling else 0.0,
+        bool(injector_data),
+        injector_data.get("atomization_quality", 0.5),
+        injector_data.get("stability_margin", 0.5),
+        injector_data.get("momentum_ratio", 1.0),
+    )
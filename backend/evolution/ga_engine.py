@@ -1,11 +1,13 @@
 """Genetic algorithm engine using DEAP for rocket engine shape optimization."""
 
+import os
 import random
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from deap import base, creator, tools
-from backend.config import GENOME_BOUNDS, GENE_NAMES
-from backend.evolution.operators import blx_alpha_crossover, gaussian_mutation, feasibility_repair
+from backend.config import GENOME_BOUNDS, GENOME_DTYPE, GENE_NAMES
+from backend.evolution.operators import blx_alpha_crossover, gaussian_mutation_population, feasibility_repair
 from backend.evolution.population import initialize_population_lhs, diversity_metric
 from backend.evolution.fitness import FitnessEvaluator
 
@@ -14,7 +16,42 @@ from backend.evolution.fitness import FitnessEvaluator
 if not hasattr(creator, "FitnessMax"):
     creator.create("FitnessMax", base.Fitness, weights=(1.0,))
 if not hasattr(creator, "Individual"):
-    creator.create("Individual", list, fitness=creator.FitnessMax)
+    creator.create("Individual", np.ndarray, fitness=creator.FitnessMax)
+
+
+def _evaluate_results(evaluator: FitnessEvaluator, genomes: list) -> list[dict]:
+    """Fitness results of a batch of genomes (module-level so worker processes can run it)."""
+    return evaluator.evaluate_batch(genomes)
+
+
+# Evaluation batches submitted per worker process each generation
+_BATCHES_PER_WORKER = 4
+
+# Evaluator owned by this worker process, installed once by _init_worker
+_WORKER_EVALUATOR: FitnessEvaluator | None = None
+
+
+def _init_worker(evaluator: FitnessEvaluator):
+    global _WORKER_EVALUATOR
+    _WORKER_EVALUATOR = evaluator
+
+
+def _evaluate_in_worker(genomes: list) -> list[dict]:
+    """Score a batch with the worker's resident evaluator; tasks carry only genomes."""
+    return _evaluate_results(_WORKER_EVALUATOR, genomes)
+
+
+class _EvaluatorPool(ProcessPoolExecutor):
+    """Process pool whose workers each hold an evaluator (see create_worker_pool)."""
+
+
+def create_worker_pool(evaluator: FitnessEvaluator, max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Process pool for EvolutionRunner in which every worker holds a copy of evaluator.
+
+    The evaluator is pickled once per worker at startup instead of once per task.
+    """
+    return _EvaluatorPool(max_workers=max_workers, initializer=_init_worker,
+                          initargs=(evaluator,))
 
 
 class EvolutionRunner:
@@ -23,26 +60,106 @@ class EvolutionRunner:
     def __init__(self, population_size: int, num_generations: int,
                  crossover_prob: float, mutation_prob: float,
                  evaluator: FitnessEvaluator,
-                 on_generation=None):
+                 on_generation=None,
+                 executor=None):
         self.pop_size = population_size
         self.num_gen = num_generations
         self.cx_prob = crossover_prob
         self.mut_prob = mutation_prob
         self.evaluator = evaluator
         self.on_generation = on_generation
+        # Optional pool from create_worker_pool() for fitness evaluation; None = inline
+        self.executor = executor
+        # Exact genome bytes -> fitness total, for the current run. Full result
+        # dicts are only kept for the genomes that share the best total so far
+        self._totals: dict[bytes, float] = {}
+        self._best_total = -float('inf')
+        self._best_results: dict[bytes, dict] = {}
+        # Each evaluation task scores a batch. A few batches per worker amortize
+        # IPC while letting fast workers pick up slack from slow genomes
+        self.n_batches = _BATCHES_PER_WORKER * (os.cpu_count() or 1) if executor is not None else 1
+        # Double-buffered genome storage: the current population's Individuals
+        # are row views of _front, the next generation is written into _back
+        self._front = np.empty((population_size, len(GENOME_BOUNDS)), dtype=GENOME_DTYPE)
+        self._back = np.empty_like(self._front)
+        # Fitness totals row-aligned with each buffer, for array-op statistics
+        self._fit_front = np.empty(population_size)
+        self._fit_back = np.empty_like(self._fit_front)
         
         # Setup DEAP toolbox
         self.toolbox = base.Toolbox()
         self.toolbox.register("mate", blx_alpha_crossover)
         self.toolbox.register("select", tools.selTournament, tournsize=3)
+        if isinstance(executor, _EvaluatorPool):
+            # Workers already hold the evaluator; tasks carry only genomes
+            self.toolbox.register("evaluate", _evaluate_in_worker)
+        else:
+            # Inline, or any other executor: each task carries the evaluator
+            self.toolbox.register("evaluate", _evaluate_results, evaluator)
+        self.toolbox.register("map", executor.map if executor is not None else map)
     
-    def _create_individual(self, genome):
-        ind = creator.Individual(genome)
+    @staticmethod
+    def _row_individual(row):
+        """Wrap a buffer row as an Individual without copying the genome."""
+        ind = row.view(creator.Individual)
+        # view() bypasses Individual.__init__, so attach a fresh fitness here
+        ind.fitness = creator.FitnessMax()
         return ind
     
-    def _evaluate(self, individual):
-        result = self.evaluator.evaluate(list(individual))
-        return (result["total"],)
+    def _copy_into(self, rows, fits, sources):
+        """Copy sources (and any valid fitness) into rows / fits; return the row Individuals."""
+        rows[:] = sources
+        copies = []
+        for i, (row, src) in enumerate(zip(rows, sources)):
+            ind = self._row_individual(row)
+            if src.fitness.valid:
+                ind.fitness.values = src.fitness.values
+                fits[i] = src.fitness.values[0]
+            copies.append(ind)
+        return copies
+    
+    async def _evaluate_population(self, individuals):
+        """Assign fitness to each individual via toolbox.map (parallel if an executor is set).
+        
+        Genomes already scored during this run are served from the result cache.
+        Returns the fitness totals as an array aligned with individuals.
+        """
+        totals = np.empty(len(individuals))
+        pending = []
+        for i, ind in enumerate(individuals):
+            total = self._totals.get(ind.tobytes())
+            if total is None:
+                pending.append(i)
+            else:
+                ind.fitness.values = (total,)
+                totals[i] = total
+        if not pending:
+            return totals
+        
+        # Plain float lists pickle compactly and keep numpy scalars out of the sim
+        genomes = [individuals[i].tolist() for i in pending]
+        size = max(1, -(-len(genomes) // self.n_batches))
+        batches = [genomes[i:i + size] for i in range(0, len(genomes), size)]
+        # toolbox.map blocks until every result is in, so drive it from a
+        # worker thread to keep the event loop free
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None, lambda: list(self.toolbox.map(self.toolbox.evaluate, batches))
+        )
+        flat = [result for batch in results for result in batch]
+        for i, result in zip(pending, flat):
+            ind = individuals[i]
+            total = result["total"]
+            ind.fitness.values = (total,)
+            totals[i] = total
+            key = ind.tobytes()
+            self._totals[key] = total
+            if total > self._best_total:
+                self._best_total = total
+                self._best_results = {key: result}
+            elif total == self._best_total:
+                self._best_results[key] = result
+        return totals
     
     async def run_async(self, should_continue=None) -> dict:
         """Run the GA asynchronously, yielding control between generations.
@@ -52,27 +169,38 @@ class EvolutionRunner:
         """
         if should_continue is None:
             should_continue = lambda: True
+        self._totals.clear()
+        self._best_total = -float('inf')
+        self._best_results = {}
         
         # Initialize population with LHS
-        genomes = initialize_population_lhs(self.pop_size)
-        population = [self._create_individual(g) for g in genomes]
+        self._front[:] = initialize_population_lhs(self.pop_size)
+        population = [self._row_individual(row) for row in self._front]
         
         # Evaluate initial population
-        for ind in population:
-            ind.fitness.values = self._evaluate(ind)
+        self._fit_front[:] = await self._evaluate_population(population)
         
         n_elite = max(1, int(self.pop_size * 0.05))
         best_ever = None
+        best_ever_result = {}
         best_ever_fitness = -float('inf')
         stagnation = 0
+        # on_generation of the previous generation, still running while the next evaluates
+        snapshot_sent = None
         
         for gen in range(self.num_gen):
             if not should_continue():
                 break
             
-            # Selection
-            offspring = self.toolbox.select(population, self.pop_size - n_elite)
-            offspring = [self._create_individual(list(ind)) for ind in offspring]
+            # Elitism: survivors are unchanged, so they keep their fitness
+            # (stable descending sort picks the same rows as tools.selBest)
+            elite_idx = np.argsort(-self._fit_front, kind="stable")[:n_elite]
+            elites = self._copy_into(self._back[:n_elite], self._fit_back[:n_elite],
+                                     [population[i] for i in elite_idx])
+            
+            # Selection (copied into the back buffer, so parents stay intact)
+            selected = self.toolbox.select(population, self.pop_size - n_elite)
+            offspring = self._copy_into(self._back[n_elite:], self._fit_back[n_elite:], selected)
             
             # Crossover
             for i in range(0, len(offspring) - 1, 2):
@@ -81,34 +209,39 @@ class EvolutionRunner:
                     del offspring[i].fitness.values
                     del offspring[i + 1].fitness.values
             
-            # Mutation
-            for i in range(len(offspring)):
-                if random.random() < self.mut_prob:
-                    gaussian_mutation(offspring[i], generation=gen, max_generations=self.num_gen)
-                    del offspring[i].fitness.values
-            
-            # Evaluate new individuals
-            for ind in offspring:
-                if not ind.fitness.valid:
-                    ind.fitness.values = self._evaluate(ind)
+            # Mutation (all mutants drawn in one batch)
+            mutants = [ind for ind in offspring if random.random() < self.mut_prob]
+            gaussian_mutation_population(mutants, generation=gen, max_generations=self.num_gen)
+            for ind in mutants:
+                del ind.fitness.values
             
-            # Elitism
-            elites = tools.selBest(population, n_elite)
-            elites = [self._create_individual(list(e)) for e in elites]
-            for e in elites:
-                e.fitness.values = self._evaluate(e)
+            # Evaluate new individuals, overlapped with sending the last snapshot
+            invalid = [i for i, ind in enumerate(offspring) if not ind.fitness.valid]
+            evaluation = self._evaluate_population([offspring[i] for i in invalid])
+            if snapshot_sent is not None:
+                totals, _ = await asyncio.gather(evaluation, snapshot_sent)
+                snapshot_sent = None
+            else:
+                totals = await evaluation
+            self._fit_back[n_elite:][invalid] = totals
             
             population = elites + offspring
+            self._front, self._back = self._back, self._front
+            self._fit_front, self._fit_back = self._fit_back, self._fit_front
             
             # Statistics
-            fits = [ind.fitness.values[0] for ind in population]
-            best_ind = tools.selBest(population, 1)[0]
-            best_fit = best_ind.fitness.values[0]
+            fits = self._fit_front
+            # (a NaN total never counts as the best)
+            best_i = int(np.argmax(np.nan_to_num(fits, nan=-np.inf)))
+            best_ind = population[best_i]
+            best_fit = float(fits[best_i])
             
             if best_fit > best_ever_fitness:
                 best_ever_fitness = best_fit
-                best_ever = list(best_ind)
-                best_ever_result = self.evaluator.evaluate(best_ever)
+                best_ever = best_ind.tolist()
+                # Scored this run already; elitism keeps the best-scored genome
+                # in the population, so its result is among _best_results
+                best_ever_result = self._best_results[best_ind.tobytes()]
                 stagnation = 0
             else:
                 stagnation += 1
@@ -117,18 +250,18 @@ class EvolutionRunner:
             snapshot = {
                 "generation": gen,
                 "best_fitness": float(best_fit),
-                "avg_fitness": float(np.mean(fits)),
-                "worst_fitness": float(np.min(fits)),
-                "diversity": diversity_metric(population),
+                "avg_fitness": float(fits.mean()),
+                "worst_fitness": float(fits.min()),
+                "diversity": diversity_metric(self._front),
                 "best_genome": dict(zip(GENE_NAMES, [float(g) for g in best_ind])),
-                "best_scores": best_ever_result.get("scores", {}) if best_ever_result else {},
+                "best_scores": best_ever_result.get("scores", {}),
                 "population_size": len(population),
                 "stagnation": stagnation,
             }
             
-            # Callback
+            # Callback; awaited alongside the next generation's evaluation
             if self.on_generation:
-                await self.on_generation(snapshot)
+                snapshot_sent = asyncio.create_task(self.on_generation(snapshot))
             
             # Yield control to event loop
             await asyncio.sleep(0)
@@ -137,8 +270,11 @@ class EvolutionRunner:
             if stagnation > 20 and gen > 30:
                 break
         
+        if snapshot_sent is not None:
+            await snapshot_sent
+        
         # Final result
-        best_result = self.evaluator.evaluate(best_ever) if best_ever else {}
+        best_result = best_ever_result
         return {
             "total_generations": gen + 1 if 'gen' in dir() else 0,
             "best_genome": dict(zip(GENE_NAMES, [float(g) for g in best_ever])) if best_ever else {},
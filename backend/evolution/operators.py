@@ -1,114 +1,130 @@
 """Custom genetic algorithm operators for engine geometry evolution."""
 
-import random
 import math
 import numpy as np
-from backend.config import GENOME_BOUNDS
+from backend.config import GENOME_BOUNDS, GENOME_LO, GENOME_HI, GENOME_RANGE
+
+# Shared generator for the vectorized crossover/mutation draws
+_rng = np.random.default_rng()
 
 
 def feasibility_repair(individual, bounds=GENOME_BOUNDS):
-    """Clamp each gene to its feasible bounds and enforce geometric constraints."""
-    for i in range(min(len(individual), len(bounds))):
-        lo, hi = bounds[i]
-        individual[i] = max(lo, min(hi, individual[i]))
+    """Clamp each gene to its feasible bounds and enforce geometric constraints.
+
+    Accepts a list or ndarray individual and repairs it in place.
+    """
+    n = min(len(individual), len(bounds))
+    if bounds is GENOME_BOUNDS:
+        lo, hi = GENOME_LO[:n], GENOME_HI[:n]
+    else:
+        lo, hi = np.asarray(bounds[:n], dtype=float).T
+    # Bounds in one vectorized clip; the sequential constraints below then
+    # run on plain floats, which index far faster than numpy scalars
+    g = np.array(individual, dtype=float)
+    np.clip(g[:n], lo, hi, out=g[:n])
+    g = g.tolist()
 
     # Constraint: throat_diameter (gene 2) < chamber_diameter (gene 0)
-    if individual[2] >= individual[0]:
-        individual[2] = individual[0] * 0.6
+    if g[2] >= g[0]:
+        g[2] = g[0] * 0.6
 
     # Constraint: chamber_length >= chamber_diameter * 0.5
-    min_length = individual[0] * 0.5
-    if individual[1] < min_length:
-        individual[1] = min_length
+    min_length = g[0] * 0.5
+    if g[1] < min_length:
+        g[1] = min_length
 
     # Wall thickness constraints (genes 4-9): adjacent CPs within 3x ratio
-    for i in range(4, 9):
-        if individual[i + 1] > 0 and individual[i] / individual[i + 1] > 3.0:
-            avg = (individual[i] + individual[i + 1]) / 2.0
-            individual[i] = avg * 1.3
-            individual[i + 1] = avg * 0.7
-        elif individual[i] > 0 and individual[i + 1] / individual[i] > 3.0:
-            avg = (individual[i] + individual[i + 1]) / 2.0
-            individual[i] = avg * 0.7
-            individual[i + 1] = avg * 1.3
+    _enforce_adjacent_ratio(g, 4, 10)
 
     # Cooling channel constraints (genes 16-21, if genome is long enough)
-    if len(individual) >= 22:
+    if len(g) >= 22:
         # n_channels (gene 16) — round to integer
-        individual[16] = round(individual[16])
+        g[16] = round(g[16])
 
-        # channel_height must be <= min wall thickness * 0.8
-        min_wt = min(individual[4:10])
+        # channel_height must be <= min wall thickness * 0.8 (wall thickness
+        # is final from here on, so min_wt is reused for the height CPs below)
+        min_wt = min(g[4:10])
         max_channel_height = min_wt * 0.8
-        if individual[18] > max_channel_height:
-            individual[18] = max(max_channel_height, bounds[18][0])
+        if g[18] > max_channel_height:
+            g[18] = max(max_channel_height, bounds[18][0])
 
         # Total channel width must be <= 85% of throat circumference
-        throat_circumference = math.pi * individual[2]  # throat_diameter
-        total_channel_width = individual[16] * individual[17]  # n_channels * channel_width
+        throat_circumference = math.pi * g[2]  # throat_diameter
+        total_channel_width = g[16] * g[17]  # n_channels * channel_width
         if total_channel_width > 0.85 * throat_circumference:
             # Reduce n_channels or channel_width
-            max_width = 0.85 * throat_circumference / max(individual[16], 1)
-            individual[17] = max(min(individual[17], max_width), bounds[17][0])
+            max_width = 0.85 * throat_circumference / max(g[16], 1)
+            g[17] = max(min(g[17], max_width), bounds[17][0])
 
     # Channel height CP constraints (genes 22-24)
-    if len(individual) >= 25:
-        min_wt = min(individual[4:10])
+    if len(g) >= 25:
         max_ch = min_wt * 0.8
         for gi in range(22, 25):
-            individual[gi] = max(min(individual[gi], max_ch), bounds[gi][0])
+            g[gi] = max(min(g[gi], max_ch), bounds[gi][0])
 
         # Adjacent CPs within 3x ratio for smooth interpolation
-        for gi in range(22, 24):
-            if individual[gi + 1] > 0 and individual[gi] / individual[gi + 1] > 3.0:
-                avg = (individual[gi] + individual[gi + 1]) / 2.0
-                individual[gi] = avg * 1.3
-                individual[gi + 1] = avg * 0.7
-            elif individual[gi] > 0 and individual[gi + 1] / individual[gi] > 3.0:
-                avg = (individual[gi] + individual[gi + 1]) / 2.0
-                individual[gi] = avg * 0.7
-                individual[gi + 1] = avg * 1.3
+        _enforce_adjacent_ratio(g, 22, 25)
 
     # Injector gene constraints (genes 25-28)
-    if len(individual) >= 29:
+    if len(g) >= 29:
         # n_rings (gene 25) — round to integer
-        individual[25] = round(individual[25])
+        g[25] = round(g[25])
         # elements_per_ring (gene 26) — round to integer
-        individual[26] = round(individual[26])
+        g[26] = round(g[26])
 
         # Minimum orifice diameters for SLM printing (0.5mm)
-        individual[27] = max(individual[27], 0.0005)
-        individual[28] = max(individual[28], 0.0005)
+        g[27] = max(g[27], 0.0005)
+        g[28] = max(g[28], 0.0005)
 
         # Total orifice area must not exceed 60% of face area
         # Face area approximation using chamber radius
-        chamber_r = individual[0] / 2.0  # chamber_diameter / 2
+        chamber_r = g[0] / 2.0  # chamber_diameter / 2
         face_area = math.pi * chamber_r ** 2
-        n_rings = int(individual[25])
-        base_per_ring = int(individual[26])
-        total_elements = sum(base_per_ring * (k + 1) for k in range(n_rings))
-        fuel_area = total_elements * math.pi * (individual[27] / 2) ** 2
-        ox_area = total_elements * math.pi * (individual[28] / 2) ** 2
+        n_rings = int(g[25])
+        base_per_ring = int(g[26])
+        # Ring k holds base * (k + 1) elements: arithmetic series
+        total_elements = base_per_ring * n_rings * (n_rings + 1) // 2
+        fuel_area = total_elements * math.pi * (g[27] / 2) ** 2
+        ox_area = total_elements * math.pi * (g[28] / 2) ** 2
         total_orifice_area = fuel_area + ox_area
 
         if total_orifice_area > 0.6 * face_area and total_orifice_area > 0:
             scale = math.sqrt(0.6 * face_area / total_orifice_area)
-            individual[27] *= scale
-            individual[28] *= scale
-            individual[27] = max(individual[27], bounds[27][0])
-            individual[28] = max(individual[28], bounds[28][0])
+            g[27] *= scale
+            g[28] *= scale
+            g[27] = max(g[27], bounds[27][0])
+            g[28] = max(g[28], bounds[28][0])
 
+    individual[:] = g
     return individual
 
 
+def _enforce_adjacent_ratio(g, start, stop, max_ratio=3.0):
+    """Pull adjacent control points g[start:stop] to within max_ratio of each other.
+
+    Pairs are fixed left to right and each fix feeds the next comparison, so
+    this stays a sequential loop rather than a vectorized mask.
+    """
+    for i in range(start, stop - 1):
+        if g[i + 1] > 0 and g[i] / g[i + 1] > max_ratio:
+            avg = (g[i] + g[i + 1]) / 2.0
+            g[i] = avg * 1.3
+            g[i + 1] = avg * 0.7
+        elif g[i] > 0 and g[i + 1] / g[i] > max_ratio:
+            avg = (g[i] + g[i + 1]) / 2.0
+            g[i] = avg * 0.7
+            g[i + 1] = avg * 1.3
+
+
 def blx_alpha_crossover(ind1, ind2, alpha=0.5):
     """BLX-alpha crossover: blend genes with exploration range."""
-    for i in range(len(ind1)):
-        lo = min(ind1[i], ind2[i])
-        hi = max(ind1[i], ind2[i])
-        spread = alpha * (hi - lo)
-        ind1[i] = random.uniform(lo - spread, hi + spread)
-        ind2[i] = random.uniform(lo - spread, hi + spread)
+    a = np.asarray(ind1, dtype=float)
+    b = np.asarray(ind2, dtype=float)
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    spread = alpha * (hi - lo)
+    ind1[:] = _rng.uniform(lo - spread, hi + spread)
+    ind2[:] = _rng.uniform(lo - spread, hi + spread)
 
     feasibility_repair(ind1)
     feasibility_repair(ind2)
@@ -117,14 +133,28 @@ def blx_alpha_crossover(ind1, ind2, alpha=0.5):
 
 def gaussian_mutation(individual, sigma_fraction=0.1, indpb=0.2, generation=0, max_generations=100):
     """Per-gene Gaussian mutation with adaptive sigma."""
+    gaussian_mutation_population([individual], sigma_fraction, indpb, generation, max_generations)
+    return (individual,)
+
+
+def gaussian_mutation_population(individuals, sigma_fraction=0.1, indpb=0.2,
+                                 generation=0, max_generations=100):
+    """Gaussian-mutate several individuals in place from one batch of random draws.
+
+    The mutation masks and noise for all individuals come from a single
+    (k, n_genes) draw; only the feasibility repair runs per individual.
+    """
+    if not individuals:
+        return individuals
     decay = 1.0 - 0.9 * (generation / max(max_generations, 1))
 
-    for i in range(min(len(individual), len(GENOME_BOUNDS))):
-        if random.random() < indpb:
-            lo, hi = GENOME_BOUNDS[i]
-            gene_range = hi - lo
-            sigma = sigma_fraction * gene_range * decay
-            individual[i] += random.gauss(0, sigma)
+    n = min(len(individuals[0]), len(GENOME_BOUNDS))
+    sigmas = sigma_fraction * decay * GENOME_RANGE[:n]
+    shape = (len(individuals), n)
+    mutate = _rng.random(shape) < indpb
+    noise = np.where(mutate, _rng.normal(0.0, sigmas, size=shape), 0.0)
 
-    feasibility_repair(individual)
-    return (individual,)
+    for individual, delta in zip(individuals, noise):
+        individual[:n] = np.asarray(individual[:n], dtype=float) + delta
+        feasibility_repair(individual)
+    return individuals
@@ -1,15 +1,22 @@
 """Population initialization and diversity tracking."""
 
 import numpy as np
+from scipy.spatial.distance import pdist
 from scipy.stats import qmc
-from backend.config import GENOME_BOUNDS
+from backend.config import GENOME_BOUNDS, GENOME_DTYPE, GENOME_LO, GENOME_RANGE
 
+# Per-gene normalization span (fixed genes divide by 1 instead of 0)
+_NORM_RANGE = np.where(GENOME_RANGE == 0, 1.0, GENOME_RANGE)
+# Rows sampled for the diversity estimate on large populations
+_DIVERSITY_SAMPLE = 64
+_rng = np.random.default_rng()
 
-def initialize_population_lhs(size: int, bounds=GENOME_BOUNDS) -> list:
+
+def initialize_population_lhs(size: int, bounds=GENOME_BOUNDS) -> np.ndarray:
     """Initialize population using Latin Hypercube Sampling.
     
     Provides good coverage of the genome space.
-    Returns list of genome vectors (list of floats).
+    Returns array of shape (size, n_genes), one genome per row.
     """
     d = len(bounds)
     sampler = qmc.LatinHypercube(d=d)
@@ -18,9 +25,7 @@ def initialize_population_lhs(size: int, bounds=GENOME_BOUNDS) -> list:
     l_bounds = [b[0] for b in bounds]
     u_bounds = [b[1] for b in bounds]
     
-    scaled = qmc.scale(sample, l_bounds, u_bounds)
-    
-    return [list(row) for row in scaled]
+    return qmc.scale(sample, l_bounds, u_bounds).astype(GENOME_DTYPE, copy=False)
 
 
 def diversity_metric(population) -> float:
@@ -31,23 +36,16 @@ def diversity_metric(population) -> float:
     if len(population) < 2:
         return 0.0
     
-    genomes = np.array([list(ind) for ind in population])
+    genomes = np.asarray(population, dtype=float)
     
-    # Normalize each gene to [0, 1]
-    bounds = np.array(GENOME_BOUNDS)
-    ranges = bounds[:, 1] - bounds[:, 0]
-    ranges[ranges == 0] = 1.0
-    normalized = (genomes - bounds[:, 0]) / ranges
+    # Large populations: all pairs within a random subset of rows
+    n = len(genomes)
+    if n > _DIVERSITY_SAMPLE:
+        genomes = genomes[_rng.choice(n, size=_DIVERSITY_SAMPLE, replace=False)]
     
-    # Sample pairs for efficiency (max 500 pairs)
-    n = len(population)
-    if n > 32:
-        indices = np.random.choice(n, size=(500, 2), replace=True)
-        diffs = normalized[indices[:, 0]] - normalized[indices[:, 1]]
-        distances = np.sqrt(np.sum(diffs ** 2, axis=1))
-    else:
-        from scipy.spatial.distance import pdist
-        distances = pdist(normalized)
+    # Normalize each gene to [0, 1]
+    normalized = (genomes - GENOME_LO) / _NORM_RANGE
+    distances = pdist(normalized)
     
     return float(np.mean(distances))
 
@@ -57,8 +55,6 @@ def inject_known_designs(population, presets: list):
     
     presets: list of genome vectors (list of floats)
     """
-    for i, preset in enumerate(presets):
-        if i < len(population):
-            for j in range(len(preset)):
-                population[i][j] = preset[j]
+    for i, preset in enumerate(presets[:len(population)]):
+        population[i][:len(preset)] = preset
     return population
@@ -1,5 +1,6 @@
 """Nozzle contour generation: convergent section, Rao bell, and Bezier curves."""
 
+import functools
 import numpy as np
 import math
 
@@ -37,32 +38,25 @@ def convergent_section(r_chamber: float, r_throat: float, half_angle_deg: float,
     if straight_length < 0:
         straight_length = 0
     
-    points = []
     n_straight = max(num_points // 2, 5)
-    n_arc = num_points - n_straight
+    n_arc = max(num_points - n_straight, 0)
     
     # Straight cone section
-    for i in range(n_straight):
-        t = i / max(n_straight - 1, 1)
-        x = t * straight_length
-        r = r_chamber - x * math.tan(half_angle)
-        points.append([x, r])
-    
-    # Circular arc blending into throat
-    for i in range(n_arc):
-        t = i / max(n_arc - 1, 1)
-        angle = math.pi / 2 + half_angle - t * (math.pi / 2 + half_angle)
-        # Arc center at (straight_length + x_tangent_offset, r_throat + r_arc)
-        x_center = cone_length
-        y_center = r_throat + r_arc
-        x = x_center - r_arc * math.sin(angle - math.pi / 2 + half_angle)
-        # Remap: at t=0, angle gives start of arc; at t=1, angle=0 gives throat
-        theta = half_angle * (1 - t)
-        x = cone_length - r_arc * math.sin(theta)
-        r = r_throat + r_arc * (1 - math.cos(theta))
-        points.append([x, r])
-    
-    return np.array(points)
+    t = np.arange(n_straight) / max(n_straight - 1, 1)
+    x_cone = t * straight_length
+    r_cone = r_chamber - x_cone * math.tan(half_angle)
+    
+    # Circular arc blending into throat; arc centre at (cone_length, r_throat + r_arc).
+    # theta runs from half_angle (tangent to the cone) down to 0 (the throat)
+    t = np.arange(n_arc) / max(n_arc - 1, 1)
+    theta = half_angle * (1 - t)
+    x_arc = cone_length - r_arc * np.sin(theta)
+    r_arc_pts = r_throat + r_arc * (1 - np.cos(theta))
+    
+    return np.column_stack([
+        np.concatenate([x_cone, x_arc]),
+        np.concatenate([r_cone, r_arc_pts]),
+    ])
 
 
 def rao_bell_nozzle(r_throat: float, expansion_ratio: float, bell_fraction: float = 80.0,
@@ -118,17 +112,7 @@ def rao_bell_nozzle(r_throat: float, expansion_ratio: float, bell_fraction: floa
     p3 = np.array([x_end, r_end])
     p2 = p3 - t2 * np.array([math.cos(theta_e), math.sin(theta_e)])
     
-    # Generate Bezier curve
-    points = []
-    for i in range(num_points):
-        t = i / max(num_points - 1, 1)
-        pt = ((1 - t) ** 3 * p0 +
-              3 * (1 - t) ** 2 * t * p1 +
-              3 * (1 - t) * t ** 2 * p2 +
-              t ** 3 * p3)
-        points.append(pt)
-    
-    return np.array(points)
+    return _cubic_bezier(p0, p1, p2, p3, num_points)
 
 
 def cubic_bezier_contour(control_points: list, num_points: int = 80) -> np.ndarray:
@@ -138,15 +122,29 @@ def cubic_bezier_contour(control_points: list, num_points: int = 80) -> np.ndarr
     Returns array of shape (num_points, 2).
     """
     cp = np.array(control_points)
-    points = []
-    for i in range(num_points):
-        t = i / max(num_points - 1, 1)
-        pt = ((1 - t) ** 3 * cp[0] +
-              3 * (1 - t) ** 2 * t * cp[1] +
-              3 * (1 - t) * t ** 2 * cp[2] +
-              t ** 3 * cp[3])
-        points.append(pt)
-    return np.array(points)
+    return _cubic_bezier(cp[0], cp[1], cp[2], cp[3], num_points)
+
+
+@functools.lru_cache(maxsize=8)
+def _bernstein(num_points: int) -> np.ndarray:
+    """Cubic Bernstein weights at num_points evenly spaced t in [0, 1].
+
+    Returns a read-only (num_points, 4) table, shared by every call with the
+    same resolution.
+    """
+    t = np.arange(num_points) / max(num_points - 1, 1)
+    omt = 1.0 - t
+    weights = np.stack([omt ** 3, 3 * omt ** 2 * t, 3 * omt * t ** 2, t ** 3], axis=1)
+    weights.setflags(write=False)
+    return weights
+
+
+def _cubic_bezier(p0, p1, p2, p3, num_points: int) -> np.ndarray:
+    """Sample a cubic Bezier at num_points evenly spaced t in [0, 1].
+
+    One (num_points, 4) @ (4, 2) product against the cached Bernstein table.
+    """
+    return _bernstein(num_points) @ np.array([p0, p1, p2, p3], dtype=float)
 
 
 def full_engine_contour(chamber_diameter: float, chamber_length: float,
@@ -171,34 +169,40 @@ def full_engine_contour(chamber_diameter: float, chamber_length: float,
     n_convergent = max(num_stations // 4, 20)
     n_divergent = num_stations - n_chamber - n_convergent
     
-    all_points = []
-    
     # Zone 0: Combustion chamber (cylindrical)
-    for i in range(n_chamber):
-        t = i / max(n_chamber - 1, 1)
-        x = t * chamber_length
-        all_points.append([x, r_chamber, 0])
+    t = np.arange(n_chamber) / max(n_chamber - 1, 1)
+    chamber = np.column_stack([t * chamber_length, np.full(n_chamber, r_chamber), np.zeros(n_chamber)])
     
     # Zone 1+2: Convergent section to throat
     conv = convergent_section(r_chamber, r_throat, convergence_half_angle,
                               throat_upstream_radius_ratio, n_convergent)
     x_offset = chamber_length
-    for i, (cx, cr) in enumerate(conv):
-        zone = 1 if i < len(conv) * 0.7 else 2
-        all_points.append([cx + x_offset, cr, zone])
+    conv_zone = np.where(np.arange(len(conv)) < len(conv) * 0.7, 1, 2)
+    convergent = np.column_stack([conv[:, 0] + x_offset, conv[:, 1], conv_zone])
     
     # Zone 3: Divergent nozzle (Rao bell)
-    throat_x = all_points[-1][0]
+    throat_x = convergent[-1, 0]
     div = rao_bell_nozzle(r_throat, expansion_ratio, bell_fraction,
                           throat_downstream_radius_ratio, n_divergent)
-    for dx, dr in div:
-        all_points.append([dx + throat_x, dr, 3])
+    divergent = np.column_stack([div[:, 0] + throat_x, div[:, 1], np.full(len(div), 3)])
     
-    result = np.array(all_points)
+    result = np.concatenate([chamber, convergent, divergent])
     
     # Ensure monotonically increasing x
-    for i in range(1, len(result)):
-        if result[i, 0] <= result[i - 1, 0]:
-            result[i, 0] = result[i - 1, 0] + 1e-6
+    _make_strictly_increasing(result[:, 0])
     
     return result
+
+
+def _make_strictly_increasing(x: np.ndarray, eps: float = 1e-6):
+    """Nudge x in place so every sample exceeds the previous one by at least eps.
+
+    Only the few non-increasing spots (zone joins) are visited, each followed
+    forward while the nudge keeps cascading, so the result matches a full
+    left-to-right sweep exactly.
+    """
+    n = len(x)
+    for i in (np.flatnonzero(x[1:] <= x[:-1]) + 1).tolist():
+        while i < n and x[i] <= x[i - 1]:
+            x[i] = x[i - 1] + eps
+            i += 1
@@ -6,6 +6,7 @@ combustion stability).
 """
 
 import math
+import numpy as np
 from dataclasses import dataclass, field
 
 
@@ -17,26 +18,35 @@ PROPELLANT_PROPS = {
     "lh2":  {"density": 70.8,   "surface_tension": 0.002},
 }
 
+# PROPELLANT_PROPS flattened to (density, surface_tension) for the physics path
+_PROPS = {k: (v["density"], v["surface_tension"]) for k, v in PROPELLANT_PROPS.items()}
 
-@dataclass
-class InjectorOrifice:
-    y_center: float
-    z_center: float
-    radius: float
-    orifice_type: str       # 'fuel' or 'oxidizer'
-    ring_index: int
-    element_index: int
 
+def _empty(dtype=float):
+    return field(default_factory=lambda: np.empty(0, dtype=dtype))
 
-@dataclass
+
+@dataclass(slots=True)
 class InjectorLayout:
-    orifices: list = field(default_factory=list)
+    """Orifice layout stored as parallel arrays, one entry per orifice."""
+    y: np.ndarray = _empty()
+    z: np.ndarray = _empty()
+    radius: np.ndarray = _empty()
+    is_fuel: np.ndarray = _empty(bool)
+    ring_index: np.ndarray = _empty(np.int32)
+    element_index: np.ndarray = _empty(np.int32)
     face_x: float = 0.0
     face_radius: float = 0.04
     n_rings: int = 0
     elements_per_ring: list = field(default_factory=list)
     total_fuel_area_m2: float = 0.0
     total_ox_area_m2: float = 0.0
+    n_fuel: int = 0
+    n_ox: int = 0
+
+    @property
+    def n_orifices(self) -> int:
+        return len(self.y)
 
 
 def generate_injector_layout(config, face_x: float, face_radius: float) -> InjectorLayout:
@@ -57,77 +67,68 @@ def generate_injector_layout(config, face_x: float, face_radius: float) -> Injec
     first_frac = config.first_ring_fraction
     spacing_frac = config.ring_spacing_fraction
 
-    orifices = []
-    elements_per_ring = []
-    n_fuel = 0
-    n_ox = 0
-
     # Radial offset between fuel and ox holes in an element
     radial_offset = 1.5 * max(config.fuel_orifice_diameter, config.ox_orifice_diameter)
 
     # Edge margin to keep orifices away from face boundary
     edge_margin = max(r_fuel, r_ox) + 0.0003  # 0.3mm clearance
 
-    for k in range(n_rings):
-        # Ring radial position
-        if n_rings == 1:
-            r_ring = first_frac * face_radius
-        else:
-            r_ring = (first_frac + k * spacing_frac) * face_radius
-
-        # Clamp ring within face
-        r_ring = min(r_ring, face_radius - edge_margin)
-        if r_ring < edge_margin:
-            continue
-
-        # Number of elements in this ring (linear scaling)
-        n_elem = base * (k + 1)
-        elements_per_ring.append(n_elem)
-
-        # Stagger odd rings by half angular spacing
-        angular_offset = (math.pi / n_elem) if (k % 2 == 1) else 0.0
-
-        for j in range(n_elem):
-            theta = 2.0 * math.pi * j / n_elem + angular_offset
-
-            # Fuel orifice at ring radius
-            y_f = r_ring * math.cos(theta)
-            z_f = r_ring * math.sin(theta)
-
-            # Oxidizer orifice offset radially inward
-            r_ox_pos = max(r_ring - radial_offset, edge_margin)
-            y_o = r_ox_pos * math.cos(theta)
-            z_o = r_ox_pos * math.sin(theta)
-
-            # Validate fuel orifice within face
-            dist_f = math.sqrt(y_f**2 + z_f**2)
-            if dist_f + r_fuel <= face_radius:
-                orifices.append(InjectorOrifice(
-                    y_center=y_f, z_center=z_f, radius=r_fuel,
-                    orifice_type='fuel', ring_index=k, element_index=j,
-                ))
-                n_fuel += 1
-
-            # Validate ox orifice within face
-            dist_o = math.sqrt(y_o**2 + z_o**2)
-            if dist_o + r_ox <= face_radius:
-                orifices.append(InjectorOrifice(
-                    y_center=y_o, z_center=z_o, radius=r_ox,
-                    orifice_type='oxidizer', ring_index=k, element_index=j,
-                ))
-                n_ox += 1
-
-    total_fuel_area = n_fuel * math.pi * r_fuel**2
-    total_ox_area = n_ox * math.pi * r_ox**2
+    # Ring radial positions (a single ring sits at first_frac), clamped
+    # within the face; rings pushed inside the edge margin are dropped
+    k = np.arange(n_rings)
+    r_ring = np.minimum((first_frac + k * spacing_frac) * face_radius, face_radius - edge_margin)
+    ring_ok = r_ring >= edge_margin
+    k, r_ring = k[ring_ok], r_ring[ring_ok]
+
+    # Number of elements in each ring (linear scaling)
+    n_elem = base * (k + 1)
+    elements_per_ring = n_elem.tolist()
+
+    # Every element of every ring in one pass: its ring, index within the ring
+    # and angle, with odd rings staggered by half an angular spacing
+    ring_of = np.repeat(np.arange(len(k)), n_elem)
+    n_e = n_elem[ring_of]
+    j = np.arange(len(ring_of)) - np.repeat(np.cumsum(n_elem) - n_elem, n_elem)
+    angular_offset = np.where(k % 2 == 1, np.pi / np.maximum(n_elem, 1), 0.0)[ring_of]
+    theta = 2.0 * np.pi * j / n_e + angular_offset
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+
+    # Fuel orifices at ring radius, oxidizer offset radially inward
+    # (radii are per-ring constants, spread to elements by ring_of)
+    r_f = r_ring[ring_of]
+    r_ox_pos = np.maximum(r_ring - radial_offset, edge_margin)[ring_of]
+
+    # Interleave each element's fuel and ox orifice, then keep the ones
+    # that lie within the face
+    y = np.column_stack([r_f * cos_t, r_ox_pos * cos_t]).ravel()
+    z = np.column_stack([r_f * sin_t, r_ox_pos * sin_t]).ravel()
+    radius = np.tile([r_fuel, r_ox], len(ring_of))
+    keep = np.hypot(y, z) + radius <= face_radius
+
+    arrays = {
+        "y": y[keep],
+        "z": z[keep],
+        "radius": radius[keep],
+        "is_fuel": np.tile([True, False], len(ring_of))[keep],
+        "ring_index": np.repeat(k[ring_of], 2)[keep].astype(np.int32),
+        "element_index": np.repeat(j, 2)[keep].astype(np.int32),
+    }
+    n_fuel = int(arrays["is_fuel"].sum())
+    n_ox = len(arrays["is_fuel"]) - n_fuel
+    total_fuel_area = n_fuel * math.pi * r_fuel * r_fuel
+    total_ox_area = n_ox * math.pi * r_ox * r_ox
 
     return InjectorLayout(
-        orifices=orifices,
+        **arrays,
         face_x=face_x,
         face_radius=face_radius,
         n_rings=n_rings,
         elements_per_ring=elements_per_ring,
         total_fuel_area_m2=total_fuel_area,
         total_ox_area_m2=total_ox_area,
+        n_fuel=n_fuel,
+        n_ox=n_ox,
     )
 
 
@@ -158,75 +159,125 @@ def compute_injection_physics(
     Returns:
         Dict with injection velocities, pressure drops, atomization quality, etc.
     """
-    fuel_props = PROPELLANT_PROPS.get(fuel_type, PROPELLANT_PROPS["rp1"])
-    ox_props = PROPELLANT_PROPS.get(ox_type, PROPELLANT_PROPS["lox"])
+    metrics = _injection_metrics(
+        layout.total_fuel_area_m2, layout.total_ox_area_m2, P_chamber, mdot_total,
+        mixture_ratio, Cd, fuel_type, ox_type, d_fuel, d_ox,
+    )
+    result = {k: float(v) for k, v in metrics.items()}
+    result.update({
+        "n_fuel_orifices": layout.n_fuel,
+        "n_ox_orifices": layout.n_ox,
+        "total_fuel_area_mm2": float(layout.total_fuel_area_m2 * 1e6),
+        "total_ox_area_mm2": float(layout.total_ox_area_m2 * 1e6),
+    })
+    return result
 
-    rho_fuel = fuel_props["density"]
-    rho_ox = ox_props["density"]
-    sigma_fuel = fuel_props["surface_tension"]
-    sigma_ox = ox_props["surface_tension"]
+
+def compute_injection_physics_batch(
+    layouts: list,
+    P_chamber,
+    mdot_total,
+    mixture_ratio=2.3,
+    Cd=0.65,
+    fuel_type: str = "rp1",
+    ox_type: str = "lox",
+    d_fuel=0.001,
+    d_ox=0.0012,
+) -> dict:
+    """compute_injection_physics for many layouts at once.
+
+    Numeric arguments may be scalars or arrays broadcastable against
+    len(layouts). Returns the same keys as compute_injection_physics, each
+    holding an array with one entry per layout.
+    """
+    fuel_area = np.array([layout.total_fuel_area_m2 for layout in layouts])
+    ox_area = np.array([layout.total_ox_area_m2 for layout in layouts])
+    metrics = _injection_metrics(
+        fuel_area, ox_area, np.asarray(P_chamber, dtype=float), np.asarray(mdot_total, dtype=float),
+        np.asarray(mixture_ratio, dtype=float), np.asarray(Cd, dtype=float),
+        fuel_type, ox_type, np.asarray(d_fuel, dtype=float), np.asarray(d_ox, dtype=float),
+    )
+    result = {k: np.broadcast_to(v, fuel_area.shape).astype(float) for k, v in metrics.items()}
+    result.update({
+        "n_fuel_orifices": np.array([layout.n_fuel for layout in layouts]),
+        "n_ox_orifices": np.array([layout.n_ox for layout in layouts]),
+        "total_fuel_area_mm2": fuel_area * 1e6,
+        "total_ox_area_mm2": ox_area * 1e6,
+    })
+    return result
+
+
+def _injection_metrics(total_fuel_area, total_ox_area, P_chamber, mdot_total,
+                       mixture_ratio, Cd, fuel_type, ox_type, d_fuel, d_ox) -> dict:
+    """Injection metrics from aggregate orifice areas.
+
+    Written with NumPy ufuncs only, so the numeric arguments can be Python
+    floats or broadcastable arrays alike.
+    """
+    rho_fuel, sigma_fuel = _PROPS.get(fuel_type, _PROPS["rp1"])
+    rho_ox, sigma_ox = _PROPS.get(ox_type, _PROPS["lox"])
 
     # Split total mass flow
     mdot_fuel = mdot_total / (1.0 + mixture_ratio)
     mdot_ox = mdot_total * mixture_ratio / (1.0 + mixture_ratio)
 
-    A_fuel = max(layout.total_fuel_area_m2, 1e-10)
-    A_ox = max(layout.total_ox_area_m2, 1e-10)
+    A_fuel = np.maximum(total_fuel_area, 1e-10)
+    A_ox = np.maximum(total_ox_area, 1e-10)
+
+    # Effective mass flux through each orifice set
+    G_fuel = mdot_fuel / (Cd * A_fuel)
+    G_ox = mdot_ox / (Cd * A_ox)
 
     # Injection velocities
-    v_fuel = mdot_fuel / (rho_fuel * Cd * A_fuel)
-    v_ox = mdot_ox / (rho_ox * Cd * A_ox)
+    v_fuel = G_fuel / rho_fuel
+    v_ox = G_ox / rho_ox
 
     # Pressure drops (incompressible orifice equation)
-    dP_fuel = (mdot_fuel / (Cd * A_fuel))**2 / (2.0 * rho_fuel)
-    dP_ox = (mdot_ox / (Cd * A_ox))**2 / (2.0 * rho_ox)
+    dP_fuel = G_fuel * G_fuel / (2.0 * rho_fuel)
+    dP_ox = G_ox * G_ox / (2.0 * rho_ox)
 
-    dP_fuel_ratio = dP_fuel / max(P_chamber, 1.0)
-    dP_ox_ratio = dP_ox / max(P_chamber, 1.0)
+    P_ref = np.maximum(P_chamber, 1.0)
+    dP_fuel_ratio = dP_fuel / P_ref
+    dP_ox_ratio = dP_ox / P_ref
 
     # Feed pressures required
     P_fuel_feed = P_chamber + dP_fuel
     P_ox_feed = P_chamber + dP_ox
 
     # Weber numbers (atomization quality indicator)
-    We_fuel = rho_fuel * v_fuel**2 * d_fuel / max(sigma_fuel, 1e-6)
-    We_ox = rho_ox * v_ox**2 * d_ox / max(sigma_ox, 1e-6)
+    We_fuel = rho_fuel * v_fuel * v_fuel * d_fuel / max(sigma_fuel, 1e-6)
+    We_ox = rho_ox * v_ox * v_ox * d_ox / max(sigma_ox, 1e-6)
 
-    atomization_quality = min((We_fuel + We_ox) / 2000.0, 1.0)
+    atomization_quality = np.minimum((We_fuel + We_ox) / 2000.0, 1.0)
 
     # Momentum ratio (ideal ≈ 1.0 for unlike doublets)
-    mom_fuel = rho_fuel * v_fuel**2
-    mom_ox = rho_ox * v_ox**2
-    momentum_ratio = mom_fuel / max(mom_ox, 1e-6)
+    mom_fuel = rho_fuel * v_fuel * v_fuel
+    mom_ox = rho_ox * v_ox * v_ox
+    momentum_ratio = mom_fuel / np.maximum(mom_ox, 1e-6)
 
     # Stability margin based on pressure drop ratios
-    # Good: 0.15-0.30 of Pc for both fuel and ox
+    # Good: 0.15-0.30 of Pc for both fuel and ox; low dP is penalized
+    # linearly, high dP falls off to zero at 0.70
     avg_dp_ratio = (dP_fuel_ratio + dP_ox_ratio) / 2.0
-    if avg_dp_ratio < 0.10:
-        stability_margin = avg_dp_ratio / 0.10  # penalize low dP
-    elif avg_dp_ratio > 0.35:
-        stability_margin = max(0.0, 1.0 - (avg_dp_ratio - 0.35) / 0.35)
-    else:
-        stability_margin = 1.0  # in the sweet spot
+    stability_margin = np.where(
+        avg_dp_ratio < 0.10, avg_dp_ratio / 0.10,
+        np.where(avg_dp_ratio > 0.35, np.maximum(0.0, 1.0 - (avg_dp_ratio - 0.35) / 0.35), 1.0),
+    )
 
     return {
-        "mdot_fuel_kg_s": float(mdot_fuel),
-        "mdot_ox_kg_s": float(mdot_ox),
-        "v_fuel_m_s": float(v_fuel),
-        "v_ox_m_s": float(v_ox),
-        "dP_fuel_Pa": float(dP_fuel),
-        "dP_ox_Pa": float(dP_ox),
-        "dP_fuel_ratio": float(dP_fuel_ratio),
-        "dP_ox_ratio": float(dP_ox_ratio),
-        "P_fuel_feed_Pa": float(P_fuel_feed),
-        "P_ox_feed_Pa": float(P_ox_feed),
-        "We_fuel": float(We_fuel),
-        "We_ox": float(We_ox),
-        "atomization_quality": float(atomization_quality),
-        "momentum_ratio": float(momentum_ratio),
-        "stability_margin": float(stability_margin),
-        "n_fuel_orifices": len([o for o in layout.orifices if o.orifice_type == 'fuel']),
-        "n_ox_orifices": len([o for o in layout.orifices if o.orifice_type == 'oxidizer']),
-        "total_fuel_area_mm2": float(layout.total_fuel_area_m2 * 1e6),
-        "total_ox_area_mm2": float(layout.total_ox_area_m2 * 1e6),
+        "mdot_fuel_kg_s": mdot_fuel,
+        "mdot_ox_kg_s": mdot_ox,
+        "v_fuel_m_s": v_fuel,
+        "v_ox_m_s": v_ox,
+        "dP_fuel_Pa": dP_fuel,
+        "dP_ox_Pa": dP_ox,
+        "dP_fuel_ratio": dP_fuel_ratio,
+        "dP_ox_ratio": dP_ox_ratio,
+        "P_fuel_feed_Pa": P_fuel_feed,
+        "P_ox_feed_Pa": P_ox_feed,
+        "We_fuel": We_fuel,
+        "We_ox": We_ox,
+        "atomization_quality": atomization_quality,
+        "momentum_ratio": momentum_ratio,
+        "stability_margin": stability_margin,
     }
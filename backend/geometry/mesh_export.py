@@ -1,59 +1,94 @@
 """Convert 2D engine profile to 3D mesh data for Three.js frontend."""
 
+import functools
 import math
 import numpy as np
 from backend.geometry.parametric_engine import ParametricEngine
 from backend.geometry.injector import generate_injector_layout
 
 
-def profile_to_lathe_data(profile_2d: np.ndarray, num_circumferential: int = 64) -> dict:
+def profile_to_lathe_data(profile_2d: np.ndarray, num_circumferential: int = 64,
+                          need_normals: bool = True, need_uvs: bool = True) -> dict:
     """Convert a 2D axial profile to 3D lathe vertices.
 
     profile_2d: array of shape (N, 2+) with columns [x, r, ...]
-    Returns dict with 'positions' (flat float list) and 'indices' (flat int list).
+    Returns dict with flat 'positions', 'normals', 'uvs' (float32) and
+    'indices' (uint32) arrays, ready for a Three.js BufferGeometry.
+    'normals' / 'uvs' are omitted when need_normals / need_uvs is False.
     """
-    n_axial = len(profile_2d)
+    return profile_to_lathe_data_batch(
+        np.asarray(profile_2d)[None, :, :2], num_circumferential, need_normals, need_uvs
+    )[0]
+
+
+def profile_to_lathe_data_batch(profiles_2d: np.ndarray, num_circumferential: int = 64,
+                                need_normals: bool = True, need_uvs: bool = True) -> list[dict]:
+    """Lathe K profiles of the same station count in one pass.
+
+    profiles_2d: array of shape (K, N, 2) with columns [x, r]
+    Returns K dicts as profile_to_lathe_data does; all of them share the
+    same (read-only) normals, uvs and indices arrays.
+    """
+    n_meshes, n_axial = profiles_2d.shape[:2]
     n_circ = num_circumferential
+    cos_t, sin_t, normals, uvs, indices = _lathe_topology(n_axial, n_circ)
+
+    # Vertex (k, i, j) is mesh k, station i at angle j; laid out [k, i, j, component]
+    x = profiles_2d[:, :, 0, None]
+    r = profiles_2d[:, :, 1, None]
+    positions = np.empty((n_meshes, n_axial, n_circ + 1, 3), dtype=np.float32)
+    positions[..., 0] = x
+    positions[..., 1] = r * cos_t
+    positions[..., 2] = r * sin_t
+
+    meshes = []
+    for k in range(n_meshes):
+        mesh = {
+            "positions": positions[k].ravel(),
+            "indices": indices,
+            "vertex_count": n_axial * (n_circ + 1),
+            "index_count": len(indices),
+        }
+        if need_normals:
+            mesh["normals"] = normals
+        if need_uvs:
+            mesh["uvs"] = uvs
+        meshes.append(mesh)
+    return meshes
+
+
+@functools.lru_cache(maxsize=8)
+def _lathe_topology(n_axial: int, n_circ: int) -> tuple:
+    """Profile-independent parts of a lathe mesh for an (n_axial, n_circ) grid.
+
+    Returns (cos_t, sin_t, normals, uvs, indices); the flat normals, uvs and
+    indices are read-only and shared by every mesh of the same size.
+    """
+    theta = 2 * math.pi * np.arange(n_circ + 1) / n_circ
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
 
-    positions = []
-    normals = []
-    uvs = []
-
-    for i in range(n_axial):
-        x = float(profile_2d[i, 0])
-        r = float(profile_2d[i, 1])
-        u = i / max(n_axial - 1, 1)
-
-        for j in range(n_circ + 1):
-            theta = 2 * math.pi * j / n_circ
-            y = r * math.cos(theta)
-            z = r * math.sin(theta)
-            positions.extend([x, y, z])
-
-            ny = math.cos(theta)
-            nz = math.sin(theta)
-            normals.extend([0, ny, nz])
-
-            v = j / n_circ
-            uvs.extend([u, v])
-
-    indices = []
-    for i in range(n_axial - 1):
-        for j in range(n_circ):
-            a = i * (n_circ + 1) + j
-            b = a + 1
-            c = (i + 1) * (n_circ + 1) + j
-            d = c + 1
-            indices.extend([a, c, b, b, c, d])
-
-    return {
-        "positions": positions,
-        "normals": normals,
-        "uvs": uvs,
-        "indices": indices,
-        "vertex_count": n_axial * (n_circ + 1),
-        "index_count": len(indices),
-    }
+    normals = np.zeros((n_axial, n_circ + 1, 3), dtype=np.float32)
+    normals[:, :, 1] = cos_t
+    normals[:, :, 2] = sin_t
+
+    uvs = np.empty((n_axial, n_circ + 1, 2), dtype=np.float32)
+    uvs[:, :, 0] = (np.arange(n_axial) / max(n_axial - 1, 1))[:, None]
+    uvs[:, :, 1] = np.arange(n_circ + 1) / n_circ
+
+    # Built in uint32 throughout, so no int64 temporaries are made
+    stride = np.uint32(n_circ + 1)
+    a = (np.arange(n_axial - 1, dtype=np.uint32)[:, None] * stride
+         + np.arange(n_circ, dtype=np.uint32)).ravel()
+    b = a + np.uint32(1)
+    c = a + stride
+    d = c + np.uint32(1)
+    indices = np.stack([a, c, b, b, c, d], axis=-1).ravel()
+
+    arrays = (cos_t, sin_t, normals.ravel(), uvs.ravel(), indices)
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
 
 
 def export_for_frontend(engine: ParametricEngine, num_circumferential: int = 64,
@@ -61,29 +96,38 @@ def export_for_frontend(engine: ParametricEngine, num_circumferential: int = 64,
     """Export full engine mesh data for the frontend."""
     profile = engine.generate_profile()
 
-    inner_profile = profile[:, :2]
-    outer_profile = np.column_stack([profile[:, 0], profile[:, 2]])
+    # Inner and outer wall [x, r] profiles, gathered once: lathed in float64,
+    # and shipped as float32 since everything below only drives rendering
+    walls = np.empty((2, len(profile), 2))
+    walls[:, :, 0] = profile[:, 0]
+    walls[:, :, 1] = profile[:, 1:3].T
+    inner_profile, outer_profile = walls.astype(np.float32)
 
-    inner_mesh = profile_to_lathe_data(inner_profile, num_circumferential)
-    outer_mesh = profile_to_lathe_data(outer_profile, num_circumferential)
+    # The frontend lathes profile_2d itself and never reads the wall normals
+    # or uvs, so they are left out of the payload
+    inner_mesh, outer_mesh = profile_to_lathe_data_batch(
+        walls, num_circumferential, need_normals=False, need_uvs=False,
+    )
 
     throat_idx = np.argmin(profile[:, 1])
-    wall_thickness = profile[:, 2] - profile[:, 1]
+    wall_thickness = np.ascontiguousarray(profile[:, 2] - profile[:, 1], dtype=np.float32)
 
+    # Arrays are left as contiguous ndarrays; the WS layer serializes them
+    # natively (orjson OPT_SERIALIZE_NUMPY) without a Python list round-trip
     result = {
         "inner_wall": inner_mesh,
         "outer_wall": outer_mesh,
-        "profile_2d": inner_profile.tolist(),
-        "outer_profile_2d": outer_profile.tolist(),
+        "profile_2d": inner_profile,
+        "outer_profile_2d": outer_profile,
         "throat_x": float(profile[throat_idx, 0]),
         "exit_x": float(profile[-1, 0]),
         "total_length_m": float(profile[-1, 0] - profile[0, 0]),
         "num_stations": len(profile),
-        "station_x": profile[:, 0].tolist(),
-        "station_r_inner": profile[:, 1].tolist(),
-        "station_r_outer": profile[:, 2].tolist(),
-        "station_wall_thickness": wall_thickness.tolist(),
-        "station_zone": profile[:, 3].astype(int).tolist(),
+        "station_x": np.ascontiguousarray(profile[:, 0], dtype=np.float32),
+        "station_r_inner": np.ascontiguousarray(profile[:, 1], dtype=np.float32),
+        "station_r_outer": np.ascontiguousarray(profile[:, 2], dtype=np.float32),
+        "station_wall_thickness": wall_thickness,
+        "station_zone": profile[:, 3].astype(int),
     }
 
     # Add injector orifice data if enabled
@@ -93,13 +137,16 @@ def export_for_frontend(engine: ParametricEngine, num_circumferential: int = 64,
         layout = generate_injector_layout(injector_config, face_x, face_radius)
         result["injector_orifices"] = [
             {
-                "y": float(o.y_center),
-                "z": float(o.z_center),
-                "radius": float(o.radius),
-                "type": o.orifice_type,
-                "ring": o.ring_index,
+                "y": y,
+                "z": z,
+                "radius": r,
+                "type": "fuel" if fuel else "oxidizer",
+                "ring": k,
             }
-            for o in layout.orifices
+            for y, z, r, fuel, k in zip(
+                layout.y.tolist(), layout.z.tolist(), layout.radius.tolist(),
+                layout.is_fuel.tolist(), layout.ring_index.tolist(),
+            )
         ]
 
     return result
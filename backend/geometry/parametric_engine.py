@@ -1,5 +1,6 @@
 """Parametric rocket engine geometry: converts parameter vector to physical profile."""
 
+import copy
 import math
 import numpy as np
 from backend.geometry.contour import full_engine_contour
@@ -13,6 +14,16 @@ class ParametricEngine:
     Supports variable wall thickness via 6 cubic-spline control points.
     """
 
+    # Shape parameters, in genome order (genes 0-15)
+    SHAPE_PARAMS = tuple(GENE_NAMES[:16])
+    # Subset of SHAPE_PARAMS that determines the inner contour
+    CONTOUR_PARAMS = (
+        "chamber_diameter", "chamber_length", "throat_diameter", "expansion_ratio",
+        "convergence_half_angle", "throat_upstream_radius_ratio",
+        "throat_downstream_radius_ratio", "bell_fraction",
+        "contour_cp1_y", "contour_cp2_y",
+    )
+
     def __init__(self, chamber_diameter: float = 0.08, chamber_length: float = 0.12,
                  throat_diameter: float = 0.03, expansion_ratio: float = 8.0,
                  wt_cp0: float = 0.003, wt_cp1: float = 0.003,
@@ -40,6 +51,34 @@ class ParametricEngine:
         self.contour_cp1_y = contour_cp1_y
         self.contour_cp2_y = contour_cp2_y
 
+        # Last inner contour and the (params, num_stations) key it was built for
+        self._contour_key = None
+        self._contour = None
+        # Last full profile and the (shape params, num_stations) key it was built for
+        self._profile_key = None
+        self._profile = None
+
+    def with_params(self, **params) -> "ParametricEngine":
+        """Return an engine with the given shape parameters changed.
+
+        Returns self if nothing changes, otherwise a copy; self is never
+        modified, so it stays safe to read from other threads. The copy
+        starts with this engine's caches, so its inner contour is reused
+        when only wall-thickness control points change.
+        """
+        changes = {}
+        for name, value in params.items():
+            if name not in self.SHAPE_PARAMS:
+                raise TypeError(f"Unknown shape parameter: {name}")
+            if getattr(self, name) != value:
+                changes[name] = value
+        if not changes:
+            return self
+        engine = copy.copy(self)
+        for name, value in changes.items():
+            setattr(engine, name, value)
+        return engine
+
     @property
     def wall_thickness_control_points(self) -> list[float]:
         return [self.wt_cp0, self.wt_cp1, self.wt_cp2,
@@ -53,17 +92,13 @@ class ParametricEngine:
         """Generate the engine profile.
 
         Returns array of shape (num_stations, 4): [x, r_inner, r_outer, zone_id]
+        The array is cached until a shape parameter changes and is read-only.
         """
-        contour = full_engine_contour(
-            self.chamber_diameter, self.chamber_length,
-            self.throat_diameter, self.expansion_ratio,
-            self.convergence_half_angle,
-            self.throat_upstream_radius_ratio,
-            self.throat_downstream_radius_ratio,
-            self.bell_fraction,
-            self.contour_cp1_y, self.contour_cp2_y,
-            num_stations
-        )
+        key = (tuple(self.to_genome()), num_stations)
+        if key == self._profile_key:
+            return self._profile
+
+        contour = self._inner_contour(num_stations)
 
         station_x = contour[:, 0]
         station_r_inner = contour[:, 1]
@@ -80,8 +115,28 @@ class ParametricEngine:
             r_outer,         # r_outer
             contour[:, 2],   # zone_id
         ])
+        profile.setflags(write=False)
+        self._profile_key = key
+        self._profile = profile
         return profile
 
+    def _inner_contour(self, num_stations: int) -> np.ndarray:
+        """Inner contour (x, r, zone), rebuilt only when a contour parameter changes."""
+        key = (tuple(getattr(self, name) for name in self.CONTOUR_PARAMS), num_stations)
+        if key != self._contour_key:
+            self._contour = full_engine_contour(
+                self.chamber_diameter, self.chamber_length,
+                self.throat_diameter, self.expansion_ratio,
+                self.convergence_half_angle,
+                self.throat_upstream_radius_ratio,
+                self.throat_downstream_radius_ratio,
+                self.bell_fraction,
+                self.contour_cp1_y, self.contour_cp2_y,
+                num_stations
+            )
+            self._contour_key = key
+        return self._contour
+
     @property
     def throat_area(self) -> float:
         """Cross-sectional area at the throat (m^2)."""
@@ -104,17 +159,19 @@ class ParametricEngine:
         """Volume of the cylindrical combustion chamber (m^3)."""
         return self.chamber_area * self.chamber_length
 
-    def total_mass(self, density: float) -> float:
-        """Approximate total wall mass given material density (kg)."""
-        profile = self.generate_profile()
-        mass = 0.0
-        for i in range(1, len(profile)):
-            dx = profile[i, 0] - profile[i - 1, 0]
-            r_inner = (profile[i, 1] + profile[i - 1, 1]) / 2
-            r_outer = (profile[i, 2] + profile[i - 1, 2]) / 2
-            dV = math.pi * (r_outer ** 2 - r_inner ** 2) * dx
-            mass += density * dV
-        return mass
+    def total_mass(self, density: float, profile: np.ndarray | None = None) -> float:
+        """Approximate total wall mass given material density (kg).
+
+        Pass the engine's generated profile, if already at hand, to reuse it.
+        """
+        if profile is None:
+            profile = self.generate_profile()
+        dx = np.diff(profile[:, 0])
+        r_inner = (profile[1:, 1] + profile[:-1, 1]) / 2
+        r_outer = (profile[1:, 2] + profile[:-1, 2]) / 2
+        # Annulus areas (r_o^2 - r_i^2 = (r_o - r_i)(r_o + r_i)) dotted with dx
+        area = (r_outer - r_inner) * (r_outer + r_inner)
+        return float(density * math.pi * np.dot(area, dx))
 
     def to_genome(self) -> list[float]:
         """Serialize to the shape portion of the genome (genes 0-15)."""
@@ -132,10 +189,33 @@ class ParametricEngine:
 
     @classmethod
     def from_genome(cls, genome: list[float]) -> "ParametricEngine":
-        """Reconstruct from a genome vector (uses first 16 genes)."""
-        shape_names = GENE_NAMES[:16]
-        kwargs = dict(zip(shape_names, genome[:16]))
-        return cls(**kwargs)
+        """Reconstruct from a genome vector (uses first 16 genes).
+
+        Genes are passed positionally (__init__ takes them in genome order)
+        and are assumed to be in bounds already, e.g. via clip_genome().
+        """
+        return cls(*genome[:16])
+
+    @classmethod
+    def from_pydantic(cls, g) -> "ParametricEngine":
+        """Construct directly from an EngineGeometryParams model.
+
+        Reads attributes instead of round-tripping through model_dump().
+        """
+        return cls(
+            chamber_diameter=g.chamber_diameter,
+            chamber_length=g.chamber_length,
+            throat_diameter=g.throat_diameter,
+            expansion_ratio=g.expansion_ratio,
+            wt_cp0=g.wt_cp0, wt_cp1=g.wt_cp1, wt_cp2=g.wt_cp2,
+            wt_cp3=g.wt_cp3, wt_cp4=g.wt_cp4, wt_cp5=g.wt_cp5,
+            convergence_half_angle=g.convergence_half_angle,
+            throat_upstream_radius_ratio=g.throat_upstream_radius_ratio,
+            throat_downstream_radius_ratio=g.throat_downstream_radius_ratio,
+            bell_fraction=g.bell_fraction,
+            contour_cp1_y=g.contour_cp1_y,
+            contour_cp2_y=g.contour_cp2_y,
+        )
 
     @classmethod
     def from_dict(cls, d: dict) -> "ParametricEngine":
@@ -6,16 +6,34 @@ profile and optional cooling channel geometry. Two modes:
   - 'full':   includes cooling channel voids cut into the wall
 """
 
-import io
+import functools
 import math
+import struct
+from typing import Iterator
+
 import numpy as np
-from stl import mesh as stl_mesh
-from stl import stl as stl_mode
 
 from backend.geometry.parametric_engine import ParametricEngine
 from backend.physics.regen_cooling import CoolingChannelGeometry
 from backend.geometry.injector import generate_injector_layout
 
+STL_NAME = "rocket_engine.stl"
+STL_CHUNK_BYTES = 64 * 1024  # target size of each streamed chunk of triangle records
+COLLINEAR_SLOPE_TOL = 1e-5   # dr/dx change below which a profile station adds no shape
+
+# Vertex precision of the triangle arrays. Binary STL stores float32, so
+# geometry is computed in float64 and rounded once when vertices are built;
+# every gathered triangle array is then already in the on-disk precision.
+VERTEX_DTYPE = np.float32
+
+# Binary STL triangle record: normal, three vertices, attribute byte count (50 bytes)
+STL_RECORD_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vectors", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])
+STL_HEADER_BYTES = 84  # 80-byte header + uint32 triangle count
+
 
 # ---------------------------------------------------------------------------
 #  Public API
@@ -42,6 +60,51 @@ def generate_stl(
     Returns:
         Binary STL file content as bytes.
     """
+    records = build_stl_records(
+        engine, cooling_geom, mode, n_circ, include_injector, injector_config
+    )
+    return _stl_header(records.size) + records.tobytes()
+
+
+def build_stl_records(
+    engine: ParametricEngine,
+    cooling_geom: CoolingChannelGeometry | None = None,
+    mode: str = "simple",
+    n_circ: int = 128,
+    include_injector: bool = True,
+    injector_config=None,
+) -> np.ndarray:
+    """Build the binary STL triangle records (STL_RECORD_DTYPE) for the engine.
+
+    Arguments are the same as for generate_stl(). Pair with stl_size() and
+    iter_stl_chunks() to send the file without joining it into one bytes object.
+    """
+    triangles = _build_triangles(
+        engine, cooling_geom, mode, n_circ, include_injector, injector_config
+    )
+    return _triangles_to_stl_records(triangles)
+
+
+def stl_size(records: np.ndarray) -> int:
+    """Exact size in bytes of the STL file holding records."""
+    return STL_HEADER_BYTES + records.nbytes
+
+
+def iter_stl_chunks(records: np.ndarray, chunk_bytes: int = STL_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield the STL file for prebuilt records as byte chunks.
+
+    The 80-byte header plus uint32 triangle count comes first, then the
+    records in chunks of roughly ``chunk_bytes``.
+    """
+    yield _stl_header(records.size)
+
+    step = max(1, chunk_bytes // records.dtype.itemsize)
+    for start in range(0, records.size, step):
+        yield records[start:start + step].tobytes()
+
+
+def _build_triangles(engine, cooling_geom, mode, n_circ, include_injector, injector_config):
+    """Assemble the (N, 3, 3) triangle array for the requested export mode."""
     profile = engine.generate_profile()  # shape (N, 4): x, r_inner, r_outer, zone
     x = profile[:, 0]
     r_inner = profile[:, 1]
@@ -50,7 +113,9 @@ def generate_stl(
     if mode == "full" and cooling_geom is not None:
         triangles = _build_full_stl(x, r_inner, r_outer, cooling_geom, n_circ)
     else:
-        triangles = _build_simple_stl(x, r_inner, r_outer, n_circ)
+        # Channel heights are laid out per station, so only the solid wall is decimated
+        keep = _collapse_colinear_stations(x, r_inner, r_outer)
+        triangles = _build_simple_stl(x[keep], r_inner[keep], r_outer[keep], n_circ)
 
     if include_injector:
         if injector_config and getattr(injector_config, 'enabled', False):
@@ -65,7 +130,26 @@ def generate_stl(
             injector = _build_injector_disc(x[0], r_inner[0], n_circ)
         triangles = np.concatenate([triangles, injector], axis=0)
 
-    return _triangles_to_stl_bytes(triangles)
+    return triangles
+
+
+def _collapse_colinear_stations(x, r_inner, r_outer, tol=COLLINEAR_SLOPE_TOL):
+    """Boolean mask of the profile stations that shape the wall surfaces.
+
+    An interior station is dropped when both the inner and outer contours
+    pass straight through it (slope change below tol), e.g. along the
+    cylindrical chamber or a conical section. The end stations are always kept.
+    """
+    keep = np.ones(len(x), dtype=bool)
+    if len(x) < 3:
+        return keep
+    dx = np.diff(x)
+    straight = np.ones(len(x) - 2, dtype=bool)
+    for r in (r_inner, r_outer):
+        slope = np.diff(r) / dx
+        straight &= np.abs(np.diff(slope)) < tol
+    keep[1:-1] = ~straight
+    return keep
 
 
 # ---------------------------------------------------------------------------
@@ -110,181 +194,142 @@ def _build_full_stl(x, r_inner, r_outer, cooling_geom, n_circ):
     # Channel angular half-width depends on mid-wall radius
     r_mid = (r_ch_bot + r_ch_top) / 2.0
 
-    all_tris = []
-
-    # 1. Outer surface (continuous, always at r_outer)
-    all_tris.append(_build_surface_of_revolution(x, r_outer, n_circ, flip_normals=False))
-
-    # 2. Inner surface (continuous, always at r_inner)
-    all_tris.append(_build_surface_of_revolution(x, r_inner, n_circ, flip_normals=True))
-
-    # 3. Channel-specific geometry: floor, ceiling, side walls
-    for ch_idx in range(n_ch):
-        center_angle = ch_idx * 2.0 * math.pi / n_ch
-        tris = _build_single_channel(
-            x, r_ch_bot, r_ch_top, r_mid, ch_w, center_angle, n_stations
-        )
-        all_tris.append(tris)
-
-    # 4. End caps with channel notches
-    cap_ch = _build_annular_cap_with_channels(
-        x[0], r_inner[0], r_outer[0], r_ch_bot[0], r_ch_top[0],
-        r_mid[0], n_ch, ch_w, n_circ, face_negative_x=True
-    )
-    cap_nz = _build_annular_cap_with_channels(
-        x[-1], r_inner[-1], r_outer[-1], r_ch_bot[-1], r_ch_top[-1],
-        r_mid[-1], n_ch, ch_w, n_circ, face_negative_x=False
-    )
-    all_tris.append(cap_ch)
-    all_tris.append(cap_nz)
-
-    return np.concatenate(all_tris, axis=0)
-
-
-def _build_single_channel(x, r_ch_bot, r_ch_top, r_mid, ch_w, center_angle, n_stations):
-    """Build floor, ceiling, and side walls for one cooling channel."""
-    tris = []
+    # Outer and inner surfaces (continuous, always at r_outer / r_inner),
+    # the floor, ceiling and side walls of every channel, and end caps with
+    # channel notches
+    center_angles = np.arange(n_ch) * 2.0 * math.pi / n_ch
+    parts = [
+        _build_surface_of_revolution(x, r_outer, n_circ, flip_normals=False),
+        _build_surface_of_revolution(x, r_inner, n_circ, flip_normals=True),
+        _build_channels(x, r_ch_bot, r_ch_top, r_mid, ch_w, center_angles, n_stations),
+        _build_annular_cap_with_channels(
+            x[0], r_inner[0], r_outer[0], r_ch_bot[0], r_ch_top[0],
+            r_mid[0], n_ch, ch_w, n_circ, face_negative_x=True
+        ),
+        _build_annular_cap_with_channels(
+            x[-1], r_inner[-1], r_outer[-1], r_ch_bot[-1], r_ch_top[-1],
+            r_mid[-1], n_ch, ch_w, n_circ, face_negative_x=False
+        ),
+    ]
+
+    return np.concatenate(parts, axis=0)
+
+
+def _build_channels(x, r_ch_bot, r_ch_top, r_mid, ch_w, center_angles, n_stations):
+    """Build floor, ceiling, and side walls for every cooling channel.
+
+    Channels are emitted in the order of center_angles.
+    """
     n = n_stations
-
-    for i in range(n - 1):
-        # Angular half-width at this station and next
-        half_a0 = ch_w / (2.0 * max(r_mid[i], 1e-6))
-        half_a1 = ch_w / (2.0 * max(r_mid[i + 1], 1e-6))
-
-        theta_L0 = center_angle - half_a0
-        theta_R0 = center_angle + half_a0
-        theta_L1 = center_angle - half_a1
-        theta_R1 = center_angle + half_a1
-
-        # Channel floor (at r_ch_bot, facing outward = away from engine center)
-        floor_tris = _make_axial_quad(
-            x[i], x[i + 1],
-            r_ch_bot[i], r_ch_bot[i + 1],
-            theta_L0, theta_R0, theta_L1, theta_R1,
-            flip=False  # outward-facing
-        )
-        tris.append(floor_tris)
-
-        # Channel ceiling (at r_ch_top, facing inward = toward engine center)
-        ceil_tris = _make_axial_quad(
-            x[i], x[i + 1],
-            r_ch_top[i], r_ch_top[i + 1],
-            theta_L0, theta_R0, theta_L1, theta_R1,
-            flip=True  # inward-facing
-        )
-        tris.append(ceil_tris)
-
-        # Left side wall (at theta_L, from r_ch_bot to r_ch_top)
-        left_tris = _make_radial_wall(
-            x[i], x[i + 1],
-            r_ch_bot[i], r_ch_top[i],
-            r_ch_bot[i + 1], r_ch_top[i + 1],
-            theta_L0, theta_L1,
-            flip=True  # facing into channel (toward positive theta)
-        )
-        tris.append(left_tris)
-
-        # Right side wall (at theta_R, from r_ch_bot to r_ch_top)
-        right_tris = _make_radial_wall(
-            x[i], x[i + 1],
-            r_ch_bot[i], r_ch_top[i],
-            r_ch_bot[i + 1], r_ch_top[i + 1],
-            theta_R0, theta_R1,
-            flip=False  # facing into channel (toward negative theta)
-        )
-        tris.append(right_tris)
-
-    return np.concatenate(tris, axis=0) if tris else np.empty((0, 3, 3))
-
-
-def _make_axial_quad(x0, x1, r0, r1, tL0, tR0, tL1, tR1, flip=False):
-    """Create 2 triangles for a quad on a cylindrical surface between two stations."""
-    A = _cyl(x0, r0, tL0)
-    B = _cyl(x0, r0, tR0)
-    C = _cyl(x1, r1, tL1)
-    D = _cyl(x1, r1, tR1)
-    if flip:
-        return np.array([[A, B, C], [B, D, C]])
-    else:
-        return np.array([[A, C, B], [B, C, D]])
-
-
-def _make_radial_wall(x0, x1, rb0, rt0, rb1, rt1, theta0, theta1, flip=False):
-    """Create 2 triangles for a radial wall (from r_bot to r_top at a fixed angle)."""
-    A = _cyl(x0, rb0, theta0)   # bottom at station i
-    B = _cyl(x0, rt0, theta0)   # top at station i
-    C = _cyl(x1, rb1, theta1)   # bottom at station i+1
-    D = _cyl(x1, rt1, theta1)   # top at station i+1
-    if flip:
-        return np.array([[A, B, C], [B, D, C]])
-    else:
-        return np.array([[A, C, B], [B, C, D]])
+    n_ch = len(center_angles)
+    if n < 2 or n_ch == 0:
+        return np.empty((0, 3, 3), dtype=VERTEX_DTYPE)
+
+    # Angular half-width at every station
+    half_a = ch_w / (2.0 * np.maximum(r_mid[:n], 1e-6))
+    theta_L = np.asarray(center_angles)[:, None] - half_a
+    theta_R = np.asarray(center_angles)[:, None] + half_a
+
+    # Channel corner vertices, (channel, station, side L/R, level bot/top, xyz)
+    thetas = np.stack([theta_L, theta_R], axis=-1)[..., None]
+    radii = np.stack([r_ch_bot[:n], r_ch_top[:n]], axis=-1)[:, None, :]
+    vertices = np.empty((n_ch, n, 2, 2, 3), dtype=VERTEX_DTYPE)
+    vertices[..., 0] = np.asarray(x[:n])[:, None, None]
+    vertices[..., 1] = radii * np.cos(thetas)
+    vertices[..., 2] = radii * np.sin(thetas)
+
+    spans = (np.arange(n_ch)[:, None] * n + np.arange(n - 1)[None, :]).ravel()
+    faces = _CHANNEL_STATION_FACES[None] + 4 * spans[:, None, None]
+    return vertices.reshape(-1, 3)[faces].reshape(-1, 3, 3)
+
+
+def _channel_station_faces():
+    """Triangle indices for one station span of a channel, relative to station i.
+
+    Vertex (station, side, level) of a _build_channels grid sits at
+    4 * station + 2 * side + level. Per span: floor (facing outward), ceiling
+    (facing inward), then the left and right side walls (facing into the channel).
+    """
+    def v(step, side, level):
+        return 4 * step + 2 * side + level
+
+    def quad(A, B, C, D, flip):
+        return [[A, B, C], [B, D, C]] if flip else [[A, C, B], [B, C, D]]
+
+    L, R, BOT, TOP = 0, 1, 0, 1
+    return np.array(
+        quad(v(0, L, BOT), v(0, R, BOT), v(1, L, BOT), v(1, R, BOT), flip=False)    # floor
+        + quad(v(0, L, TOP), v(0, R, TOP), v(1, L, TOP), v(1, R, TOP), flip=True)   # ceiling
+        + quad(v(0, L, BOT), v(0, L, TOP), v(1, L, BOT), v(1, L, TOP), flip=True)   # left wall
+        + quad(v(0, R, BOT), v(0, R, TOP), v(1, R, BOT), v(1, R, TOP), flip=False)  # right wall
+    )
 
 
-def _cyl(x, r, theta):
-    """Convert cylindrical (x, r, theta) to Cartesian (x, y, z)."""
-    return np.array([x, r * math.cos(theta), r * math.sin(theta)])
+_CHANNEL_STATION_FACES = _channel_station_faces()
 
 
 # ---------------------------------------------------------------------------
 #  Primitive builders
 # ---------------------------------------------------------------------------
 
-def _build_surface_of_revolution(x, r, n_circ, flip_normals=False):
-    """Build triangles for a surface of revolution around the x-axis."""
-    n = len(x)
-    tris = np.empty(((n - 1) * n_circ * 2, 3, 3))
-    idx = 0
-
-    thetas = np.linspace(0, 2 * math.pi, n_circ + 1)
+@functools.lru_cache(maxsize=16)
+def _trig_table(n_segments: int) -> tuple:
+    """Read-only (cos, sin) of n_segments + 1 angles spanning [0, 2*pi], endpoint included."""
+    thetas = np.linspace(0, 2 * math.pi, n_segments + 1)
     cos_t = np.cos(thetas)
     sin_t = np.sin(thetas)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
 
-    for i in range(n - 1):
-        x0, r0 = x[i], r[i]
-        x1, r1 = x[i + 1], r[i + 1]
 
-        for j in range(n_circ):
-            A = np.array([x0, r0 * cos_t[j],   r0 * sin_t[j]])
-            B = np.array([x0, r0 * cos_t[j+1], r0 * sin_t[j+1]])
-            C = np.array([x1, r1 * cos_t[j],   r1 * sin_t[j]])
-            D = np.array([x1, r1 * cos_t[j+1], r1 * sin_t[j+1]])
-
-            if flip_normals:
-                tris[idx] = [A, B, C]
-                tris[idx + 1] = [B, D, C]
-            else:
-                tris[idx] = [A, C, B]
-                tris[idx + 1] = [B, C, D]
-            idx += 2
-
-    return tris
+def _build_surface_of_revolution(x, r, n_circ, flip_normals=False):
+    """Build triangles for a surface of revolution around the x-axis."""
+    vertices = _revolve(x, r, *_trig_table(n_circ))
+    faces = _ring_strip_faces(len(x), n_circ, flip=flip_normals)
+    return vertices[faces]
 
 
 def _build_annular_cap(x_pos, r_inner, r_outer, n_circ, face_negative_x=True):
     """Build triangulated annular disc at a fixed axial position."""
-    tris = np.empty((n_circ * 2, 3, 3))
-    idx = 0
+    vertices = _revolve(
+        np.array([x_pos, x_pos]), np.array([r_inner, r_outer]), *_trig_table(n_circ)
+    )
+    faces = _ring_strip_faces(2, n_circ, flip=not face_negative_x)
+    return vertices[faces]
 
-    thetas = np.linspace(0, 2 * math.pi, n_circ + 1)
-    cos_t = np.cos(thetas)
-    sin_t = np.sin(thetas)
 
-    for j in range(n_circ):
-        Ai = np.array([x_pos, r_inner * cos_t[j],   r_inner * sin_t[j]])
-        Bi = np.array([x_pos, r_inner * cos_t[j+1], r_inner * sin_t[j+1]])
-        Co = np.array([x_pos, r_outer * cos_t[j],   r_outer * sin_t[j]])
-        Do = np.array([x_pos, r_outer * cos_t[j+1], r_outer * sin_t[j+1]])
+def _revolve(x, r, cos_t, sin_t):
+    """Indexed vertex grid for profile stations swept through the given angles.
 
-        if face_negative_x:
-            tris[idx] = [Ai, Co, Bi]
-            tris[idx + 1] = [Bi, Co, Do]
-        else:
-            tris[idx] = [Ai, Bi, Co]
-            tris[idx + 1] = [Bi, Do, Co]
-        idx += 2
+    Returns a (len(x) * len(cos_t), 3) array; row i * len(cos_t) + j is the
+    vertex of station i at angle j. Each vertex is computed once and shared
+    by every triangle that touches it.
+    """
+    n_rows, n_cols = len(x), len(cos_t)
+    vertices = np.empty((n_rows, n_cols, 3), dtype=VERTEX_DTYPE)
+    vertices[:, :, 0] = np.asarray(x)[:, None]
+    vertices[:, :, 1] = np.outer(r, cos_t)
+    vertices[:, :, 2] = np.outer(r, sin_t)
+    return vertices.reshape(-1, 3)
 
-    return tris
+
+def _ring_strip_faces(n_rows, n_circ, flip=False):
+    """Triangle indices into a (n_rows, n_circ + 1) vertex grid from _revolve().
+
+    Each quad between consecutive rows and angles becomes two triangles,
+    emitted in row-major quad order.
+    """
+    width = n_circ + 1
+    a = (np.arange(n_rows - 1)[:, None] * width + np.arange(n_circ)[None, :]).ravel()
+    b = a + 1
+    c = a + width
+    d = c + 1
+    if flip:
+        quads = np.stack([np.stack([a, b, c], axis=-1), np.stack([b, d, c], axis=-1)], axis=1)
+    else:
+        quads = np.stack([np.stack([a, c, b], axis=-1), np.stack([b, c, d], axis=-1)], axis=1)
+    return quads.reshape(-1, 3)
 
 
 def _build_annular_cap_with_channels(
@@ -295,110 +340,84 @@ def _build_annular_cap_with_channels(
 
     In rib regions: full annulus from r_inner to r_outer.
     In channel regions: two thin annuli (r_inner to r_ch_bot) + (r_ch_top to r_outer),
-    leaving the channel void open.
+    leaving the channel void open. The channel floor-to-ceiling faces at the
+    cap are closed by the side walls from _build_channels.
     """
-    tris_list = []
     spacing = 2.0 * math.pi / n_channels
+    half_a = ch_width / (2.0 * max(r_mid, 1e-6))
 
+    # Segment angles and radii for every channel, in emission order:
+    # rib segments, then (hot wall, closeout) pairs across the channel
+    t0_parts, t1_parts, r_in_parts, r_out_parts = [], [], [], []
     for ch in range(n_channels):
         center = ch * spacing
-        half_a = ch_width / (2.0 * max(r_mid, 1e-6))
         ch_left = center - half_a
         ch_right = center + half_a
 
         # Rib region: from previous channel right edge to this channel left edge
-        prev_center = ((ch - 1) % n_channels) * spacing
-        prev_half_a = ch_width / (2.0 * max(r_mid, 1e-6))
-        rib_left = prev_center + prev_half_a
-        rib_right = ch_left
-
-        # Handle wrap-around
         if ch == 0:
-            rib_left = (n_channels - 1) * spacing + prev_half_a - 2 * math.pi
+            rib_left = (n_channels - 1) * spacing + half_a - 2 * math.pi
+        else:
+            rib_left = (ch - 1) * spacing + half_a
+        rib_right = ch_left
 
-        # Rib: full wall from r_inner to r_outer (subdivide into ~4 segments)
         n_rib_segs = max(1, int(round((rib_right - rib_left) / (2 * math.pi) * n_circ)))
         rib_thetas = np.linspace(rib_left, rib_right, n_rib_segs + 1)
-        for k in range(n_rib_segs):
-            t0, t1 = rib_thetas[k], rib_thetas[k + 1]
-            tris_list.append(_annular_cap_segment(
-                x_pos, r_inner, r_outer, t0, t1, face_negative_x
-            ))
+        t0_parts.append(rib_thetas[:-1])
+        t1_parts.append(rib_thetas[1:])
+        r_in_parts.append(np.full(n_rib_segs, r_inner))
+        r_out_parts.append(np.full(n_rib_segs, r_outer))
 
-        # Channel: hot wall (r_inner to r_ch_bot) and closeout (r_ch_top to r_outer)
         n_ch_segs = max(1, int(round((ch_right - ch_left) / (2 * math.pi) * n_circ)))
         ch_thetas = np.linspace(ch_left, ch_right, n_ch_segs + 1)
-        for k in range(n_ch_segs):
-            t0, t1 = ch_thetas[k], ch_thetas[k + 1]
-            # Hot wall portion
-            tris_list.append(_annular_cap_segment(
-                x_pos, r_inner, r_ch_bot, t0, t1, face_negative_x
-            ))
-            # Closeout portion
-            tris_list.append(_annular_cap_segment(
-                x_pos, r_ch_top, r_outer, t0, t1, face_negative_x
-            ))
-
-        # Channel end-cap side walls (close the channel at this axial end)
-        # Left side of channel
-        tris_list.append(_channel_endcap_side(
-            x_pos, r_ch_bot, r_ch_top, ch_left, face_negative_x, side='left'
-        ))
-        # Right side of channel
-        tris_list.append(_channel_endcap_side(
-            x_pos, r_ch_bot, r_ch_top, ch_right, face_negative_x, side='right'
-        ))
-
-    if not tris_list:
-        return np.empty((0, 3, 3))
-    return np.concatenate(tris_list, axis=0)
-
-
-def _annular_cap_segment(x_pos, r_inner, r_outer, theta0, theta1, face_negative_x):
-    """Two triangles for a single annular cap segment between theta0 and theta1."""
-    c0, s0 = math.cos(theta0), math.sin(theta0)
-    c1, s1 = math.cos(theta1), math.sin(theta1)
-
-    Ai = np.array([x_pos, r_inner * c0, r_inner * s0])
-    Bi = np.array([x_pos, r_inner * c1, r_inner * s1])
-    Co = np.array([x_pos, r_outer * c0, r_outer * s0])
-    Do = np.array([x_pos, r_outer * c1, r_outer * s1])
+        t0_parts.append(np.repeat(ch_thetas[:-1], 2))
+        t1_parts.append(np.repeat(ch_thetas[1:], 2))
+        r_in_parts.append(np.tile([r_inner, r_ch_top], n_ch_segs))
+        r_out_parts.append(np.tile([r_ch_bot, r_outer], n_ch_segs))
+
+    if not t0_parts:
+        return np.empty((0, 3, 3), dtype=VERTEX_DTYPE)
+    return _annular_cap_segments(
+        x_pos,
+        np.concatenate(r_in_parts), np.concatenate(r_out_parts),
+        np.concatenate(t0_parts), np.concatenate(t1_parts),
+        face_negative_x,
+    )
 
-    if face_negative_x:
-        return np.array([[Ai, Co, Bi], [Bi, Co, Do]])
-    else:
-        return np.array([[Ai, Bi, Co], [Bi, Do, Co]])
 
+def _annular_cap_segments(x_pos, r_inner, r_outer, theta0, theta1, face_negative_x):
+    """Two triangles per annular cap segment, for arrays of segment radii and angles.
 
-def _channel_endcap_side(x_pos, r_bot, r_top, theta, face_negative_x, side='left'):
-    """Two triangles closing one side of a channel at an end cap."""
-    c, s = math.cos(theta), math.sin(theta)
-    A = np.array([x_pos, r_bot * c, r_bot * s])
-    B = np.array([x_pos, r_top * c, r_top * s])
+    Returns a (2 * len(theta0), 3, 3) array, segment by segment.
+    """
+    c0, s0 = np.cos(theta0), np.sin(theta0)
+    c1, s1 = np.cos(theta1), np.sin(theta1)
 
-    # Slight offset in theta for the wall thickness (infinitesimal but needed for valid tris)
-    # In practice, this face has zero width in theta -- it's a radial line, not a quad.
-    # For the end cap, we just need the channel floor-to-ceiling face at this angle.
-    # This is handled by the side walls from _build_single_channel at the first/last station.
-    # So we return empty here -- the channel is closed by the axial side walls meeting the cap.
-    return np.empty((0, 3, 3))
+    # Corner order: 0 = inner/theta0, 1 = inner/theta1, 2 = outer/theta0, 3 = outer/theta1
+    corners = np.empty((len(theta0), 4, 3), dtype=VERTEX_DTYPE)
+    corners[:, :, 0] = x_pos
+    corners[:, 0, 1], corners[:, 0, 2] = r_inner * c0, r_inner * s0
+    corners[:, 1, 1], corners[:, 1, 2] = r_inner * c1, r_inner * s1
+    corners[:, 2, 1], corners[:, 2, 2] = r_outer * c0, r_outer * s0
+    corners[:, 3, 1], corners[:, 3, 2] = r_outer * c1, r_outer * s1
+
+    if face_negative_x:
+        faces = np.array([[0, 2, 1], [1, 2, 3]])
+    else:
+        faces = np.array([[0, 1, 2], [1, 3, 2]])
+    return corners[:, faces].reshape(-1, 3, 3)
 
 
 def _build_injector_disc(x_pos, r_inner, n_circ):
     """Build a solid disc at the chamber inlet (injector face)."""
-    tris = np.empty((n_circ, 3, 3))
-    center = np.array([x_pos, 0.0, 0.0])
-    thetas = np.linspace(0, 2 * math.pi, n_circ + 1)
-    cos_t = np.cos(thetas)
-    sin_t = np.sin(thetas)
-
-    for j in range(n_circ):
-        A = np.array([x_pos, r_inner * cos_t[j],   r_inner * sin_t[j]])
-        B = np.array([x_pos, r_inner * cos_t[j+1], r_inner * sin_t[j+1]])
-        # Winding for face pointing in -x direction
-        tris[j] = [center, B, A]
+    vertices = np.empty((n_circ + 2, 3), dtype=VERTEX_DTYPE)
+    vertices[0] = (x_pos, 0.0, 0.0)
+    vertices[1:] = _revolve(np.array([x_pos]), np.array([r_inner]), *_trig_table(n_circ))
 
-    return tris
+    # Fan around the centre; winding for face pointing in -x direction
+    j = np.arange(n_circ)
+    faces = np.stack([np.zeros_like(j), j + 2, j + 1], axis=-1)
+    return vertices[faces]
 
 
 def _build_injector_disc_with_orifices(x_pos, face_radius, layout, n_circ, wall_thickness=0.003):
@@ -412,111 +431,94 @@ def _build_injector_disc_with_orifices(x_pos, face_radius, layout, n_circ, wall_
     The bore extends from the front face through the wall for 3D-printable
     through-holes.
     """
-    orifices = layout.orifices
-
     # Grid resolution: fine enough that cells are ~half the smallest orifice
-    min_orifice_r = face_radius
-    for o in orifices:
-        if o.radius < min_orifice_r:
-            min_orifice_r = o.radius
+    min_orifice_r = float(layout.radius.min(initial=face_radius))
     cell_target = min_orifice_r * 0.75
     n_radial = min(200, max(80, int(math.ceil(face_radius / cell_target))))
     n_angular = min(800, max(n_circ, int(math.ceil(2.0 * math.pi * face_radius / cell_target))))
 
-    tris_list = []
-
     thetas = np.linspace(0, 2 * math.pi, n_angular + 1)
     radii = np.linspace(0, face_radius, n_radial + 1)
 
-    # Pre-compute orifice data for faster checks
-    oy = np.array([o.y_center for o in orifices])
-    oz = np.array([o.z_center for o in orifices])
-    or2 = np.array([o.radius * o.radius for o in orifices])
-
-    def _cell_overlaps_orifice(cy, cz, cell_r):
-        """Check if cell center is inside any orifice (with margin for clean edge)."""
-        dy = cy - oy
-        dz = cz - oz
-        dist2 = dy * dy + dz * dz
-        # Exclude cells whose center is within orifice radius (tight boundary —
-        # the bore geometry will define the clean circular edge)
-        return np.any(dist2 < or2)
-
-    for i in range(n_radial):
-        r0 = radii[i]
-        r1 = radii[i + 1]
-        r_mid = (r0 + r1) / 2.0
-
-        for j in range(n_angular):
-            t0 = thetas[j]
-            t1 = thetas[j + 1]
-            t_mid = (t0 + t1) / 2.0
-
-            cy = r_mid * math.cos(t_mid)
-            cz = r_mid * math.sin(t_mid)
-
-            if _cell_overlaps_orifice(cy, cz, 0):
-                continue
-
-            if r0 < 1e-8:
-                A = np.array([x_pos, 0.0, 0.0])
-                B = np.array([x_pos, r1 * math.cos(t0), r1 * math.sin(t0)])
-                C = np.array([x_pos, r1 * math.cos(t1), r1 * math.sin(t1)])
-                tris_list.append(np.array([[A, C, B]]))
-            else:
-                A = np.array([x_pos, r0 * math.cos(t0), r0 * math.sin(t0)])
-                B = np.array([x_pos, r0 * math.cos(t1), r0 * math.sin(t1)])
-                C = np.array([x_pos, r1 * math.cos(t0), r1 * math.sin(t0)])
-                D = np.array([x_pos, r1 * math.cos(t1), r1 * math.sin(t1)])
-                tris_list.append(np.array([[A, C, B], [B, C, D]]))
+    # Exclude cells whose center is within an orifice radius (tight boundary —
+    # the bore geometry will define the clean circular edge)
+    r_mids = (radii[:-1] + radii[1:]) / 2.0
+    t_mids = (thetas[:-1] + thetas[1:]) / 2.0
+    cy = np.outer(r_mids, np.cos(t_mids))
+    cz = np.outer(r_mids, np.sin(t_mids))
+    inside = np.zeros((n_radial, n_angular), dtype=bool)
+    for y, z, r2 in zip(layout.y, layout.z, layout.radius * layout.radius):
+        dy = cy - y
+        dz = cz - z
+        inside |= dy * dy + dz * dz < r2
+
+    # Grid vertices; rings starting at the axis are closed with a single
+    # fan triangle per cell instead of a quad
+    vertices = _revolve(np.full(n_radial + 1, x_pos), radii, *_trig_table(n_angular))
+    vertices = vertices.reshape(n_radial + 1, n_angular + 1, 3)
+    fan = radii[:-1] < 1e-8
+    vertices[:-1][fan, :, 1:] = 0.0
+    vertices = vertices.reshape(-1, 3)
+
+    width = n_angular + 1
+    a = np.arange(n_radial)[:, None] * width + np.arange(n_angular)[None, :]
+    b = a + 1
+    c = a + width
+    d = c + 1
+    first = np.where(fan[:, None, None], np.stack([a, d, c], axis=-1), np.stack([a, c, b], axis=-1))
+    faces = np.stack([first, np.stack([b, c, d], axis=-1)], axis=2)
+    keep = np.stack([~inside, ~inside & ~fan[:, None]], axis=-1)
+    face_tris = vertices[faces[keep]]
 
     # Cylindrical bore for each orifice — smooth circular holes
     bore_depth = min(wall_thickness, 0.005)
     bore_segments = 32  # smooth circles
     x_back = x_pos + bore_depth
-
-    for o in orifices:
-        bore_thetas = np.linspace(0, 2 * math.pi, bore_segments + 1)
-        center_front = np.array([x_pos, o.y_center, o.z_center])
-        center_back = np.array([x_back, o.y_center, o.z_center])
-
-        for k in range(bore_segments):
-            ct0 = math.cos(bore_thetas[k])
-            st0 = math.sin(bore_thetas[k])
-            ct1 = math.cos(bore_thetas[k + 1])
-            st1 = math.sin(bore_thetas[k + 1])
-
-            y0 = o.y_center + o.radius * ct0
-            z0 = o.z_center + o.radius * st0
-            y1 = o.y_center + o.radius * ct1
-            z1 = o.z_center + o.radius * st1
-
-            # Bore wall (cylinder from front to back)
-            A = np.array([x_pos, y0, z0])
-            B = np.array([x_pos, y1, z1])
-            C = np.array([x_back, y0, z0])
-            D = np.array([x_back, y1, z1])
-            tris_list.append(np.array([[A, B, C], [B, D, C]]))
-
-            # Back cap (close the bore at the back)
-            tris_list.append(np.array([[center_back, C, D]]))
-
-    if not tris_list:
-        return np.empty((0, 3, 3))
-    return np.concatenate(tris_list, axis=0)
+    # Bore rim points, (orifice, angle)
+    bore_cos, bore_sin = _trig_table(bore_segments)
+    oy = layout.y[:, None]
+    oz = layout.z[:, None]
+    rim_y = oy + layout.radius[:, None] * bore_cos
+    rim_z = oz + layout.radius[:, None] * bore_sin
+
+    def _points(x, y, z):
+        pts = np.empty(np.broadcast_shapes(y.shape, z.shape) + (3,), dtype=VERTEX_DTYPE)
+        pts[..., 0] = x
+        pts[..., 1] = y
+        pts[..., 2] = z
+        return pts
+
+    A = _points(x_pos, rim_y[:, :-1], rim_z[:, :-1])
+    B = _points(x_pos, rim_y[:, 1:], rim_z[:, 1:])
+    C = _points(x_back, rim_y[:, :-1], rim_z[:, :-1])
+    D = _points(x_back, rim_y[:, 1:], rim_z[:, 1:])
+    center_back = np.broadcast_to(_points(x_back, oy, oz), A.shape)
+
+    # Per segment: bore wall (cylinder from front to back), then the back cap
+    bore = np.stack([
+        np.stack([A, B, C], axis=-2),
+        np.stack([B, D, C], axis=-2),
+        np.stack([center_back, C, D], axis=-2),
+    ], axis=2)
+    return np.concatenate([face_tris, bore.reshape(-1, 3, 3)], axis=0)
 
 
 # ---------------------------------------------------------------------------
 #  Serialization
 # ---------------------------------------------------------------------------
 
-def _triangles_to_stl_bytes(triangles: np.ndarray) -> bytes:
-    """Convert an (N, 3, 3) triangle array to binary STL bytes."""
-    n_tris = len(triangles)
-    stl_obj = stl_mesh.Mesh(np.zeros(n_tris, dtype=stl_mesh.Mesh.dtype))
-    stl_obj.vectors = triangles.astype(np.float32)
-    stl_obj.update_normals()
+def _stl_header(n_triangles: int) -> bytes:
+    """80-byte binary STL header followed by the uint32 triangle count."""
+    return STL_NAME.encode("ascii").ljust(80, b" ") + struct.pack("<I", n_triangles)
+
 
-    buf = io.BytesIO()
-    stl_obj.save('rocket_engine.stl', fh=buf, mode=stl_mode.Mode.BINARY)
-    return buf.getvalue()
+def _triangles_to_stl_records(triangles: np.ndarray) -> np.ndarray:
+    """Pack an (N, 3, 3) triangle array into binary STL records with computed normals.
+
+    Normals are the (non-normalized) edge cross products, taken in float32.
+    """
+    records = np.zeros(len(triangles), dtype=STL_RECORD_DTYPE)
+    records["vectors"] = triangles
+    v = records["vectors"]
+    records["normal"] = np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0])
+    return records
@@ -7,6 +7,15 @@ from scipy.interpolate import CubicSpline
 WALL_THICKNESS_POSITIONS = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
 NUM_WALL_THICKNESS_STATIONS = 6
 
+# The natural spline is linear in the control values, so its piecewise cubic
+# coefficients are those of the 6 unit-impulse splines, shape (4, 5, 6):
+# (power, interval, control point). A call only has to contract them with
+# its control thicknesses instead of solving for a new spline.
+_KNOTS = np.asarray(WALL_THICKNESS_POSITIONS)
+_BASIS_COEFFS = CubicSpline(
+    _KNOTS, np.eye(NUM_WALL_THICKNESS_STATIONS), bc_type='natural'
+).c
+
 
 def interpolate_wall_thickness(
     control_thicknesses: list[float],
@@ -28,7 +37,10 @@ def interpolate_wall_thickness(
 
     x_norm = (station_x - x_min) / span
 
-    cs = CubicSpline(WALL_THICKNESS_POSITIONS, control_thicknesses, bc_type='natural')
-    thickness = cs(x_norm)
+    c = _BASIS_COEFFS @ np.asarray(control_thicknesses, dtype=float)
+    interval = np.clip(np.searchsorted(_KNOTS, x_norm, side='right') - 1, 0, len(_KNOTS) - 2)
+    dx = x_norm - _KNOTS[interval]
+    c = c[:, interval]
+    thickness = ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
 
     return np.clip(thickness, 0.0005, 0.015)
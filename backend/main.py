@@ -2,13 +2,15 @@
 
 from pathlib import Path
 from fastapi import FastAPI, WebSocket
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.config import SERVER_HOST, SERVER_PORT
 from backend.api.rest_routes import router as api_router
 from backend.api.ws_handler import handle_websocket
 
-app = FastAPI(title="3D Rocket Engine Simulator")
+app = FastAPI(title="3D Rocket Engine Simulator", default_response_class=ORJSONResponse)
 
 # CORS for development
 app.add_middleware(
@@ -32,3 +34,11 @@ async def websocket_endpoint(websocket: WebSocket):
 # Serve frontend static files (must be last — catch-all)
 frontend_path = Path(__file__).parent.parent / "frontend"
 app.mount("/", StaticFiles(directory=str(frontend_path), html=True), name="frontend")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools ship with uvicorn[standard]; pin them explicitly
+    # rather than relying on "auto" detection
+    uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT, loop="uvloop", http="httptools")
@@ -1,11 +1,12 @@
 """Material property database for rocket engine simulation."""
 
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MaterialProperties:
     id: str
     name: str
@@ -30,6 +31,10 @@ class MaterialProperties:
     def yield_strength_Pa(self) -> float:
         return self.yield_strength_MPa * 1e6
 
+    def as_dict(self) -> dict:
+        """Field name -> value, in declaration order (a flat dataclasses.asdict)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class MaterialDatabase:
     def __init__(self):
@@ -40,18 +45,33 @@ class MaterialDatabase:
         for m in data["materials"]:
             props = MaterialProperties(**m)
             self._materials[props.id] = props
+        # Materials never change after loading, so their listings are built once
+        self._summaries = [
+            {"id": m.id, "name": m.name, "color_hex": m.color_hex}
+            for m in self._materials.values()
+        ]
+        self._full = [m.as_dict() for m in self._materials.values()]
 
     def get(self, material_id: str) -> MaterialProperties:
         if material_id not in self._materials:
             raise KeyError(f"Unknown material: {material_id}")
         return self._materials[material_id]
 
+    # Listings hand out fresh dicts, so a caller editing one cannot change
+    # what later callers see
     def list_all(self) -> list[dict]:
-        return [
-            {"id": m.id, "name": m.name, "color_hex": m.color_hex}
-            for m in self._materials.values()
-        ]
+        return [dict(d) for d in self._summaries]
 
     def list_full(self) -> list[dict]:
-        from dataclasses import asdict
-        return [asdict(m) for m in self._materials.values()]
+        return [dict(d) for d in self._full]
+
+
+@functools.cache
+def get_material_database() -> MaterialDatabase:
+    """Process-wide database instance, loaded on first use."""
+    return MaterialDatabase()
+
+
+def get_material(material_id: str) -> MaterialProperties:
+    """Look up a material in the shared database; raises KeyError if unknown."""
+    return get_material_database().get(material_id)
@@ -1,7 +1,12 @@
 """Combustion chamber thermodynamics for rocket engine simulation."""
 
+import functools
 import math
+import numpy as np
 from backend.config import G0, R_UNIVERSAL
+from backend.physics.gas_dynamics import (
+    area_mach_relation, area_mach_relation_batch, isentropic_pressure_ratio,
+)
 
 
 def specific_gas_constant(molecular_weight: float) -> float:
@@ -9,15 +14,19 @@ def specific_gas_constant(molecular_weight: float) -> float:
     return R_UNIVERSAL / molecular_weight
 
 
+@functools.lru_cache(maxsize=64)
 def gamma_function(gamma: float) -> float:
     """Vandenkerckhove function: Gamma = sqrt(gamma) * (2/(gamma+1))^((gamma+1)/(2*(gamma-1)))."""
     return math.sqrt(gamma) * (2 / (gamma + 1)) ** ((gamma + 1) / (2 * (gamma - 1)))
 
 
+@functools.lru_cache(maxsize=64)
 def characteristic_velocity(gamma: float, R_specific: float, T_chamber: float) -> float:
     """Characteristic exhaust velocity c* (m/s).
     
     c* = sqrt(R_specific * T_chamber) / Gamma(gamma)
+
+    Memoized: a run reuses the same propellant gamma, R and T_chamber.
     """
     Gamma = gamma_function(gamma)
     return math.sqrt(R_specific * T_chamber) / Gamma
@@ -80,29 +89,30 @@ def combustion_efficiency(atomization_quality: float, stability_margin: float,
     """
     # Atomization contribution: poor atomization caps efficiency
     # atomization_quality 0→0.80, 1.0→1.0
-    eta_atom = 0.80 + 0.20 * min(atomization_quality, 1.0)
+    eta_atom = 0.80 + 0.20 * (1.0 if atomization_quality > 1.0 else atomization_quality)
 
     # Stability contribution: unstable combustion wastes energy
     # stability_margin 0→0.85, 1.0→1.0
-    eta_stab = 0.85 + 0.15 * min(stability_margin, 1.0)
+    eta_stab = 0.85 + 0.15 * (1.0 if stability_margin > 1.0 else stability_margin)
 
     # Mixing uniformity from momentum ratio: ideal MR=1.0
     # deviation from 1.0 penalizes mixing
     mr_deviation = abs(momentum_ratio - 1.0)
-    eta_mix = max(0.85, 1.0 - 0.15 * min(mr_deviation, 1.0))
+    eta_mix = 1.0 - 0.15 * (1.0 if mr_deviation > 1.0 else mr_deviation)
+    eta_mix = eta_mix if eta_mix > 0.85 else 0.85
 
     # Chamber L* contribution (if provided)
     # L* < 0.5m → incomplete combustion, L* > 1.0m → fully complete
     eta_lstar = 1.0
-    if chamber_L_star is not None:
-        if chamber_L_star < 1.0:
-            eta_lstar = max(0.80, 0.80 + 0.20 * chamber_L_star)
+    if chamber_L_star is not None and chamber_L_star < 1.0:
+        eta_lstar = 0.80 + 0.20 * chamber_L_star
+        eta_lstar = eta_lstar if eta_lstar > 0.80 else 0.80
 
     # Combined efficiency: product of independent factors
     eta = eta_atom * eta_stab * eta_mix * eta_lstar
 
     # Clamp to physical range
-    return max(0.75, min(0.99, eta))
+    return 0.75 if eta <= 0.75 else (eta if eta < 0.99 else 0.99)
 
 
 def compute_chamber_performance(gamma: float, molecular_weight: float,
@@ -121,7 +131,6 @@ def compute_chamber_performance(gamma: float, molecular_weight: float,
     # Need to solve for exit Mach first, then get P_exit
     # Use the area_mach_relation from gas_dynamics
     # For now, compute Cf with a pressure ratio estimate
-    from backend.physics.gas_dynamics import area_mach_relation, isentropic_pressure_ratio
     
     M_exit = area_mach_relation(expansion_ratio, gamma, supersonic=True)
     P_exit_ratio = isentropic_pressure_ratio(M_exit, gamma)
@@ -144,3 +153,49 @@ def compute_chamber_performance(gamma: float, molecular_weight: float,
         "exit_mach": M_exit,
         "R_specific": R_spec,
     }
+
+
+def compute_chamber_performance_batch(gamma, molecular_weight, T_chamber, P_chamber,
+                                      A_throat, expansion_ratio, P_ambient) -> dict:
+    """Array version of compute_chamber_performance() for throttle and design sweeps.
+
+    Arguments are scalars or arrays that broadcast together; returns the same
+    keys as compute_chamber_performance() with array values.
+    """
+    g, mw, Tc, Pc, At, eps, Pa = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            gamma, molecular_weight, T_chamber, P_chamber,
+            A_throat, expansion_ratio, P_ambient,
+        ))
+    )
+    R_spec = R_UNIVERSAL / mw
+    Gamma = np.sqrt(g) * (2 / (g + 1)) ** ((g + 1) / (2 * (g - 1)))
+    c_star = np.sqrt(R_spec * Tc) / Gamma
+    mdot = Pc * At / c_star
+
+    M_exit = area_mach_relation_batch(eps, g, supersonic=True)
+    P_exit_ratio = isentropic_pressure_ratio(M_exit, g)
+    P_exit = P_exit_ratio * Pc
+
+    # Thrust coefficient, as in thrust_coefficient()
+    term1 = (2 * g ** 2) / (g - 1)
+    term2 = (2 / (g + 1)) ** ((g + 1) / (g - 1))
+    term3 = 1 - P_exit_ratio ** ((g - 1) / g)
+    Cf = np.sqrt(term1 * term2 * np.maximum(term3, 0)) + (P_exit_ratio - Pa / Pc) * eps
+
+    F = Cf * Pc * At
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Isp = np.where(mdot > 0, F / (mdot * G0), 0.0)
+    Ve = Isp * G0
+
+    return {
+        "c_star_m_s": c_star,
+        "mass_flow_kg_s": mdot,
+        "thrust_coefficient": Cf,
+        "thrust_N": F,
+        "specific_impulse_s": Isp,
+        "exit_velocity_m_s": Ve,
+        "exit_pressure_Pa": P_exit,
+        "exit_mach": M_exit,
+        "R_specific": R_spec,
+    }
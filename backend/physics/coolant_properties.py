@@ -38,6 +38,14 @@ class CoolantRP1:
         k = CoolantRP1.conductivity(T)
         return cp * mu / k if k > 0 else 10.0
 
+    @staticmethod
+    def all_properties(T):
+        """(density, specific_heat, viscosity, conductivity, prandtl) at T, in one call."""
+        cp = CoolantRP1.specific_heat(T)
+        mu = CoolantRP1.viscosity(T)
+        k = CoolantRP1.conductivity(T)
+        return CoolantRP1.density(T), cp, mu, k, (cp * mu / k if k > 0 else 10.0)
+
 
 class CoolantLCH4:
     """Liquid methane properties. Valid ~111-500 K."""
@@ -70,6 +78,14 @@ class CoolantLCH4:
         k = CoolantLCH4.conductivity(T)
         return cp * mu / k if k > 0 else 5.0
 
+    @staticmethod
+    def all_properties(T):
+        """(density, specific_heat, viscosity, conductivity, prandtl) at T, in one call."""
+        cp = CoolantLCH4.specific_heat(T)
+        mu = CoolantLCH4.viscosity(T)
+        k = CoolantLCH4.conductivity(T)
+        return CoolantLCH4.density(T), cp, mu, k, (cp * mu / k if k > 0 else 5.0)
+
 
 COOLANTS = {
     "rp1": CoolantRP1,
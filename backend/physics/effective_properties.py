@@ -48,16 +48,16 @@ def compute_effective_r_outer(station_r_inner: np.ndarray,
     Returns array of effective r_outer values that account for the
     weakening effect of cooling channels in the wall.
     """
-    n = len(station_r_inner)
-    effective_r = np.zeros(n)
-
-    for i in range(n):
-        r_i = station_r_inner[i]
-        r_o = station_r_outer[i]
-        t_wall = r_o - r_i
-
-        vf = compute_void_fraction(n_channels, channel_width, rib_width, r_o)
-        t_eff = effective_wall_thickness(t_wall, channel_height, vf, rib_thickness_factor)
-        effective_r[i] = r_i + t_eff
-
-    return effective_r
+    r_i = np.asarray(station_r_inner, dtype=float)
+    r_o = np.asarray(station_r_outer, dtype=float)
+    t_wall = r_o - r_i
+
+    # compute_void_fraction() and effective_wall_thickness() over all stations
+    circumference = 2.0 * math.pi * r_o
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vf = np.where(circumference > 0,
+                      np.minimum(n_channels * channel_width / circumference, 0.85), 0.0)
+    reduction = channel_height * vf * (1.0 - rib_thickness_factor)
+    t_eff = np.maximum(t_wall - reduction, t_wall * 0.3)
+
+    return r_i + t_eff
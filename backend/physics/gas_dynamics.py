@@ -1,9 +1,9 @@
 """Quasi-1D compressible nozzle flow: isentropic relations, area-Mach, shocks."""
 
+import functools
 import math
 import numpy as np
-from scipy.optimize import brentq
-from backend.config import R_UNIVERSAL
+from backend.config import G0, R_UNIVERSAL
 
 
 def isentropic_temperature_ratio(M: float, gamma: float) -> float:
@@ -33,10 +33,23 @@ def area_mach_function(M: float, gamma: float) -> float:
     return (1 / M ** 2) * term ** exponent
 
 
+@functools.lru_cache(maxsize=16)
+def _gamma_constants(gamma: float) -> tuple[float, float, float, float]:
+    """Per-gamma constants of solve_nozzle_flow.
+    
+    Returns (critical pressure ratio, (gamma-1)/2, pressure-ratio exponent,
+    density-ratio exponent). Sweeps hold gamma fixed, so these are cached.
+    """
+    critical_ratio = (2 / (gamma + 1)) ** (gamma / (gamma - 1))
+    return critical_ratio, (gamma - 1) / 2, -gamma / (gamma - 1), -1 / (gamma - 1)
+
+
+@functools.lru_cache(maxsize=4096)
 def area_mach_relation(area_ratio: float, gamma: float, supersonic: bool = False) -> float:
     """Solve for Mach number given A/A* (area ratio).
     
     Returns the subsonic root by default, or supersonic if supersonic=True.
+    Memoized on the exact inputs: the same nozzle is solved on every tick.
     """
     if area_ratio < 1.0:
         area_ratio = 1.0
@@ -44,24 +57,103 @@ def area_mach_relation(area_ratio: float, gamma: float, supersonic: bool = False
     if abs(area_ratio - 1.0) < 1e-10:
         return 1.0
     
-    target = area_ratio ** 2
+    # Halley's method on f(u) = ln(A/A*)(M) - ln(area_ratio), u = ln(M):
+    #   f'  = (M^2 - 1) / t,   f'' = (gamma + 1) * M^2 / t^2,
+    #   t   = 1 + (gamma - 1)/2 * M^2
+    # kept inside a bracket of the root (bisection if a step leaves it)
+    half_gm1 = (gamma - 1) / 2
+    exponent = (gamma + 1) / (2 * (gamma - 1))
+    log_target = math.log(area_ratio)
     
-    def residual(M):
-        return area_mach_function(M, gamma) - target
+    if supersonic:
+        # ln(A/A*) rises with M above Mach 1; start from the larger of the
+        # near-sonic expansion and the large-M asymptote
+        u = max(math.log1p(math.sqrt(4 * log_target / (gamma + 1))),
+                (log_target - exponent * math.log((gamma - 1) / (gamma + 1)))
+                / (2 * exponent - 1))
+        lo, hi = 0.0, math.inf
+    else:
+        # ... and falls with M below it
+        u = math.log(0.5)
+        lo, hi = -math.inf, 0.0
     
+    for _ in range(50):
+        M2 = math.exp(2 * u)
+        t = 1 + half_gm1 * M2
+        f = exponent * math.log(2 * t / (gamma + 1)) - u - log_target
+        if (f < 0) == supersonic:
+            lo = u
+        else:
+            hi = u
+        df = (M2 - 1) / t
+        d2f = (gamma + 1) * M2 / (t * t)
+        denom = 2 * df * df - f * d2f
+        step = u - 2 * f * df / denom if denom != 0 else math.nan
+        if not lo <= step <= hi:
+            if math.isinf(hi):
+                step = u + 1
+            elif math.isinf(lo):
+                step = u - 1
+            else:
+                step = (lo + hi) / 2
+        if abs(step - u) <= 1e-14:
+            return math.exp(step)
+        u = step
+    return math.exp(u)
+
+
+def area_mach_relation_batch(area_ratio, gamma, supersonic: bool = False,
+                             max_iter: int = 50) -> np.ndarray:
+    """Array version of area_mach_relation(): Mach numbers for arrays of A/A*.
+
+    area_ratio and gamma broadcast together. Solves ln(A/A*) = ln(area_ratio)
+    for u = ln(M) with Newton steps on all elements at once; a step that
+    leaves the current bracket of the root is replaced by bisection (or a
+    unit step, while that side of the bracket is still unbounded).
+    """
+    ar_all, g_all = np.broadcast_arrays(
+        np.maximum(np.asarray(area_ratio, dtype=float), 1.0),
+        np.asarray(gamma, dtype=float),
+    )
+    mach = np.ones(ar_all.shape)
+    # A/A* = 1 is the sonic point itself, where the Newton slope vanishes
+    solve = ar_all > 1.0
+    ar, g = ar_all[solve], g_all[solve]
+    half_gm1 = (g - 1) / 2
+    exponent = (g + 1) / (2 * (g - 1))
+    log_target = np.log(ar)
+
     if supersonic:
-        # Supersonic root: M > 1
-        # area_mach_function increases with M for M > 1, so residual goes from
-        # negative (near M=1) to positive (large M). Find M_high where residual > 0.
-        M_high = 2.0
-        while residual(M_high) < 0:
-            M_high *= 2
-            if M_high > 200:
-                break
-        return brentq(residual, 1.0001, M_high, xtol=1e-10)
+        # Larger of the near-sonic expansion and the large-M asymptote
+        u = np.maximum(
+            np.log1p(np.sqrt(4 * log_target / (g + 1))),
+            (log_target - exponent * np.log((g - 1) / (g + 1))) / (2 * exponent - 1),
+        )
+        lo, hi = np.zeros(ar.shape), np.full(ar.shape, np.inf)
     else:
-        # Subsonic root: 0 < M < 1
-        return brentq(residual, 0.001, 0.9999, xtol=1e-10)
+        u = np.full(ar.shape, math.log(0.5))
+        lo, hi = np.full(ar.shape, -np.inf), np.zeros(ar.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(max_iter):
+            M2 = np.exp(2 * u)
+            t = 1 + half_gm1 * M2
+            f = exponent * np.log(2 * t / (g + 1)) - u - log_target
+            # ln(A/A*) rises with M above Mach 1 and falls below it
+            below = f < 0 if supersonic else f > 0
+            lo = np.where(below, u, lo)
+            hi = np.where(below, hi, u)
+            step = u - f * t / (M2 - 1)
+            fallback = np.where(np.isinf(hi), u + 1,
+                                np.where(np.isinf(lo), u - 1, (lo + hi) / 2))
+            u_next = np.where((step >= lo) & (step <= hi), step, fallback)
+            converged = np.all(np.abs(u_next - u) <= 1e-12)
+            u = u_next
+            if converged:
+                break
+
+    mach[solve] = np.exp(u)
+    return mach
 
 
 def normal_shock_relations(M1: float, gamma: float) -> dict:
@@ -91,7 +183,8 @@ def normal_shock_relations(M1: float, gamma: float) -> dict:
 
 def solve_nozzle_flow(station_x: np.ndarray, station_r: np.ndarray,
                       throat_r: float, gamma: float, R_specific: float,
-                      P0: float, T0: float, P_back: float) -> dict:
+                      P0: float, T0: float, P_back: float,
+                      dtype=np.float64) -> dict:
     """Solve the quasi-1D isentropic flow through the nozzle.
     
     Args:
@@ -103,6 +196,9 @@ def solve_nozzle_flow(station_x: np.ndarray, station_r: np.ndarray,
         P0: stagnation/chamber pressure (Pa)
         T0: stagnation/chamber temperature (K)
         P_back: back/ambient pressure (Pa)
+        dtype: float type of the returned station arrays (e.g. np.float32 for
+            sweeps that only need engineering precision); the Mach solve
+            itself always runs in float64
     
     Returns dict with arrays: mach, pressure, temperature, velocity, density
     """
@@ -120,54 +216,35 @@ def solve_nozzle_flow(station_x: np.ndarray, station_r: np.ndarray,
     # For a rocket nozzle, if chamber pressure is high enough to choke the throat,
     # the divergent section has supersonic flow. The critical pressure ratio for
     # choking is (2/(gamma+1))^(gamma/(gamma-1)).
-    critical_ratio = (2 / (gamma + 1)) ** (gamma / (gamma - 1))
+    critical_ratio, half_gm1, p_exp, d_exp = _gamma_constants(gamma)
     choked = P0 * critical_ratio > P_back  # throat pressure > back pressure
     fully_supersonic = choked  # supersonic in divergent section if choked
     
-    # Solve Mach at each station
-    mach = np.zeros(n)
-    pressure = np.zeros(n)
-    temperature = np.zeros(n)
-    velocity = np.zeros(n)
-    density = np.zeros(n)
-    
-    rho0 = P0 / (R_specific * T0)
-    
-    for i in range(n):
-        ar = max(area_ratios[i], 1.0)
-        
-        if i <= throat_idx:
-            # Subsonic in convergent section
-            try:
-                M = area_mach_relation(ar, gamma, supersonic=False)
-            except Exception:
-                M = 0.01
-        elif fully_supersonic:
-            # Supersonic in divergent section
-            try:
-                M = area_mach_relation(ar, gamma, supersonic=True)
-            except Exception:
-                M = 1.0
-        else:
-            # Subsonic throughout (not choked) or shock present
-            # Simplified: assume subsonic for now
-            try:
-                M = area_mach_relation(ar, gamma, supersonic=False)
-            except Exception:
-                M = 0.01
-        
-        mach[i] = M
-        pressure[i] = isentropic_pressure_ratio(M, gamma) * P0
-        temperature[i] = isentropic_temperature_ratio(M, gamma) * T0
-        velocity[i] = M * math.sqrt(gamma * R_specific * temperature[i])
-        density[i] = isentropic_density_ratio(M, gamma) * rho0
+    # Solve Mach at every station at once: subsonic through the convergent
+    # section, supersonic in the divergent section if the throat is choked,
+    # otherwise subsonic throughout (simplified: no shock modeled)
+    ar = np.maximum(area_ratios, 1.0)
+    supersonic = np.arange(n) > throat_idx if fully_supersonic else np.zeros(n, dtype=bool)
+    mach = np.empty(n)
+    mach[~supersonic] = area_mach_relation_batch(ar[~supersonic], gamma, supersonic=False)
+    mach[supersonic] = area_mach_relation_batch(ar[supersonic], gamma, supersonic=True)
     
     # Force Mach = 1 at throat
     mach[throat_idx] = 1.0
-    pressure[throat_idx] = isentropic_pressure_ratio(1.0, gamma) * P0
-    temperature[throat_idx] = isentropic_temperature_ratio(1.0, gamma) * T0
-    velocity[throat_idx] = math.sqrt(gamma * R_specific * temperature[throat_idx])
-    density[throat_idx] = isentropic_density_ratio(1.0, gamma) * rho0
+    
+    # Isentropic state at every station from its Mach number. The pressure
+    # and density ratios (isentropic_*_ratio()) share one log of the
+    # stagnation term instead of each taking a fractional power of it.
+    # Scalars are cast so the arrays stay in the requested dtype
+    ftype = np.dtype(dtype).type
+    mach = mach.astype(dtype, copy=False)
+    area_ratios = area_ratios.astype(dtype, copy=False)
+    mach_term = 1 + ftype(half_gm1) * mach ** 2
+    log_term = np.log(mach_term)
+    pressure = np.exp(ftype(p_exp) * log_term) * ftype(P0)
+    temperature = ftype(T0) / mach_term
+    velocity = mach * np.sqrt(ftype(gamma * R_specific) * temperature)
+    density = np.exp(ftype(d_exp) * log_term) * ftype(P0 / (R_specific * T0))
     
     return {
         "mach": mach,
@@ -191,7 +268,6 @@ def compute_thrust(mdot: float, V_exit: float, P_exit: float,
 
 def compute_specific_impulse(thrust: float, mdot: float) -> float:
     """Isp = F / (mdot * g0)."""
-    from backend.config import G0
     if mdot <= 0:
         return 0.0
     return thrust / (mdot * G0)
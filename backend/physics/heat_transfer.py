@@ -97,43 +97,47 @@ def compute_wall_temperatures(station_x: np.ndarray, station_r: np.ndarray,
     Pr = prandtl_number(gamma)
     mu_0 = gas_viscosity(molecular_weight, T_chamber)
 
-    # Support both scalar and array wall thickness
-    if isinstance(wall_thickness, (int, float)):
-        wt_arr = np.full(n, wall_thickness)
-    else:
-        wt_arr = np.asarray(wall_thickness)
+    # Support both scalar and array wall thickness (a scalar becomes a
+    # read-only zero-stride view rather than a filled array)
+    wt_arr = np.broadcast_to(np.asarray(wall_thickness, dtype=float), (n,))
 
-    heat_flux = np.zeros(n)
     wall_temp_inner = np.full(n, T_outer + 100)  # initial guess
     wall_temp_outer = np.full(n, T_outer)
+    heat_flux = np.zeros(n)
     h_gas_arr = np.zeros(n)
-    T_aw_arr = np.zeros(n)
-
-    areas = math.pi * station_r ** 2
 
+    area_ratio = math.pi * station_r ** 2 / A_throat if A_throat > 0 else np.ones(n)
+
+    # Everything except the wall temperature is fixed across iterations:
+    # recovery temperature, the Bartz coefficient without its sigma factor
+    # (bartz_heat_transfer_coeff() with r_curvature = D_throat, so its
+    # curvature factor is 1), and the Mach-only part of sigma
+    # (bartz_sigma_correction())
+    T_aw_arr = adiabatic_wall_temperature(T_chamber, mach, gamma, Pr)
+    bartz_const = (0.026 / throat_diameter ** 0.2) * \
+                  (mu_0 ** 0.2 * Cp / Pr ** 0.6) * \
+                  (P_chamber / c_star) ** 0.8 * \
+                  np.maximum(area_ratio, 0.1) ** (-0.9)
+    mach_term = 1 + (gamma - 1) / 2 * mach ** 2
+    mach_sigma = mach_term ** (-0.12)
+
+    # Each station only depends on its own wall temperature, so every
+    # fixed-point iteration updates all stations at once
     for _iteration in range(max_iter):
-        for i in range(n):
-            T_aw = adiabatic_wall_temperature(T_chamber, mach[i], gamma, Pr)
-            T_aw_arr[i] = T_aw
-
-            h_g = bartz_heat_transfer_coeff(
-                D_throat=throat_diameter, mu_0=mu_0, Cp=Cp, Pr=Pr,
-                P_chamber=P_chamber, c_star=c_star,
-                A_throat=A_throat, A_local=areas[i],
-                T_wall=wall_temp_inner[i], T0=T_chamber,
-                M_local=mach[i], gamma=gamma
-            )
-            h_gas_arr[i] = h_g
-
-            q_conv = h_g * (T_aw - wall_temp_inner[i])
-            q_rad = radiative_heat_flux(temperature_K[i], wall_temp_inner[i])
-            q_total = max(q_conv + q_rad, 0)
-
-            delta_T = wall_conduction_delta_T(q_total, wt_arr[i], thermal_conductivity)
-
-            heat_flux[i] = q_total
-            wall_temp_inner[i] = T_outer + delta_T
-            wall_temp_outer[i] = T_outer
+        bracket = 0.5 * (wall_temp_inner / T_chamber) * mach_term + 0.5
+        sigma = bracket ** (-0.68) * mach_sigma
+        h_gas_arr = np.maximum(bartz_const * sigma, 0.0)
+
+        q_conv = h_gas_arr * (T_aw_arr - wall_temp_inner)
+        q_rad = radiative_heat_flux(temperature_K, wall_temp_inner)
+        heat_flux = np.maximum(q_conv + q_rad, 0.0)
+
+        if thermal_conductivity <= 0:
+            delta_T = np.full(n, float('inf'))
+        else:
+            delta_T = heat_flux * wt_arr / thermal_conductivity
+
+        wall_temp_inner = T_outer + delta_T
 
     return {
         "heat_flux_W_m2": heat_flux,
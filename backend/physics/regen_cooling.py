@@ -4,13 +4,14 @@ Models counter-flow cooling where propellant flows from nozzle exit toward
 the injector through rectangular channels machined into the engine wall.
 """
 
+import functools
 import math
 import numpy as np
 from dataclasses import dataclass
 from backend.physics.coolant_properties import get_coolant
 
 
-@dataclass
+@dataclass(slots=True)
 class CoolingChannelGeometry:
     """Cooling channel parameters."""
     n_channels: int = 60
@@ -22,14 +23,37 @@ class CoolingChannelGeometry:
     ch_height_cp1: float = None       # channel height at midpoint (x=0.5)
     ch_height_cp2: float = None       # channel height at nozzle exit (x=1.0)
 
+    @classmethod
+    def from_pydantic(cls, cfg) -> "CoolingChannelGeometry":
+        """Construct from a CoolingConfig model (extra fields such as coolant_type are ignored)."""
+        return cls(**{name: getattr(cfg, name) for name in cls.__slots__})
+
     def get_channel_height_array(self, n_stations: int) -> np.ndarray:
-        """Return per-station channel heights, interpolating from CPs if set."""
+        """Return per-station channel heights, interpolating from CPs if set.
+
+        The array is shared between calls with the same heights and is read-only.
+        """
         if self.ch_height_cp0 is None:
-            return np.full(n_stations, self.channel_height)
-        cp_x = np.array([0.0, 0.5, 1.0])
-        cp_h = np.array([self.ch_height_cp0, self.ch_height_cp1, self.ch_height_cp2])
-        t = np.linspace(0, 1, n_stations)
-        return np.interp(t, cp_x, cp_h)
+            return _channel_heights(n_stations, self.channel_height)
+        return _channel_heights(n_stations, self.ch_height_cp0,
+                                self.ch_height_cp1, self.ch_height_cp2)
+
+
+_CP_X = (0.0, 0.5, 1.0)
+
+
+@functools.lru_cache(maxsize=64)
+def _channel_heights(n_stations: int, *cp_h: float) -> np.ndarray:
+    """Read-only heights at n_stations evenly spaced stations.
+
+    One control point gives a uniform height; three are placed at x = 0, 0.5, 1.
+    """
+    if len(cp_h) == 1:
+        heights = np.full(n_stations, cp_h[0])
+    else:
+        heights = np.interp(np.linspace(0, 1, n_stations), _CP_X, cp_h)
+    heights.setflags(write=False)
+    return heights
 
 
 def hydraulic_diameter(width: float, height: float) -> float:
@@ -75,7 +99,7 @@ def compute_regen_cooling(
     Returns dict with per-station arrays and summary scalars.
     """
     n = len(station_x)
-    coolant_cls = get_coolant(coolant_type)
+    coolant_props = get_coolant(coolant_type).all_properties
 
     # Per-station channel heights (may vary axially via control points)
     channel_heights = channel_geom.get_channel_height_array(n)
@@ -84,69 +108,74 @@ def compute_regen_cooling(
     # Per-channel mass flow
     mdot_per_channel = coolant_mdot / max(channel_geom.n_channels, 1)
 
+    # Station geometry does not depend on the coolant state, so it is
+    # computed for all stations up front; only the coolant recurrence is
+    # marched, on plain floats
+    t_w = np.maximum(wall_thickness, 0.0005)
+    ch_h = np.maximum(channel_heights, 0.0005)
+    if ch_w <= 0:
+        D_h = np.full(n, 1e-6)
+    else:
+        D_h = 4.0 * ch_w * ch_h / (2.0 * (ch_w + ch_h))  # hydraulic_diameter()
+    A_channel = (ch_w * ch_h).tolist()
+    inv_h_g = 1.0 / np.maximum(h_gas, 10.0)
+    R_gas_wall = (inv_h_g + t_w / max(k_wall, 0.1)).tolist()
+    inv_h_g = inv_h_g.tolist()
+    T_aw = np.asarray(T_aw, dtype=float).tolist()
+
+    # Segment i-1 -> i: wetted area (~2*pi*r_outer for all channels combined)
+    # and friction length over hydraulic diameter
+    dx = np.abs(np.diff(station_x))
+    r_mid = (station_r_outer[1:] + station_r_outer[:-1]) / 2.0
+    dA = [0.0] + (2.0 * math.pi * r_mid * dx).tolist()
+    L_over_D = [0.0] + (dx / np.maximum(D_h[1:], 1e-6)).tolist()
+    D_h = D_h.tolist()
+
     # Output arrays
-    T_wall_hot = np.zeros(n)
-    T_wall_cold = np.zeros(n)
-    T_coolant = np.zeros(n)
-    h_coolant_arr = np.zeros(n)
-    coolant_vel = np.zeros(n)
-    coolant_pressure = np.zeros(n)
-    heat_flux_total = np.zeros(n)
+    T_wall_hot = [0.0] * n
+    T_wall_cold = [0.0] * n
+    T_coolant = [0.0] * n
+    h_coolant_arr = [0.0] * n
+    coolant_vel = [0.0] * n
+    segment_dP = [0.0] * n  # friction drop from station i+1 to station i
+    heat_flux_total = [0.0] * n
 
     # Initialize coolant at nozzle exit (last station)
     T_coolant[-1] = coolant_inlet_temp
-    coolant_pressure[-1] = coolant_inlet_pressure
 
     # March backward from nozzle exit to chamber inlet
     for i in range(n - 1, -1, -1):
         T_c = T_coolant[i]
-        t_w = max(wall_thickness[i], 0.0005)
-
-        # Per-station channel geometry
-        ch_h = max(channel_heights[i], 0.0005)
-        D_h = hydraulic_diameter(ch_w, ch_h)
-        A_channel = ch_w * ch_h
 
         # Coolant properties at current temperature
-        rho_c = coolant_cls.density(T_c)
-        cp_c = coolant_cls.specific_heat(T_c)
-        mu_c = coolant_cls.viscosity(T_c)
-        k_c = coolant_cls.conductivity(T_c)
-        Pr_c = coolant_cls.prandtl(T_c)
+        rho_c, cp_c, mu_c, k_c, Pr_c = coolant_props(T_c)
 
         # Coolant velocity in channel
-        v_c = mdot_per_channel / (rho_c * A_channel) if (rho_c * A_channel) > 0 else 1.0
+        rho_A = rho_c * A_channel[i]
+        v_c = mdot_per_channel / rho_A if rho_A > 0 else 1.0
         coolant_vel[i] = v_c
 
         # Reynolds number
-        Re_c = rho_c * v_c * D_h / mu_c if mu_c > 0 else 1000.0
+        Re_c = rho_c * v_c * D_h[i] / mu_c if mu_c > 0 else 1000.0
 
         # Coolant-side heat transfer coefficient
-        h_c = dittus_boelter_h(Re_c, Pr_c, D_h, k_c)
+        h_c = dittus_boelter_h(Re_c, Pr_c, D_h[i], k_c)
         h_coolant_arr[i] = h_c
 
-        # Overall heat transfer coefficient
+        # Heat flux through the total resistance
         # 1/U = 1/h_g + t_wall/k_wall + 1/h_c
-        h_g = max(h_gas[i], 10.0)
-        R_total = 1.0 / h_g + t_w / max(k_wall, 0.1) + 1.0 / max(h_c, 10.0)
-        U = 1.0 / R_total
-
-        # Heat flux
-        Q = U * max(T_aw[i] - T_c, 0.0)
+        inv_h_c = 1.0 / max(h_c, 10.0)
+        Q = max(T_aw[i] - T_c, 0.0) / (R_gas_wall[i] + inv_h_c)
         heat_flux_total[i] = Q
 
         # Wall temperatures
-        T_wall_hot[i] = T_aw[i] - Q / h_g
-        T_wall_cold[i] = T_c + Q / max(h_c, 10.0)
+        T_wall_hot[i] = T_aw[i] - Q * inv_h_g[i]
+        T_wall_cold[i] = T_c + Q * inv_h_c
 
         # Coolant absorbs heat over the local wetted area
-        # Wetted perimeter per station ~ 2*pi*r_outer (all channels combined)
         if i > 0:
-            dx = abs(station_x[i] - station_x[i - 1])
-            r_mid = (station_r_outer[i] + station_r_outer[max(i - 1, 0)]) / 2.0
-            dA = 2.0 * math.pi * r_mid * dx  # wetted area of this station segment
-
-            dT_coolant = Q * dA / (coolant_mdot * cp_c) if (coolant_mdot * cp_c) > 0 else 0.0
+            mdot_cp = coolant_mdot * cp_c
+            dT_coolant = Q * dA[i] / mdot_cp if mdot_cp > 0 else 0.0
             T_coolant[i - 1] = T_c + dT_coolant
 
             # Pressure drop: McAdams Fanning friction factor, converted to Darcy
@@ -154,8 +183,18 @@ def compute_regen_cooling(
             # ΔP = f_Darcy * (L/D_h) * ½ρv²
             f_fanning = 0.046 * max(Re_c, 100.0) ** (-0.2)
             f_darcy = 4.0 * f_fanning
-            dP = f_darcy * (dx / max(D_h, 1e-6)) * 0.5 * rho_c * v_c ** 2
-            coolant_pressure[i - 1] = coolant_pressure[i] - dP
+            segment_dP[i - 1] = f_darcy * L_over_D[i] * 0.5 * rho_c * v_c ** 2
+
+    # Pressure falls by the accumulated segment drops from the inlet at the
+    # nozzle exit; a reversed prefix sum replaces the per-station recurrence
+    coolant_pressure = coolant_inlet_pressure - np.cumsum(segment_dP[::-1])[::-1]
+
+    # One (7, n) block for all outputs; each returned array is a contiguous row
+    (T_wall_hot, T_wall_cold, T_coolant, h_coolant_arr,
+     coolant_vel, coolant_pressure, heat_flux_total) = np.array([
+        T_wall_hot, T_wall_cold, T_coolant, h_coolant_arr,
+        coolant_vel, coolant_pressure, heat_flux_total,
+    ])
 
     total_pressure_drop = coolant_pressure[-1] - coolant_pressure[0]
 
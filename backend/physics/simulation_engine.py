@@ -1,6 +1,6 @@
 """Simulation engine: orchestrates all physics modules into a single tick."""
 
-import math
+import copy
 import numpy as np
 from backend.geometry.parametric_engine import ParametricEngine
 from backend.geometry.wall_thickness import interpolate_wall_thickness
@@ -12,6 +12,14 @@ from backend.config import G0, ATMOSPHERIC_PRESSURE
 from backend.geometry.injector import generate_injector_layout, compute_injection_physics
 
 
+# Top-level run_tick() result keys: everything, and the scalar results that
+# optimization loops read
+ALL_FIELDS = frozenset({
+    "performance", "stations", "structural_summary", "warnings", "injector", "cooling",
+})
+SUMMARY_FIELDS = frozenset({"performance", "structural_summary", "warnings"})
+
+
 class SimulationEngine:
     """Runs the complete physics simulation for a given engine configuration."""
 
@@ -27,7 +35,8 @@ class SimulationEngine:
                  coolant_inlet_temp: float = 300.0,
                  coolant_inlet_pressure: float = 5_000_000.0,
                  rib_thickness_factor: float = 0.5,
-                 injector_config=None):
+                 injector_config=None,
+                 dtype=np.float64):
         self.engine = engine
         self.material = material
         self.gamma = gamma
@@ -48,50 +57,132 @@ class SimulationEngine:
         # Injector config
         self.injector_config = injector_config
 
-        # Pre-compute profile
+        # Float type of the station geometry and nozzle flow arrays; float32
+        # halves their memory traffic for sweeps that tolerate ~1e-6 error
+        self.dtype = dtype
+
+        # Pre-compute profile and chamber gas constants
+        self._set_engine(engine)
+        self._set_gas_constants()
+
+        # Inputs of the last tick and its result
+        self._last_tick_key = None
+        self._last_tick = None
+
+    def _set_engine(self, engine: ParametricEngine):
+        """Use engine, caching its station profile and throat/exit geometry."""
+        self.engine = engine
+        # Shape parameters the cached arrays below were built from
+        self._engine_key = tuple(engine.to_genome())
         self._profile = engine.generate_profile()
-        self._station_x = self._profile[:, 0]
-        self._station_r_inner = self._profile[:, 1]
-        self._station_r_outer = self._profile[:, 2]
+        # Contiguous copies of the profile columns, so the tick result can
+        # hand them to orjson as-is
+        self._station_x = np.ascontiguousarray(self._profile[:, 0], dtype=self.dtype)
+        self._station_r_inner = np.ascontiguousarray(self._profile[:, 1], dtype=self.dtype)
+        self._station_r_outer = np.ascontiguousarray(self._profile[:, 2], dtype=self.dtype)
         self._wall_thickness = self._station_r_outer - self._station_r_inner
+        self._throat_r = engine.throat_diameter / 2
+        self._throat_area = engine.throat_area
+        self._exit_area = engine.exit_area
+        self._effective_r_outer = None
+        self._total_mass = None
 
-    def run_tick(self) -> dict:
+    def _effective_r(self) -> np.ndarray:
+        """Channel-corrected outer radius for stress, built on first use.
+
+        Depends only on geometry, so it is kept until the engine, the cooling
+        channels or the rib thickness factor change.
+        """
+        if self._effective_r_outer is None:
+            self._effective_r_outer = compute_effective_r_outer(
+                self._station_r_inner, self._station_r_outer,
+                self.cooling_geom.n_channels,
+                self.cooling_geom.channel_width,
+                self.cooling_geom.channel_height,
+                self.cooling_geom.rib_width,
+                self.rib_thickness_factor,
+            )
+        return self._effective_r_outer
+
+    def _set_gas_constants(self):
+        """Cache R_specific and ideal c*, which depend only on gamma, M_w and T_chamber."""
+        self._R_spec = combustion.specific_gas_constant(self.molecular_weight)
+        self._c_star_ideal = combustion.characteristic_velocity(self.gamma, self._R_spec, self.T_chamber)
+
+    def run_tick(self, fields: frozenset[str] = ALL_FIELDS) -> dict:
         """Execute one full physics tick.
 
-        Returns a comprehensive dict with all simulation results.
+        Returns a comprehensive dict with all simulation results. Per-station
+        fields are C-contiguous ndarrays (serialized directly by orjson with
+        OPT_SERIALIZE_NUMPY), not lists.
+
+        fields: top-level result keys to include, e.g. SUMMARY_FIELDS to skip
+        the per-station arrays. "performance" is always included.
+
+        A tick with the same inputs as the previous one (e.g. polling with no
+        config change) returns the previous result dict itself, ndarrays
+        included, so every caller that holds a result (the GA's best-result
+        cache, the websocket outbox) may share it. Callers must not mutate
+        the result; copy whatever they need to change.
         """
-        import math
-        R_spec = combustion.specific_gas_constant(self.molecular_weight)
+        key = (
+            fields, self._engine_key, self.material, self.dtype,
+            self.gamma, self.molecular_weight, self.T_chamber, self.P_chamber, self.P_ambient,
+            self.cooling_enabled, self.cooling_geom, self.coolant_mdot, self.coolant_type,
+            self.coolant_inlet_temp, self.coolant_inlet_pressure, self.rib_thickness_factor,
+            self.injector_config,
+        )
+        if key == self._last_tick_key:
+            return self._last_tick
+        result = self._run_tick(fields)
+        self._last_tick_key = key
+        self._last_tick = result
+        return result
+
+    def _run_tick(self, fields: frozenset[str]) -> dict:
+        """Run every physics stage and assemble the run_tick() result."""
+        # Hot-path state bound once for the whole tick
+        engine = self.engine
+        material = self.material
+        gamma = self.gamma
+        P_chamber = self.P_chamber
+        T_chamber = self.T_chamber
+        P_ambient = self.P_ambient
+        station_x = self._station_x
+        station_r_inner = self._station_r_inner
+        station_r_outer = self._station_r_outer
+        throat_area = self._throat_area
+        k_wall = material.thermal_conductivity_W_mK
+        injector_config = self.injector_config
 
         # 1. Ideal combustion: c*_ideal, then apply injection efficiency
-        c_star_ideal = combustion.characteristic_velocity(self.gamma, R_spec, self.T_chamber)
+        c_star_ideal = self._c_star_ideal
 
         # 1b. Injection physics and combustion efficiency coupling
         # Run injection first so η_c* can reduce c* before computing mdot
         eta_cstar = 0.98  # default: near-ideal if no injector modeled
         injector_result = None
-        if self.injector_config and getattr(self.injector_config, 'enabled', False):
-            face_x = self._station_x[0]
-            face_radius = self._station_r_inner[0]
-            layout = generate_injector_layout(self.injector_config, face_x, face_radius)
+        if injector_config and getattr(injector_config, 'enabled', False):
+            face_x = station_x[0]
+            face_radius = station_r_inner[0]
+            layout = generate_injector_layout(injector_config, face_x, face_radius)
 
             # Initial mdot estimate for injection calc (use ideal c*)
-            mdot_est = combustion.mass_flow_rate(self.P_chamber, self.engine.throat_area, c_star_ideal)
+            mdot_est = combustion.mass_flow_rate(P_chamber, throat_area, c_star_ideal)
 
             injector_result = compute_injection_physics(
                 layout=layout,
-                P_chamber=self.P_chamber,
+                P_chamber=P_chamber,
                 mdot_total=mdot_est,
-                mixture_ratio=getattr(self.injector_config, 'mixture_ratio', 2.3),
-                Cd=getattr(self.injector_config, 'discharge_coefficient', 0.65),
-                d_fuel=self.injector_config.fuel_orifice_diameter,
-                d_ox=self.injector_config.ox_orifice_diameter,
+                mixture_ratio=getattr(injector_config, 'mixture_ratio', 2.3),
+                Cd=getattr(injector_config, 'discharge_coefficient', 0.65),
+                d_fuel=injector_config.fuel_orifice_diameter,
+                d_ox=injector_config.ox_orifice_diameter,
             )
 
             # Compute combustion efficiency from injection quality
             # Chamber L* = V_chamber / A_throat (characteristic length)
-            chamber_volume = math.pi * (self.engine.chamber_diameter / 2) ** 2 * self.engine.chamber_length
-            L_star = chamber_volume / self.engine.throat_area if self.engine.throat_area > 0 else 1.0
+            L_star = engine.chamber_volume() / throat_area if throat_area > 0 else 1.0
             eta_cstar = combustion.combustion_efficiency(
                 atomization_quality=injector_result.get("atomization_quality", 0.5),
                 stability_margin=injector_result.get("stability_margin", 0.5),
@@ -103,60 +194,61 @@ class SimulationEngine:
 
         # Apply combustion efficiency: c*_actual = η_c* × c*_ideal
         c_star = c_star_ideal * eta_cstar
-        mdot = combustion.mass_flow_rate(self.P_chamber, self.engine.throat_area, c_star)
+        mdot = combustion.mass_flow_rate(P_chamber, throat_area, c_star)
 
         # Update injection result with actual mdot (small correction)
         if injector_result is not None and abs(mdot - mdot_est) / max(mdot, 1e-10) > 0.01:
             injector_result = compute_injection_physics(
                 layout=layout,
-                P_chamber=self.P_chamber,
+                P_chamber=P_chamber,
                 mdot_total=mdot,
-                mixture_ratio=getattr(self.injector_config, 'mixture_ratio', 2.3),
-                Cd=getattr(self.injector_config, 'discharge_coefficient', 0.65),
-                d_fuel=self.injector_config.fuel_orifice_diameter,
-                d_ox=self.injector_config.ox_orifice_diameter,
+                mixture_ratio=getattr(injector_config, 'mixture_ratio', 2.3),
+                Cd=getattr(injector_config, 'discharge_coefficient', 0.65),
+                d_fuel=injector_config.fuel_orifice_diameter,
+                d_ox=injector_config.ox_orifice_diameter,
             )
             injector_result["eta_cstar"] = float(eta_cstar)
             injector_result["L_star_m"] = float(L_star)
 
         # 2. Nozzle flow field
-        throat_r = self.engine.throat_diameter / 2
         flow = gas_dynamics.solve_nozzle_flow(
-            self._station_x, self._station_r_inner,
-            throat_r, self.gamma, R_spec,
-            self.P_chamber, self.T_chamber, self.P_ambient
+            station_x, station_r_inner,
+            self._throat_r, gamma, self._R_spec,
+            P_chamber, T_chamber, P_ambient,
+            dtype=self.dtype,
         )
 
         # 3. Exit conditions and thrust
-        M_exit = flow["mach"][-1]
-        P_exit = flow["pressure_Pa"][-1]
-        V_exit = flow["velocity_m_s"][-1]
+        # (as Python floats, so thrust and Isp are float64 whatever the dtype)
+        M_exit = float(flow["mach"][-1])
+        P_exit = float(flow["pressure_Pa"][-1])
+        V_exit = float(flow["velocity_m_s"][-1])
 
         thrust = gas_dynamics.compute_thrust(
-            mdot, V_exit, P_exit, self.P_ambient, self.engine.exit_area
+            mdot, V_exit, P_exit, P_ambient, self._exit_area
         )
         Isp = gas_dynamics.compute_specific_impulse(thrust, mdot)
 
-        Cf = thrust / (self.P_chamber * self.engine.throat_area) if self.engine.throat_area > 0 else 0
+        Cf = thrust / (P_chamber * throat_area) if throat_area > 0 else 0
 
         # 4. Heat transfer (without cooling first, to get h_gas and T_aw)
         ht = heat_transfer.compute_wall_temperatures(
-            self._station_x, self._station_r_inner,
+            station_x, station_r_inner,
             flow["mach"], flow["temperature_K"], flow["pressure_Pa"],
-            self.gamma, self.molecular_weight,
-            self.P_chamber, self.T_chamber, c_star,
-            self.engine.throat_area, self.engine.throat_diameter,
+            gamma, self.molecular_weight,
+            P_chamber, T_chamber, c_star,
+            throat_area, engine.throat_diameter,
             self._wall_thickness,
-            self.material.thermal_conductivity_W_mK
+            k_wall
         )
 
         # 5. Regenerative cooling (if enabled)
         cooling_result = None
         if self.cooling_enabled:
             cooling_result = compute_regen_cooling(
-                station_x=self._station_x,
-                station_r_inner=self._station_r_inner,
-                station_r_outer=self._station_r_outer,
+                station_x=station_x,
+                station_r_inner=station_r_inner,
+                station_r_outer=station_r_outer,
                 wall_thickness=self._wall_thickness,
                 h_gas=ht["h_gas_W_m2K"],
                 T_aw=ht["T_aw_K"],
@@ -165,7 +257,7 @@ class SimulationEngine:
                 coolant_inlet_temp=self.coolant_inlet_temp,
                 coolant_inlet_pressure=self.coolant_inlet_pressure,
                 coolant_type=self.coolant_type,
-                k_wall=self.material.thermal_conductivity_W_mK,
+                k_wall=k_wall,
             )
             # Use cooling-corrected wall temperatures
             ht["wall_temp_inner_K"] = cooling_result["T_wall_hot_K"]
@@ -173,44 +265,40 @@ class SimulationEngine:
             ht["max_wall_temp_K"] = cooling_result["max_wall_temp_K"]
 
         # 6. Effective structural properties (topology-inspired)
-        effective_r = None
-        if self.cooling_enabled:
-            effective_r = compute_effective_r_outer(
-                self._station_r_inner, self._station_r_outer,
-                self.cooling_geom.n_channels,
-                self.cooling_geom.channel_width,
-                self.cooling_geom.channel_height,
-                self.cooling_geom.rib_width,
-                self.rib_thickness_factor,
-            )
+        effective_r = self._effective_r() if self.cooling_enabled else None
 
         # 7. Structural analysis
         stress = structural.compute_structural_analysis(
-            self._station_r_inner, self._station_r_outer,
+            station_r_inner, station_r_outer,
             flow["pressure_Pa"],
             ht["wall_temp_inner_K"], ht["wall_temp_outer_K"],
-            self.material.yield_strength_Pa,
-            self.material.elastic_modulus_Pa,
-            self.material.thermal_expansion_coeff_per_K,
-            self.material.poissons_ratio,
+            material.yield_strength_Pa,
+            material.elastic_modulus_Pa,
+            material.thermal_expansion_coeff_per_K,
+            material.poissons_ratio,
             effective_r_outer=effective_r,
         )
 
-        # 8. Mass
-        total_mass = self.engine.total_mass(self.material.density_kg_m3)
+        # 8. Mass (depends only on geometry and material, so kept between ticks)
+        if self._total_mass is None:
+            self._total_mass = engine.total_mass(material.density_kg_m3, self._profile)
+        total_mass = self._total_mass
 
         # 9. Warnings
-        warnings = []
-        thermal_margin = ht["max_wall_temp_K"] / self.material.melting_point_K
-        if thermal_margin > 0.8:
-            pct = thermal_margin * 100
-            warnings.append(f"Wall temperature reaches {pct:.0f}% of melting point ({self.material.melting_point_K} K)")
-        if thermal_margin > 1.0:
-            warnings.append("CRITICAL: Wall temperature EXCEEDS melting point - structural failure")
-        if stress["min_safety_factor"] < 1.5:
-            warnings.append(f"Low safety factor: {stress['min_safety_factor']:.2f} at station {stress['min_sf_station_index']}")
-        if stress["min_safety_factor"] < 1.0:
-            warnings.append("CRITICAL: Safety factor below 1.0 - structural yielding")
+        # (message templates are only formatted for the checks that fire)
+        thermal_margin = ht["max_wall_temp_K"] / material.melting_point_K
+        sf_min = stress["min_safety_factor"]
+        checks = (
+            (thermal_margin > 0.8, "Wall temperature reaches {pct:.0f}% of melting point ({melt} K)"),
+            (thermal_margin > 1.0, "CRITICAL: Wall temperature EXCEEDS melting point - structural failure"),
+            (sf_min < 1.5, "Low safety factor: {sf:.2f} at station {station}"),
+            (sf_min < 1.0, "CRITICAL: Safety factor below 1.0 - structural yielding"),
+        )
+        warnings = [
+            template.format(pct=thermal_margin * 100, melt=material.melting_point_K,
+                            sf=sf_min, station=stress["min_sf_station_index"])
+            for hit, template in checks if hit
+        ]
 
         result = {
             "performance": {
@@ -227,34 +315,37 @@ class SimulationEngine:
                 "total_mass_kg": float(total_mass),
                 "thrust_to_weight": float(thrust / (total_mass * G0)) if total_mass > 0 else 0,
             },
-            "stations": {
-                "x": self._station_x.tolist(),
-                "r_inner": self._station_r_inner.tolist(),
-                "r_outer": self._station_r_outer.tolist(),
-                "wall_thickness": self._wall_thickness.tolist(),
-                "area_ratio": flow["area_ratio"].tolist(),
-                "mach": flow["mach"].tolist(),
-                "pressure_Pa": flow["pressure_Pa"].tolist(),
-                "temperature_K": flow["temperature_K"].tolist(),
-                "velocity_m_s": flow["velocity_m_s"].tolist(),
-                "heat_flux_W_m2": ht["heat_flux_W_m2"].tolist(),
-                "wall_temp_inner_K": ht["wall_temp_inner_K"].tolist(),
-                "wall_temp_outer_K": ht["wall_temp_outer_K"].tolist(),
-                "von_mises_stress_MPa": stress["von_mises_MPa"].tolist(),
-                "safety_factor": stress["safety_factor"].tolist(),
-            },
-            "structural_summary": {
+        }
+        if "stations" in fields:
+            result["stations"] = {
+                "x": station_x,
+                "r_inner": station_r_inner,
+                "r_outer": station_r_outer,
+                "wall_thickness": self._wall_thickness,
+                "area_ratio": flow["area_ratio"],
+                "mach": flow["mach"],
+                "pressure_Pa": flow["pressure_Pa"],
+                "temperature_K": flow["temperature_K"],
+                "velocity_m_s": flow["velocity_m_s"],
+                "heat_flux_W_m2": ht["heat_flux_W_m2"],
+                "wall_temp_inner_K": ht["wall_temp_inner_K"],
+                "wall_temp_outer_K": ht["wall_temp_outer_K"],
+                "von_mises_stress_MPa": stress["von_mises_MPa"],
+                "safety_factor": stress["safety_factor"],
+            }
+        if "structural_summary" in fields:
+            result["structural_summary"] = {
                 "min_safety_factor": stress["min_safety_factor"],
                 "min_sf_station_index": stress["min_sf_station_index"],
                 "max_von_mises_MPa": stress["max_von_mises_MPa"],
                 "max_wall_temp_K": ht["max_wall_temp_K"],
                 "thermal_margin": float(thermal_margin),
-            },
-            "warnings": warnings,
-        }
+            }
+        if "warnings" in fields:
+            result["warnings"] = warnings
 
         # Add injector data if available
-        if injector_result is not None:
+        if injector_result is not None and "injector" in fields:
             result["injector"] = injector_result
             dp_f = injector_result.get("dP_fuel_ratio", 0)
             dp_o = injector_result.get("dP_ox_ratio", 0)
@@ -265,24 +356,46 @@ class SimulationEngine:
 
         # Add cooling data if available
         if cooling_result is not None:
+            result["performance"]["coolant_pressure_drop_Pa"] = cooling_result["coolant_pressure_drop_Pa"]
+        if cooling_result is not None and "cooling" in fields:
             result["cooling"] = {
-                "T_coolant_K": cooling_result["T_coolant_K"].tolist(),
-                "T_wall_hot_K": cooling_result["T_wall_hot_K"].tolist(),
-                "T_wall_cold_K": cooling_result["T_wall_cold_K"].tolist(),
-                "h_coolant_W_m2K": cooling_result["h_coolant_W_m2K"].tolist(),
-                "heat_flux_W_m2": cooling_result["heat_flux_W_m2"].tolist(),
-                "coolant_velocity_m_s": cooling_result["coolant_velocity_m_s"].tolist(),
-                "coolant_pressure_Pa": cooling_result["coolant_pressure_Pa"].tolist(),
+                "T_coolant_K": cooling_result["T_coolant_K"],
+                "T_wall_hot_K": cooling_result["T_wall_hot_K"],
+                "T_wall_cold_K": cooling_result["T_wall_cold_K"],
+                "h_coolant_W_m2K": cooling_result["h_coolant_W_m2K"],
+                "heat_flux_W_m2": cooling_result["heat_flux_W_m2"],
+                "coolant_velocity_m_s": cooling_result["coolant_velocity_m_s"],
+                "coolant_pressure_Pa": cooling_result["coolant_pressure_Pa"],
                 "coolant_pressure_drop_Pa": cooling_result["coolant_pressure_drop_Pa"],
                 "max_wall_temp_K": cooling_result["max_wall_temp_K"],
                 "coolant_exit_temp_K": cooling_result["coolant_exit_temp_K"],
                 "max_coolant_temp_K": cooling_result["max_coolant_temp_K"],
-                "channel_height_profile": cooling_result["channel_height_profile"].tolist(),
+                "channel_height_profile": cooling_result["channel_height_profile"],
             }
-            result["performance"]["coolant_pressure_drop_Pa"] = cooling_result["coolant_pressure_drop_Pa"]
 
         return result
 
+    def run_many(self, configs) -> dict[str, np.ndarray]:
+        """Run one tick per entry of configs, a sequence of update_config() keyword dicts.
+
+        Samples are applied in order to a shallow copy of this engine, so the
+        live configuration is left as it was. update_config() rebinds rather
+        than mutates, so the copy starts from this engine's caches and
+        everything cached on settings a sample leaves alone (station profile,
+        effective outer radius, wall mass, gas constants) is shared across
+        the sweep. Returns the performance and structural summary scalars as
+        arrays with one entry per sample; a value missing from a sample
+        (e.g. coolant pressure drop without cooling) is NaN.
+        """
+        sweep = copy.copy(self)
+        rows = []
+        for config in configs:
+            sweep.update_config(**config)
+            result = sweep.run_tick(fields=SUMMARY_FIELDS)
+            rows.append({**result["performance"], **result["structural_summary"]})
+        keys = dict.fromkeys(key for row in rows for key in row)
+        return {key: np.array([row.get(key, np.nan) for row in rows]) for key in keys}
+
     def update_config(self, engine: ParametricEngine = None,
                       material: MaterialProperties = None,
                       gamma: float = None, molecular_weight: float = None,
@@ -296,21 +409,24 @@ class SimulationEngine:
                       rib_thickness_factor: float = None,
                       injector_config=None):
         """Hot-update simulation parameters."""
+        # New objects equal to the current ones (UIs re-send whole configs)
+        # keep the caches built from them
         if engine is not None:
-            self.engine = engine
-            self._profile = engine.generate_profile()
-            self._station_x = self._profile[:, 0]
-            self._station_r_inner = self._profile[:, 1]
-            self._station_r_outer = self._profile[:, 2]
-            self._wall_thickness = self._station_r_outer - self._station_r_inner
+            if tuple(engine.to_genome()) == self._engine_key:
+                self.engine = engine
+            else:
+                self._set_engine(engine)
         if material is not None:
             self.material = material
+            self._total_mass = None
         if gamma is not None:
             self.gamma = gamma
         if molecular_weight is not None:
             self.molecular_weight = molecular_weight
         if chamber_temperature_K is not None:
             self.T_chamber = chamber_temperature_K
+        if gamma is not None or molecular_weight is not None or chamber_temperature_K is not None:
+            self._set_gas_constants()
         if chamber_pressure_Pa is not None:
             self.P_chamber = chamber_pressure_Pa
         if ambient_pressure_Pa is not None:
@@ -318,6 +434,8 @@ class SimulationEngine:
         if cooling_enabled is not None:
             self.cooling_enabled = cooling_enabled
         if cooling_channel_geom is not None:
+            if cooling_channel_geom != self.cooling_geom:
+                self._effective_r_outer = None
             self.cooling_geom = cooling_channel_geom
         if coolant_mdot is not None:
             self.coolant_mdot = coolant_mdot
@@ -325,5 +443,6 @@ class SimulationEngine:
             self.coolant_type = coolant_type
         if rib_thickness_factor is not None:
             self.rib_thickness_factor = rib_thickness_factor
+            self._effective_r_outer = None
         if injector_config is not None:
             self.injector_config = injector_config
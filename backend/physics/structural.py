@@ -71,45 +71,64 @@ def compute_structural_analysis(station_r_inner: np.ndarray,
     hoop_stress_MPa, thermal_stress_MPa,
     and scalars: min_safety_factor, max_von_mises_MPa.
     """
-    n = len(station_r_inner)
-    r_outer_for_stress = effective_r_outer if effective_r_outer is not None else station_r_outer
-
-    vm_stress = np.zeros(n)
-    sf = np.zeros(n)
-    hoop = np.zeros(n)
-    thermal = np.zeros(n)
-
-    for i in range(n):
-        r_i = station_r_inner[i]
-        r_o = r_outer_for_stress[i]
-        P = pressure_Pa[i]
-        delta_T = wall_temp_inner_K[i] - wall_temp_outer_K[i]
-        
-        # Pressure stresses
-        s_theta_p = hoop_stress_thick_wall(P, r_i, r_o)
-        s_r = radial_stress_inner(P)
-        s_z = axial_stress_closed_end(P, r_i, r_o)
-        
-        # Thermal stress
-        s_theta_t = thermal_hoop_stress(thermal_expansion, elastic_modulus_Pa,
-                                         poissons_ratio, delta_T)
-        
-        # Combined
-        s_theta_total = s_theta_p + s_theta_t
-        
-        vm = von_mises_stress(s_r, s_theta_total, s_z)
-        
-        vm_stress[i] = vm
-        sf[i] = safety_factor(vm, yield_strength_Pa)
-        hoop[i] = s_theta_p
-        thermal[i] = s_theta_t
-    
+    r_i = np.asarray(station_r_inner, dtype=float)
+    r_o = np.asarray(effective_r_outer if effective_r_outer is not None else station_r_outer,
+                     dtype=float)
+    P = np.asarray(pressure_Pa, dtype=float)
+    delta_T = np.asarray(wall_temp_inner_K, dtype=float) - np.asarray(wall_temp_outer_K, dtype=float)
+
+    # Pressure stresses at every station (hoop_stress_thick_wall(),
+    # radial_stress_inner(), axial_stress_closed_end()); stations without
+    # wall (r_o <= r_i) are masked out of the divides and stay 0. Each
+    # expression writes into an existing buffer instead of a new temporary
+    ri2 = r_i * r_i
+    ro2 = r_o * r_o
+    wall = r_o > r_i
+    denom = ro2 - ri2
+    tmp = ro2 + ri2
+    tmp *= P
+    hoop = np.zeros_like(tmp)
+    np.divide(tmp, denom, out=hoop, where=wall)
+    s_r = np.negative(P)
+    np.multiply(P, ri2, out=tmp)
+    s_z = np.zeros_like(tmp)
+    np.divide(tmp, denom, out=s_z, where=wall)
+
+    # Thermal stress (thermal_hoop_stress())
+    thermal = delta_T
+    if (1 - poissons_ratio) == 0:
+        thermal[:] = 0.0
+    else:
+        thermal *= -thermal_expansion * elastic_modulus_Pa
+        thermal /= 2 * (1 - poissons_ratio)
+
+    # Combined (von_mises_stress(), safety_factor())
+    s_theta_total = np.add(hoop, thermal, out=ro2)
+    vm_stress = np.subtract(s_r, s_theta_total, out=ri2)
+    vm_stress *= vm_stress
+    np.subtract(s_theta_total, s_z, out=tmp)
+    tmp *= tmp
+    vm_stress += tmp
+    np.subtract(s_z, s_r, out=tmp)
+    tmp *= tmp
+    vm_stress += tmp
+    vm_stress *= 0.5
+    np.sqrt(vm_stress, out=vm_stress)
+    sf = np.full_like(vm_stress, 99.0)
+    np.divide(yield_strength_Pa, vm_stress, out=sf, where=vm_stress > 0)
+
+    # Pa -> MPa in place; no Pa copies are kept past this point
+    vm_stress /= 1e6
+    hoop /= 1e6
+    thermal /= 1e6
+    i_min = int(np.argmin(sf))
+
     return {
-        "von_mises_MPa": vm_stress / 1e6,
+        "von_mises_MPa": vm_stress,
         "safety_factor": sf,
-        "hoop_stress_MPa": hoop / 1e6,
-        "thermal_stress_MPa": thermal / 1e6,
-        "min_safety_factor": float(np.min(sf)),
-        "min_sf_station_index": int(np.argmin(sf)),
-        "max_von_mises_MPa": float(np.max(vm_stress) / 1e6),
+        "hoop_stress_MPa": hoop,
+        "thermal_stress_MPa": thermal,
+        "min_safety_factor": float(sf[i_min]),
+        "min_sf_station_index": i_min,
+        "max_von_mises_MPa": float(np.max(vm_stress)),
     }
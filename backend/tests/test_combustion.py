@@ -0,0 +1,27 @@
+"""Tests for the combustion chamber performance functions."""
+
+import numpy as np
+from backend.physics.combustion import compute_chamber_performance, compute_chamber_performance_batch
+
+
+def test_batch_performance_matches_scalar_loop():
+    gamma, P_chamber, eps = np.meshgrid(
+        [1.12, 1.2, 1.25, 1.33, 1.4],
+        [5e5, 3e6, 1e7],
+        [1.5, 4.0, 8.0, 25.0, 80.0],
+        indexing="ij",
+    )
+    molecular_weight, T_chamber, A_throat, P_ambient = 0.022, 3400.0, 7.0e-4, 101325.0
+
+    batch = compute_chamber_performance_batch(
+        gamma, molecular_weight, T_chamber, P_chamber, A_throat, eps, P_ambient,
+    )
+    for idx in np.ndindex(gamma.shape):
+        scalar = compute_chamber_performance(
+            float(gamma[idx]), molecular_weight, T_chamber, float(P_chamber[idx]),
+            A_throat, float(eps[idx]), P_ambient,
+        )
+        assert batch.keys() == scalar.keys()
+        for key, value in scalar.items():
+            assert batch[key].shape == gamma.shape
+            np.testing.assert_allclose(batch[key][idx], value, rtol=1e-8, err_msg=f"{key} at {idx}")
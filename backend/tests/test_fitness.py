@@ -0,0 +1,126 @@
+"""Regression tests for FitnessEvaluator.evaluate_batch()."""
+
+import copy
+import math
+import numpy as np
+import pytest
+from backend.api.schemas import InjectorConfig
+from backend.config import G0
+from backend.evolution.fitness import FitnessEvaluator
+from backend.evolution.population import initialize_population_lhs
+from backend.materials.database import get_material
+from backend.physics.combustion import specific_gas_constant, characteristic_velocity
+
+WEIGHTS = {
+    "thrust_to_weight": 1.0, "thermal_survival": 2.0, "efficiency": 1.5,
+    "structural_integrity": 1.0, "cost_efficiency": 0.5,
+    "cooling_effectiveness": 1.0, "coolant_pressure_drop": 0.5, "injection_quality": 1.0,
+}
+FAILED = {"total": 0.0, "scores": dict.fromkeys(WEIGHTS, 0.0), "performance": {}}
+
+
+def _make_evaluator(injector: bool) -> FitnessEvaluator:
+    return FitnessEvaluator(
+        WEIGHTS, get_material("inconel_718"), gamma=1.22, molecular_weight=0.022,
+        chamber_temperature_K=3400.0, chamber_pressure_Pa=3e6,
+        injector_config=InjectorConfig(enabled=injector),
+    )
+
+
+def _scalar_evaluate(evaluator: FitnessEvaluator, genome) -> dict:
+    """Per-genome scoring as evaluate() did it before evaluate_batch() existed."""
+    try:
+        result = evaluator._simulate(genome)
+    except Exception:
+        return copy.deepcopy(FAILED)
+    perf = result["performance"]
+    struct = result["structural_summary"]
+    cooling = result.get("cooling", {})
+    material = evaluator.material
+
+    score_tw = min(perf.get("thrust_to_weight", 0) / 100.0, 1.0)
+    score_thermal = max(0.0, 1.0 - struct.get("thermal_margin", 1.0))
+    R_spec = specific_gas_constant(evaluator.molecular_weight)
+    c_star = characteristic_velocity(evaluator.gamma, R_spec, evaluator.T_chamber)
+    Isp_max = c_star / G0 * 1.8
+    score_efficiency = min(perf.get("specific_impulse_s", 0) / max(Isp_max, 1), 1.0)
+    score_structural = min(struct.get("min_safety_factor", 0) / 2.0, 1.0)
+    score_cost = max(0, 1.0 - material.cost_per_kg_usd * perf.get("total_mass_kg", 1) / 500.0)
+    score_cooling = 0.5
+    score_pressure_drop = 0.5
+    if cooling:
+        max_wall_T = cooling.get("max_wall_temp_K", evaluator.T_chamber)
+        score_cooling = max(0.0, 1.0 - max_wall_T / material.melting_point_K)
+        dp = cooling.get("coolant_pressure_drop_Pa", 0)
+        score_pressure_drop = max(0.0, 1.0 - dp / 3_000_000.0)
+    score_injection = 0.5
+    injector_data = result.get("injector", {})
+    if injector_data:
+        atom = injector_data.get("atomization_quality", 0.5)
+        stab = injector_data.get("stability_margin", 0.5)
+        mom = injector_data.get("momentum_ratio", 1.0)
+        mom_score = max(0.0, 1.0 - abs(mom - 1.0))
+        score_injection = 0.4 * atom + 0.4 * stab + 0.2 * mom_score
+
+    scores = {
+        "thrust_to_weight": score_tw,
+        "thermal_survival": score_thermal,
+        "efficiency": score_efficiency,
+        "structural_integrity": score_structural,
+        "cost_efficiency": score_cost,
+        "cooling_effectiveness": score_cooling,
+        "coolant_pressure_drop": score_pressure_drop,
+        "injection_quality": score_injection,
+    }
+    total = sum(evaluator.weights.get(k, 0) * v for k, v in scores.items())
+    total /= sum(evaluator.weights.values())
+    return {"total": total, "scores": scores, "performance": perf}
+
+
+def _assert_same(batch: dict, scalar: dict):
+    np.testing.assert_allclose(batch["total"], scalar["total"], rtol=1e-12, atol=1e-15)
+    assert batch["scores"].keys() == scalar["scores"].keys()
+    for key, value in scalar["scores"].items():
+        np.testing.assert_allclose(batch["scores"][key], value, rtol=1e-12, atol=1e-15, err_msg=key)
+    assert batch["performance"] == scalar["performance"]
+
+
+def _genomes():
+    genomes = [list(g) for g in initialize_population_lhs(6)]
+    fails = list(genomes[0])
+    fails[2] = -0.03                 # negative throat diameter: the sim raises
+    non_finite = list(genomes[1])
+    non_finite[5] = math.nan
+    return genomes + [fails, non_finite]
+
+
+@pytest.mark.parametrize("injector", [False, True])
+def test_evaluate_batch_matches_scalar_scoring(injector):
+    evaluator = _make_evaluator(injector)
+    genomes = _genomes()
+    batch = evaluator.evaluate_batch(genomes)
+
+    assert len(batch) == len(genomes)
+    for genome, result in zip(genomes[:-1], batch):
+        _assert_same(result, _scalar_evaluate(evaluator, genome))
+    assert batch[-2] == FAILED
+    assert batch[-1] == FAILED
+    assert evaluator.evaluate(genomes[0]) == batch[0]
+
+
+def test_evaluate_batch_nan_metrics_match_scalar_scoring(monkeypatch):
+    evaluator = _make_evaluator(injector=True)
+    simulate = evaluator._simulate
+
+    def simulate_with_nans(genome):
+        result = simulate(genome)
+        result["structural_summary"]["thermal_margin"] = math.nan
+        result["performance"]["total_mass_kg"] = math.nan
+        result["cooling"]["max_wall_temp_K"] = math.nan
+        result["injector"]["momentum_ratio"] = math.nan
+        return result
+
+    monkeypatch.setattr(evaluator, "_simulate", simulate_with_nans)
+    genomes = [list(g) for g in initialize_population_lhs(3)]
+    for genome, result in zip(genomes, evaluator.evaluate_batch(genomes)):
+        _assert_same(result, _scalar_evaluate(evaluator, genome))
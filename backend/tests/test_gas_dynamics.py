@@ -0,0 +1,48 @@
+"""Tests for the area-Mach solvers against a brentq reference."""
+
+import math
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+from backend.physics.gas_dynamics import (
+    area_mach_function, area_mach_relation, area_mach_relation_batch,
+)
+
+AREA_RATIOS = np.concatenate([1.0 + np.geomspace(1e-4, 0.1, 12), np.geomspace(1.1, 80.0, 25)])
+GAMMAS = np.linspace(1.1, 1.7, 7)
+
+
+def _reference_mach(area_ratio: float, gamma: float, supersonic: bool) -> float:
+    """Root of ln(A/A*)(M) = ln(area_ratio) on the requested branch, via brentq."""
+    def f(M):
+        return 0.5 * math.log(area_mach_function(M, gamma)) - math.log(area_ratio)
+
+    lo, hi = (1.0, 1e3) if supersonic else (1e-9, 1.0)
+    return brentq(f, lo, hi, xtol=1e-15, rtol=1e-15, maxiter=500)
+
+
+@pytest.mark.parametrize("supersonic", [False, True])
+def test_batch_matches_brentq(supersonic):
+    ar, g = np.meshgrid(AREA_RATIOS, GAMMAS, indexing="ij")
+    mach = area_mach_relation_batch(ar, g, supersonic=supersonic)
+    expected = np.vectorize(_reference_mach)(ar, g, supersonic)
+    np.testing.assert_allclose(mach, expected, rtol=1e-9)
+    assert np.all(mach > 1.0) if supersonic else np.all(mach < 1.0)
+
+
+@pytest.mark.parametrize("supersonic", [False, True])
+def test_scalar_matches_brentq(supersonic):
+    for area_ratio in AREA_RATIOS:
+        for gamma in GAMMAS:
+            mach = area_mach_relation(float(area_ratio), float(gamma), supersonic)
+            expected = _reference_mach(float(area_ratio), float(gamma), supersonic)
+            assert mach == pytest.approx(expected, rel=1e-9), (area_ratio, gamma)
+            assert mach > 1.0 if supersonic else mach < 1.0
+
+
+def test_batch_sonic_point_and_clamping():
+    # A/A* <= 1 is clamped to the sonic point on both branches
+    for supersonic in (False, True):
+        mach = area_mach_relation_batch(np.array([0.5, 1.0, 2.0]), 1.2, supersonic=supersonic)
+        assert mach[0] == mach[1] == 1.0
+        assert (mach[2] > 1.0) == supersonic
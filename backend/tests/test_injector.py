@@ -0,0 +1,113 @@
+"""Tests for injector layout generation and injection physics."""
+
+import math
+import numpy as np
+import pytest
+from backend.api.schemas import InjectorConfig
+from backend.geometry.injector import (
+    generate_injector_layout, compute_injection_physics, compute_injection_physics_batch,
+)
+
+
+def _reference_orifices(config, face_radius):
+    """(y, z, radius, is_fuel, ring, element) per orifice, placed one at a time as before vectorization."""
+    r_fuel = config.fuel_orifice_diameter / 2.0
+    r_ox = config.ox_orifice_diameter / 2.0
+    radial_offset = 1.5 * max(config.fuel_orifice_diameter, config.ox_orifice_diameter)
+    edge_margin = max(r_fuel, r_ox) + 0.0003
+    orifices = []
+    for k in range(config.n_rings):
+        r_ring = (config.first_ring_fraction + k * config.ring_spacing_fraction) * face_radius
+        r_ring = min(r_ring, face_radius - edge_margin)
+        if r_ring < edge_margin:
+            continue
+        n_elem = config.elements_per_ring_base * (k + 1)
+        angular_offset = (math.pi / n_elem) if (k % 2 == 1) else 0.0
+        for j in range(n_elem):
+            theta = 2.0 * math.pi * j / n_elem + angular_offset
+            r_ox_pos = max(r_ring - radial_offset, edge_margin)
+            for r, radius, is_fuel in ((r_ring, r_fuel, True), (r_ox_pos, r_ox, False)):
+                if r + radius <= face_radius:
+                    orifices.append((r * math.cos(theta), r * math.sin(theta), radius, is_fuel, k, j))
+    return orifices
+
+
+@pytest.mark.parametrize("n_rings, face_radius, n_per_type, elements_per_ring", [
+    (1, 0.04, 6, [6]),
+    (3, 0.04, 36, [6, 12, 18]),
+    (10, 0.04, 330, [6, 12, 18, 24, 30, 36, 42, 48, 54, 60]),
+    # First ring falls inside the edge margin and is dropped
+    (3, 0.003, 30, [12, 18]),
+    (10, 0.003, 324, [12, 18, 24, 30, 36, 42, 48, 54, 60]),
+])
+def test_layout_matches_reference(n_rings, face_radius, n_per_type, elements_per_ring):
+    config = InjectorConfig(n_rings=n_rings)
+    layout = generate_injector_layout(config, 0.01, face_radius)
+
+    assert layout.n_fuel == layout.n_ox == n_per_type
+    assert layout.n_orifices == 2 * n_per_type
+    assert layout.elements_per_ring == elements_per_ring
+    assert layout.n_rings == n_rings
+    assert layout.face_x == 0.01 and layout.face_radius == face_radius
+    assert layout.total_fuel_area_m2 == pytest.approx(n_per_type * math.pi * 0.0005 ** 2, rel=1e-12)
+    assert layout.total_ox_area_m2 == pytest.approx(n_per_type * math.pi * 0.0006 ** 2, rel=1e-12)
+
+    y, z, radius, is_fuel, ring, element = zip(*_reference_orifices(config, face_radius))
+    np.testing.assert_allclose(layout.y, y, rtol=0, atol=1e-15)
+    np.testing.assert_allclose(layout.z, z, rtol=0, atol=1e-15)
+    np.testing.assert_array_equal(layout.radius, radius)
+    np.testing.assert_array_equal(layout.is_fuel, is_fuel)
+    np.testing.assert_array_equal(layout.ring_index, ring)
+    np.testing.assert_array_equal(layout.element_index, element)
+    assert layout.ring_index.dtype == layout.element_index.dtype == np.int32
+
+
+def test_single_ring_positions():
+    layout = generate_injector_layout(InjectorConfig(n_rings=1), 0.0, 0.04)
+    # Element 0: fuel at 0.25 * face radius on the y axis, ox 1.5 ox diameters inward
+    np.testing.assert_allclose(layout.y[:2], [0.01, 0.01 - 0.0018], rtol=1e-12)
+    np.testing.assert_allclose(layout.z[:2], [0.0, 0.0], atol=1e-18)
+    # Six elements 60 degrees apart, all fuel holes on the ring
+    np.testing.assert_allclose(np.hypot(layout.y[::2], layout.z[::2]), 0.01, rtol=1e-12)
+    np.testing.assert_allclose(np.degrees(np.arctan2(layout.z[::2], layout.y[::2])) % 360,
+                               [0, 60, 120, 180, 240, 300], atol=1e-9)
+    np.testing.assert_array_equal(layout.element_index, np.repeat(np.arange(6), 2))
+
+
+def test_batch_physics_matches_scalar():
+    rng = np.random.default_rng(0)
+    layouts = [
+        generate_injector_layout(InjectorConfig(n_rings=n, elements_per_ring_base=b), 0.0, 0.04)
+        for n, b in [(1, 3), (2, 6), (3, 8), (5, 12), (10, 24)]
+    ]
+    n = len(layouts)
+    P_chamber = rng.uniform(1e6, 1e7, n)
+    mdot_total = rng.uniform(0.1, 20.0, n)
+    mixture_ratio = rng.uniform(1.0, 4.0, n)
+    Cd = rng.uniform(0.4, 0.9, n)
+    d_fuel = rng.uniform(0.0005, 0.005, n)
+    d_ox = rng.uniform(0.0005, 0.006, n)
+
+    for fuel_type, ox_type in [("rp1", "lox"), ("lch4", "lox"), ("lh2", "lox")]:
+        batch = compute_injection_physics_batch(
+            layouts, P_chamber, mdot_total, mixture_ratio, Cd,
+            fuel_type, ox_type, d_fuel, d_ox,
+        )
+        for i, layout in enumerate(layouts):
+            scalar = compute_injection_physics(
+                layout, float(P_chamber[i]), float(mdot_total[i]), float(mixture_ratio[i]),
+                float(Cd[i]), fuel_type, ox_type, float(d_fuel[i]), float(d_ox[i]),
+            )
+            assert batch.keys() == scalar.keys()
+            for key, value in scalar.items():
+                assert batch[key].shape == (n,)
+                np.testing.assert_allclose(batch[key][i], value, rtol=1e-12, err_msg=key)
+
+
+def test_batch_physics_broadcasts_scalar_arguments():
+    layouts = [generate_injector_layout(InjectorConfig(n_rings=n), 0.0, 0.05) for n in (1, 4)]
+    batch = compute_injection_physics_batch(layouts, 3e6, 2.0)
+    for i, layout in enumerate(layouts):
+        scalar = compute_injection_physics(layout, 3e6, 2.0)
+        for key, value in scalar.items():
+            np.testing.assert_allclose(batch[key][i], value, rtol=1e-12, err_msg=key)
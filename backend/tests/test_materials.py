@@ -0,0 +1,20 @@
+"""Tests for the material database."""
+
+from backend.materials.database import MaterialDatabase
+
+
+def test_listings_are_independent_copies():
+    db = MaterialDatabase()
+    for listing in (db.list_full, db.list_all):
+        first = listing()
+        expected = [dict(d) for d in first]
+        first[0]["name"] = "changed"
+        first[0].clear()
+        first.pop()
+        assert listing() == expected
+
+
+def test_list_full_matches_materials():
+    db = MaterialDatabase()
+    for entry in db.list_full():
+        assert db.get(entry["id"]).as_dict() == entry
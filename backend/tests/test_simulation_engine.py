@@ -0,0 +1,91 @@
+"""Tests for SimulationEngine: run_many() sweeps and the run_tick() memo."""
+
+import numpy as np
+from backend.geometry.parametric_engine import ParametricEngine
+from backend.materials.database import get_material
+from backend.physics.simulation_engine import SimulationEngine, SUMMARY_FIELDS
+
+
+def _make_engine() -> SimulationEngine:
+    return SimulationEngine(engine=ParametricEngine(), material=get_material("copper_c10200"))
+
+
+def test_run_many_matches_single_ticks():
+    configs = [
+        {"chamber_pressure_Pa": 2_000_000.0},
+        {"chamber_pressure_Pa": 4_000_000.0, "material": get_material("inconel_718")},
+        {"engine": ParametricEngine(throat_diameter=0.025)},
+    ]
+    sweep = _make_engine().run_many(configs)
+
+    reference = _make_engine()
+    for i, config in enumerate(configs):
+        reference.update_config(**config)
+        perf = reference.run_tick()["performance"]
+        assert sweep["thrust_N"][i] == perf["thrust_N"]
+        assert sweep["specific_impulse_s"][i] == perf["specific_impulse_s"]
+
+
+def test_run_many_leaves_live_config_unchanged():
+    sim = _make_engine()
+    engine, material = sim.engine, sim.material
+    before = sim.run_tick()
+
+    sim.run_many([
+        {"chamber_pressure_Pa": 5_000_000.0, "cooling_enabled": False},
+        {"engine": ParametricEngine(chamber_diameter=0.1), "material": get_material("inconel_718")},
+    ])
+
+    assert sim.engine is engine
+    assert sim.material is material
+    assert sim.P_chamber == 3_000_000.0
+    assert sim.cooling_enabled
+    after = sim.run_tick()
+    assert after["performance"] == before["performance"]
+    assert after["structural_summary"] == before["structural_summary"]
+    np.testing.assert_array_equal(after["stations"]["x"], before["stations"]["x"])
+
+
+def test_run_tick_memo_reuses_result_for_same_config():
+    sim = _make_engine()
+    first = sim.run_tick()
+    assert sim.run_tick() is first
+    # Equal objects re-sent by a UI keep the memo
+    sim.update_config(engine=sim.engine.with_params(throat_diameter=sim.engine.throat_diameter),
+                      chamber_pressure_Pa=sim.P_chamber)
+    assert sim.run_tick() is first
+    # Different fields are a different result
+    assert sim.run_tick(fields=SUMMARY_FIELDS) is not first
+
+
+def test_run_tick_memo_invalidated_by_config_changes():
+    sim = _make_engine()
+    base = sim.run_tick()
+
+    sim.update_config(chamber_pressure_Pa=4_000_000.0)
+    pressure = sim.run_tick()
+    assert pressure is not base
+    assert pressure["performance"]["thrust_N"] != base["performance"]["thrust_N"]
+
+    sim.update_config(engine=sim.engine.with_params(throat_diameter=0.025))
+    shape = sim.run_tick()
+    assert shape is not pressure
+    assert shape["performance"]["thrust_N"] != pressure["performance"]["thrust_N"]
+    assert not np.array_equal(shape["stations"]["r_inner"], pressure["stations"]["r_inner"])
+
+    sim.update_config(engine=sim.engine.with_params(wt_cp2=0.006))
+    thickness = sim.run_tick()
+    assert thickness is not shape
+    assert not np.array_equal(thickness["stations"]["r_outer"], shape["stations"]["r_outer"])
+
+    sim.update_config(material=get_material("inconel_718"))
+    material = sim.run_tick()
+    assert material is not thickness
+    assert material["performance"]["total_mass_kg"] != thickness["performance"]["total_mass_kg"]
+
+    # Back to the first config: recomputed, with the same values
+    sim.update_config(engine=ParametricEngine(), material=get_material("copper_c10200"),
+                      chamber_pressure_Pa=3_000_000.0)
+    again = sim.run_tick()
+    assert again is not base
+    assert again["performance"] == base["performance"]
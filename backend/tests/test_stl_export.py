@@ -0,0 +1,33 @@
+"""Tests for binary STL export."""
+
+from fastapi.testclient import TestClient
+from backend.geometry.parametric_engine import ParametricEngine
+from backend.geometry.stl_export import build_stl_records, generate_stl, iter_stl_chunks, stl_size
+from backend.main import app
+
+
+def test_chunks_join_to_generate_stl():
+    engine = ParametricEngine()
+    records = build_stl_records(engine, n_circ=32)
+    chunks = list(iter_stl_chunks(records, chunk_bytes=1000))
+    data = b"".join(chunks)
+    assert len(chunks) > 2
+    assert data == generate_stl(engine, n_circ=32)
+    assert len(data) == stl_size(records) == 84 + 50 * records.size
+
+
+def test_export_route_sets_exact_content_length():
+    response = TestClient(app).post("/api/export/stl", json={"resolution": 32})
+    assert response.status_code == 200
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert response.content == generate_stl(ParametricEngine(), n_circ=32)
+
+
+def test_export_route_geometry_error_is_500(monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError("bad geometry")
+
+    monkeypatch.setattr("backend.geometry.stl_export._build_triangles", fail)
+    client = TestClient(app, raise_server_exceptions=False)
+    response = client.post("/api/export/stl", json={"resolution": 32})
+    assert response.status_code == 500
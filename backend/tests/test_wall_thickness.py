@@ -0,0 +1,33 @@
+"""Tests for wall thickness interpolation."""
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+from backend.geometry.wall_thickness import WALL_THICKNESS_POSITIONS, interpolate_wall_thickness
+
+
+def test_matches_direct_cubic_spline():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        controls = rng.uniform(0.0005, 0.012, len(WALL_THICKNESS_POSITIONS))
+        x0, length = rng.uniform(-0.1, 0.1), rng.uniform(0.05, 0.5)
+        station_x = np.sort(rng.uniform(x0, x0 + length, 200))
+        station_x[[0, -1]] = x0, x0 + length
+
+        x_norm = (station_x - x0) / length
+        spline = CubicSpline(WALL_THICKNESS_POSITIONS, controls, bc_type='natural')
+        expected = np.clip(spline(x_norm), 0.0005, 0.015)
+
+        result = interpolate_wall_thickness(list(controls), station_x)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_hits_control_points_and_clamps():
+    station_x = np.linspace(0.0, 0.3, 6)
+    controls = [0.003, 0.0001, 0.004, 0.02, 0.005, 0.006]
+    result = interpolate_wall_thickness(controls, station_x)
+    np.testing.assert_allclose(result, np.clip(controls, 0.0005, 0.015), rtol=1e-12)
+
+
+def test_degenerate_span_returns_first_control():
+    station_x = np.zeros(4)
+    np.testing.assert_array_equal(interpolate_wall_thickness([0.004] + [0.001] * 5, station_x), 0.004)
@@ -11,6 +11,7 @@ export class WSClient {
         this.maxReconnectDelay = 30000;
         this.onStatusChange = null;
         this._shouldReconnect = true;
+        this._decoder = new TextDecoder();
     }
 
     connect() {
@@ -21,6 +22,7 @@ export class WSClient {
     _doConnect() {
         try {
             this.ws = new WebSocket(this.url);
+            this.ws.binaryType = 'arraybuffer';
         } catch (e) {
             this._scheduleReconnect();
             return;
@@ -42,13 +44,18 @@ export class WSClient {
 
         this.ws.onmessage = (event) => {
             try {
-                const msg = JSON.parse(event.data);
-                const type = msg.type;
-                const payload = msg.payload;
-                if (this.handlers[type]) {
-                    for (const cb of this.handlers[type]) {
-                        cb(payload);
+                // Server sends JSON as binary frames; accept text frames too
+                const text = typeof event.data === 'string'
+                    ? event.data
+                    : this._decoder.decode(event.data);
+                const msg = JSON.parse(text);
+                if (msg.type === 'sim_tick_batch') {
+                    // Coalesced ticks: replay each one in order as a sim_tick
+                    for (const tick of msg.payload) {
+                        this._dispatch('sim_tick', tick);
                     }
+                } else {
+                    this._dispatch(msg.type, msg.payload);
                 }
             } catch (e) {
                 console.error('WS message parse error:', e);
@@ -56,6 +63,14 @@ export class WSClient {
         };
     }
 
+    _dispatch(type, payload) {
+        if (this.handlers[type]) {
+            for (const cb of this.handlers[type]) {
+                cb(payload);
+            }
+        }
+    }
+
     _scheduleReconnect() {
         setTimeout(() => {
             if (this._shouldReconnect) {